@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the compilation of IN filters on the internet address advanced data type.
+
+    python scripts/benchmark_internet_address.py --ranges 10000 --ipv6
+"""
+
+import ipaddress
+import random
+import time
+
+import click
+from sqlalchemy import Column, Integer
+from sqlalchemy.dialects import postgresql
+
+from superset.advanced_data_type.plugins.internet_address import (
+    internet_address,
+    merge_ranges,
+)
+from superset.utils.core import FilterOperator
+
+
+def random_cidrs(count: int, ipv6: bool, seed: int) -> list[str]:
+    """
+    Generate CIDRs of random sizes, some of them overlapping or adjacent.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    # addresses are drawn from 10.0.0.0/8 or 2001:db8::/32
+    network = ipaddress.ip_network("2001:db8::/32" if ipv6 else "10.0.0.0/8")
+    cidrs = []
+    for _ in range(count):
+        prefix = rng.randint(network.max_prefixlen - 12, network.max_prefixlen)
+        address = int(network[0]) + rng.getrandbits(
+            network.max_prefixlen - network.prefixlen
+        )
+        cidrs.append(str(ipaddress.ip_network((address, prefix), strict=False)))
+    return cidrs
+
+
+def compile_filter(values: list[object], operator: FilterOperator) -> tuple[int, float]:
+    start = time.perf_counter()
+    clause = internet_address.translate_filter(Column("ip", Integer), operator, values)
+    sql = str(
+        clause.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    return len(sql), time.perf_counter() - start
+
+
+@click.command()
+@click.option("--ranges", default=10000, help="Number of CIDRs in the filter")
+@click.option("--ipv6", is_flag=True, help="Use IPv6 instead of IPv4 CIDRs")
+@click.option("--threshold", default=100, help="Threshold for the VALUES list form")
+@click.option("--seed", default=42, help="Random seed")
+def main(ranges: int, ipv6: bool, threshold: int, seed: int) -> None:
+    from flask import current_app
+
+    cidrs = random_cidrs(ranges, ipv6, seed)
+
+    start = time.perf_counter()
+    values = internet_address.translate_type(
+        {"advanced_data_type": "internet_address", "values": cidrs}
+    )["values"]
+    print(f"Parsed {len(values)} CIDRs in {time.perf_counter() - start:.3f} s")
+
+    start = time.perf_counter()
+    single_values, merged_ranges = merge_ranges(values)
+    print(
+        f"Merged into {len(single_values)} IPs and {len(merged_ranges)} ranges "
+        f"in {time.perf_counter() - start:.3f} s"
+    )
+
+    for label, value in (("predicates", None), ("VALUES list", threshold)):
+        current_app.config["INTERNET_ADDRESS_VALUES_THRESHOLD"] = value
+        for operator in (FilterOperator.IN, FilterOperator.NOT_IN):
+            size, duration = compile_filter(values, operator)
+            print(
+                f"{operator.value} with {label}: {size} characters of SQL, "
+                f"compiled in {duration:.3f} s"
+            )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the generation of the temporal join keys of time comparisons.
+
+    python scripts/benchmark_offset_join_column.py --days 730 --groups 500
+"""
+
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.common.query_context_processor import QueryContextProcessor
+from superset.constants import TimeGrain
+
+
+def make_df(days: int, groups: int) -> pd.DataFrame:
+    """
+    Build a daily series per dimension group, like a chart grouped by a column.
+    """
+    dates = pd.date_range("2020-01-01", periods=days, freq="D")
+    return pd.DataFrame(
+        {
+            "ds": np.tile(dates, groups),
+            "group": np.repeat([f"group_{i}" for i in range(groups)], days),
+            "metric": np.arange(days * groups),
+        }
+    )
+
+
+@click.command()
+@click.option("--days", default=730, help="Number of days in each series")
+@click.option("--groups", default=500, help="Number of dimension groups")
+@click.option("--offset", default="1 year ago", help="Time offset")
+def main(days: int, groups: int, offset: str) -> None:
+    df = make_df(days, groups)
+    print(f"{len(df)} rows")
+
+    for time_grain in (TimeGrain.WEEK, TimeGrain.MONTH, TimeGrain.YEAR):
+        start = time.perf_counter()
+        expected = df.apply(
+            lambda row: QueryContextProcessor.generate_join_column(
+                row,
+                0,
+                time_grain,  # pylint: disable=cell-var-from-loop
+                offset,
+            ),
+            axis=1,
+        )
+        row_wise = time.perf_counter() - start
+
+        start = time.perf_counter()
+        keys = QueryContextProcessor.generate_join_keys(df["ds"], time_grain, offset)
+        vectorized = time.perf_counter() - start
+
+        # both keys must group the rows the same way
+        assert (expected.factorize()[0] == keys.factorize()[0]).all()
+        print(
+            f"{time_grain}: row by row {row_wise:.3f} s, vectorized "
+            f"{vectorized:.3f} s ({row_wise / vectorized:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -16,18 +16,22 @@
 # under the License.
 from typing import Any
 
-from flask import current_app as app
+from flask import current_app as app, request
 from flask.wrappers import Response
 from flask_appbuilder.api import expose, permission_name, protect, rison, safe
 from flask_babel import lazy_gettext as _
+from marshmallow import ValidationError
 
 from superset.advanced_data_type.schemas import (
     advanced_data_type_convert_schema,
+    AdvancedDataTypeBatchConvertSchema,
+    AdvancedDataTypeConvertSchema,
     AdvancedDataTypeSchema,
 )
 from superset.advanced_data_type.types import AdvancedDataTypeResponse
 from superset.extensions import event_logger
-from superset.views.base_api import BaseSupersetApi
+from superset.utils import json
+from superset.views.base_api import BaseSupersetApi, requires_json
 
 config = app.config
 ADVANCED_DATA_TYPES = config["ADVANCED_DATA_TYPES"]
@@ -39,6 +43,8 @@ class AdvancedDataTypeRestApi(BaseSupersetApi):
     -Will return available AdvancedDataTypes when the /types endpoint is accessed
     -Will return a AdvancedDataTypeResponse object when the /convert endpoint is accessed
     and is passed in valid arguments
+    -Will return a list of AdvancedDataTypeResponse objects when the /convert/batch
+    endpoint is accessed with a list of valid arguments
     """
 
     allow_browser_login = True
@@ -49,7 +55,11 @@ class AdvancedDataTypeRestApi(BaseSupersetApi):
     apispec_parameter_schemas = {
         "advanced_data_type_convert_schema": advanced_data_type_convert_schema,
     }
-    openapi_spec_component_schemas = (AdvancedDataTypeSchema,)
+    openapi_spec_component_schemas = (
+        AdvancedDataTypeSchema,
+        AdvancedDataTypeConvertSchema,
+        AdvancedDataTypeBatchConvertSchema,
+    )
 
     @protect()
     @safe
@@ -114,6 +124,83 @@ class AdvancedDataTypeRestApi(BaseSupersetApi):
         )
         return self.response(200, result=bus_resp)
 
+    @protect()
+    @safe
+    @expose("/convert/batch", methods=("POST",))
+    @permission_name("read")
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.post_batch",
+        log_to_statsd=False,
+    )
+    @requires_json
+    def post_batch(self) -> Response:
+        """Return an AdvancedDataTypeResponse object for each of the passed in args.
+        ---
+        post:
+          summary: Return a list of AdvancedDataTypeResponse
+          description: >-
+            Converts many (type, values) pairs in a single request, eg, for all the
+            native filters of a dashboard. The responses are returned in the same
+            order as the requests.
+          requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/AdvancedDataTypeBatchConvertSchema'
+          responses:
+            200:
+              description: >-
+                AdvancedDataTypeResponse objects have been returned.
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        type: array
+                        items:
+                          $ref: '#/components/schemas/AdvancedDataTypeSchema'
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            items = AdvancedDataTypeBatchConvertSchema().load(request.json)["requests"]
+        except ValidationError as error:
+            return self.response_400(message=error.messages)
+
+        # identical requests, eg, from filters on the same column, are only
+        # translated once; the operator is part of the key since the translation
+        # depends on it
+        responses: dict[str, AdvancedDataTypeResponse] = {}
+        result = []
+        for item in items:
+            advanced_data_type = item["type"].lower()
+            key = json.dumps([advanced_data_type, item["values"], item["operator"]])
+            if key not in responses:
+                addon = ADVANCED_DATA_TYPES.get(advanced_data_type)
+                responses[key] = (
+                    addon.translate_type(
+                        {"values": item["values"], "operator": item["operator"]}
+                    )
+                    if addon
+                    else {
+                        "error_message": _(
+                            "Invalid advanced data type: %(advanced_data_type)s",
+                            advanced_data_type=item["type"],
+                        ),
+                    }
+                )
+            result.append(responses[key])
+
+        return self.response(200, result=result)
+
     @protect()
     @safe
     @expose("/types", methods=("GET",))
@@ -15,17 +15,87 @@
 # specific language governing permissions and limitations
 # under the License.
 import ipaddress
-from typing import Any
+import re
+from functools import lru_cache
+from typing import Any, Optional
 
-from sqlalchemy import Column
+import numpy as np
+import pandas as pd
+from flask import current_app
+from sqlalchemy import Column, column, exists, literal_column, or_, select
+from sqlalchemy.sql.expression import Values
 
 from superset.advanced_data_type.types import (
     AdvancedDataType,
     AdvancedDataTypeRequest,
     AdvancedDataTypeResponse,
 )
+from superset.constants import LRU_CACHE_MAX_SIZE
 from superset.utils.core import FilterOperator, FilterStringOperators
 
+_OCTET = r"(25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+
+# A dotted quad IPv4 address, with an optional prefix length. Anything else, eg,
+# IPv6 addresses or netmasks, is parsed with ``ipaddress``.
+ipv4_re = re.compile(
+    rf"^{_OCTET}\.{_OCTET}\.{_OCTET}\.{_OCTET}(?:/(3[0-2]|[12]?[0-9]))?\Z"
+)
+
+# Minimum number of values for which they are parsed a whole list at a time
+VECTORIZED_PARSING_MIN_VALUES = 100
+
+
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def parse_ip_range(value: str) -> tuple[int, int]:
+    """
+    Parse an IP address or CIDR into its first and last addresses, as integers.
+
+    IPv4 addresses are parsed with integer arithmetic, which is a lot cheaper than
+    building an ``ipaddress`` network.
+
+    :raises ValueError: If the value is not a valid IP address or CIDR
+    """
+    if match := ipv4_re.match(value):
+        *octets, prefix = match.groups()
+        address = 0
+        for octet in octets:
+            address = (address << 8) | int(octet)
+        host_mask = (1 << (32 - int(prefix or 32))) - 1
+        start = address & ~host_mask
+        return start, start | host_mask
+
+    ip_range = (
+        ipaddress.ip_network(int(value), strict=False)
+        if value.isnumeric()
+        else ipaddress.ip_network(value, strict=False)
+    )
+    return int(ip_range[0]), int(ip_range[-1])
+
+
+def parse_ipv4_ranges(values: list[str]) -> list[Optional[tuple[int, int]]]:
+    """
+    Vectorized version of ``parse_ip_range`` for IPv4 addresses.
+
+    :returns: The first and last address of each value, or None for values that need
+        to be parsed with ``parse_ip_range``
+    """
+    parts = pd.Series(values, dtype=object).str.extract(ipv4_re.pattern)
+    is_ipv4 = parts[0].notna().to_numpy()
+    parts = parts[is_ipv4]
+
+    address = np.zeros(len(parts), dtype=np.int64)
+    for idx in range(4):
+        address = (address << 8) | parts[idx].astype(np.int64).to_numpy()
+    prefix = parts[4].fillna("32").astype(np.int64).to_numpy()
+    host_mask = (np.int64(1) << (32 - prefix)) - 1
+    start = address & ~host_mask
+
+    result: list[Optional[tuple[int, int]]] = [None] * len(values)
+    bounds = zip(start.tolist(), (start | host_mask).tolist())
+    for idx, ip_range in zip(np.flatnonzero(is_ipv4).tolist(), bounds):
+        result[idx] = ip_range
+    return result
+
 
 def cidr_func(req: AdvancedDataTypeRequest) -> AdvancedDataTypeResponse:
     """
@@ -49,34 +119,77 @@ def cidr_func(req: AdvancedDataTypeRequest) -> AdvancedDataTypeResponse:
     if req["values"] == [""]:
         resp["error_message"] = "IPv4 address or CIDR must not be empty"
         return resp
-    for val in req["values"]:
-        string_value = str(val)
+    string_values = [str(val) for val in req["values"]]
+    ip_ranges = (
+        parse_ipv4_ranges(string_values)
+        if len(string_values) >= VECTORIZED_PARSING_MIN_VALUES
+        else [None] * len(string_values)
+    )
+    for string_value, ip_range in zip(string_values, ip_ranges):
         try:
-            ip_range = (
-                ipaddress.ip_network(int(string_value), strict=False)
-                if string_value.isnumeric()
-                else ipaddress.ip_network(string_value, strict=False)
-            )
+            start, end = ip_range or parse_ip_range(string_value)
             resp["values"].append(
-                {"start": int(ip_range[0]), "end": int(ip_range[-1])}
-                if ip_range[0] != ip_range[-1]
-                else int(ip_range[0])
+                {"start": start, "end": end} if start != end else start
             )
         except ValueError as ex:
             resp["error_message"] = str(ex)
             break
-        else:
-            resp["display_value"] = ", ".join(
-                map(
-                    lambda x: f"{x['start']} - {x['end']}"
-                    if isinstance(x, dict)
-                    else str(x),
-                    resp["values"],
-                )
-            )
+    resp["display_value"] = ", ".join(
+        map(
+            lambda x: f"{x['start']} - {x['end']}" if isinstance(x, dict) else str(x),
+            resp["values"],
+        )
+    )
     return resp
 
 
+def merge_ranges(values: list[Any]) -> tuple[list[int], list[tuple[int, int]]]:
+    """
+    Sort and coalesce the IP addresses and ranges returned by ``cidr_func``.
+
+    Overlapping and adjacent ranges are merged, and single IP addresses are folded
+    into the ranges that contain them. Since IPv4 and IPv6 addresses are both
+    represented as integers, the same logic applies to both.
+
+    :param values: IP addresses as integers, and ranges as dicts with a start and end
+    :returns: The remaining single IP addresses and the merged (start, end) ranges
+    """
+    intervals = sorted(
+        (value["start"], value["end"]) if isinstance(value, dict) else (value, value)
+        for value in values
+    )
+
+    merged: list[list[int]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    single_values = [start for start, end in merged if start == end]
+    ranges = [(start, end) for start, end in merged if start != end]
+    return single_values, ranges
+
+
+def _ranges_values_clause(
+    col: Column, single_values: list[int], ranges: list[tuple[int, int]]
+) -> Any:
+    """
+    Build an EXISTS clause matching the column against a sorted VALUES list of
+    ranges, which is a lot more compact than one predicate per range.
+    """
+    range_start = column("range_start", col.type)
+    range_end = column("range_end", col.type)
+    table = Values(range_start, range_end, name="ip_ranges").data(
+        sorted(ranges + [(value, value) for value in single_values])
+    )
+    return exists(
+        select(literal_column("1"))
+        .select_from(table)
+        .where(col.between(table.c.range_start, table.c.range_end))
+    )
+
+
 # Make this return a single clause
 def cidr_translate_filter_func(
     col: Column, operator: FilterOperator, values: list[Any]
@@ -87,17 +200,15 @@ def cidr_translate_filter_func(
     """
     return_expression: Any
     if operator in (FilterOperator.IN, FilterOperator.NOT_IN):
-        dict_items = [val for val in values if isinstance(val, dict)]
-        single_values = [val for val in values if not isinstance(val, dict)]
-        if operator == FilterOperator.IN.value:
-            cond = col.in_(single_values)
-            for dictionary in dict_items:
-                cond = cond | (col <= dictionary["end"]) & (col >= dictionary["start"])
-        elif operator == FilterOperator.NOT_IN.value:
-            cond = ~(col.in_(single_values))
-            for dictionary in dict_items:
-                cond = cond & (col > dictionary["end"]) & (col < dictionary["start"])
-        return_expression = cond
+        single_values, ranges = merge_ranges(values)
+        threshold = current_app.config["INTERNET_ADDRESS_VALUES_THRESHOLD"]
+        if threshold is not None and len(single_values) + len(ranges) > threshold:
+            cond = _ranges_values_clause(col, single_values, ranges)
+        else:
+            conditions = [col.in_(single_values)] if single_values or not ranges else []
+            conditions.extend((col <= end) & (col >= start) for start, end in ranges)
+            cond = or_(*conditions)
+        return_expression = cond if operator == FilterOperator.IN.value else ~cond
     if len(values) == 1:
         value = values[0]
         if operator == FilterOperator.EQUALS.value:
@@ -94,15 +94,12 @@ def port_translation_func(req: AdvancedDataTypeRequest) -> AdvancedDataTypeRespo
                 f"'{string_value}' does not appear to be a port name or number"
             )
             break
-        else:
-            resp["display_value"] = ", ".join(
-                map(
-                    lambda x: f"{x['start']} - {x['end']}"
-                    if isinstance(x, dict)
-                    else str(x),
-                    resp["values"],
-                )
-            )
+    resp["display_value"] = ", ".join(
+        map(
+            lambda x: f"{x['start']} - {x['end']}" if isinstance(x, dict) else str(x),
+            resp["values"],
+        )
+    )
     return resp
 
 
@@ -19,6 +19,7 @@ Schemas for advanced data types
 """
 
 from marshmallow import fields, Schema
+from marshmallow.validate import Length
 
 advanced_data_type_convert_schema = {
     "type": "object",
@@ -48,3 +49,32 @@ class AdvancedDataTypeSchema(Schema):
         metadata={"description": "The string representation of the parsed values"}
     )
     valid_filter_operators = fields.List(fields.String())
+
+
+class AdvancedDataTypeConvertSchema(Schema):
+    """
+    AdvancedDataType convert request schema
+    """
+
+    type = fields.String(
+        required=True, metadata={"description": "The advanced data type"}
+    )
+    values = fields.List(
+        fields.Raw(),
+        required=True,
+        validate=Length(min=1),
+        metadata={"description": "The values to convert"},
+    )
+    operator = fields.String(load_default=None)
+
+
+class AdvancedDataTypeBatchConvertSchema(Schema):
+    """
+    AdvancedDataType batch convert request schema
+    """
+
+    requests = fields.List(
+        fields.Nested(AdvancedDataTypeConvertSchema),
+        required=True,
+        validate=Length(min=1),
+    )
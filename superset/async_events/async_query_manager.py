@@ -77,6 +77,7 @@ class AsyncQueryManager:
         self._stream_prefix: str = ""
         self._stream_limit: Optional[int]
         self._stream_limit_firehose: Optional[int]
+        self._long_polling_timeout: int = 0
         self._jwt_cookie_name: str = ""
         self._jwt_cookie_secure: bool = False
         self._jwt_cookie_domain: Optional[str]
@@ -112,6 +113,7 @@ class AsyncQueryManager:
         self._stream_limit_firehose = config[
             "GLOBAL_ASYNC_QUERIES_REDIS_STREAM_LIMIT_FIREHOSE"
         ]
+        self._long_polling_timeout = config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"]
         self._jwt_cookie_name = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_NAME"]
         self._jwt_cookie_secure = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SECURE"]
         self._jwt_cookie_samesite = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE"]
@@ -230,10 +232,30 @@ class AsyncQueryManager:
     def read_events(
         self, channel: str, last_id: Optional[str]
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel published after a given event ID.
+
+        When long polling is enabled and there are no such events yet, this blocks
+        until one is published or `GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT`
+        milliseconds have elapsed.
+        """
         stream_name = f"{self._stream_prefix}{channel}"
-        start_id = increment_id(last_id) if last_id else "-"
-        results = self._redis.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
-        return [] if not results else list(map(parse_event, results))
+        if not self._long_polling_timeout:
+            start_id = increment_id(last_id) if last_id else "-"
+            results = self._redis.xrange(
+                stream_name, start_id, "+", self.MAX_EVENT_COUNT
+            )
+            return [] if not results else list(map(parse_event, results))
+
+        # unlike XRANGE, XREAD only returns the events after the given ID
+        streams = self._redis.xread(
+            {stream_name: last_id or "0"},
+            count=self.MAX_EVENT_COUNT,
+            block=self._long_polling_timeout,
+        )
+        return [
+            event for _, results in streams or [] for event in map(parse_event, results)
+        ]
 
     def update_job(
         self, job_metadata: dict[str, Any], status: str, **kwargs: Any
@@ -253,5 +275,8 @@ class AsyncQueryManager:
         logger.debug("********** logging event data to stream %s", scoped_stream_name)
         logger.debug(event_data)
 
-        self._redis.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
-        self._redis.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+        # publish to both streams in a single round trip
+        with self._redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
+            pipe.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+            pipe.execute()
@@ -20,6 +20,8 @@ import contextlib
 import logging
 from typing import Any, TYPE_CHECKING
 
+import pandas as pd
+import pyarrow as pa
 from flask import current_app, g, make_response, request, Response
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
@@ -46,13 +48,19 @@ from superset.exceptions import QueryObjectValidationError
 from superset.extensions import event_logger
 from superset.models.sql_lab import Query
 from superset.utils import json
+from superset.utils.arrow import df_to_arrow, write_ipc_buffer
 from superset.utils.core import (
     create_zip,
     DatasourceType,
     get_user_id,
 )
 from superset.utils.decorators import logs_context
-from superset.views.base import CsvResponse, generate_download_headers, XlsxResponse
+from superset.views.base import (
+    ArrowResponse,
+    CsvResponse,
+    generate_download_headers,
+    XlsxResponse,
+)
 from superset.views.base_api import statsd_metrics
 
 if TYPE_CHECKING:
@@ -401,6 +409,40 @@ class ChartDataRestApi(ChartRestApi):
                 mimetype="application/zip",
             )
 
+        if result_format == ChartDataResultFormat.ARROW:
+            if not result["queries"]:
+                return self.response_400(_("Empty query result"))
+
+            def _to_table(query_data: Any) -> pa.Table:
+                # result types that do not return a dataframe, eg, columns
+                if isinstance(query_data, pa.Table):
+                    return query_data
+                return df_to_arrow(pd.DataFrame(query_data or []))
+
+            compression = current_app.config["ARROW_IPC_COMPRESSION"]
+            buffers = [
+                write_ipc_buffer(
+                    _to_table(query.get("data")),
+                    {key: value for key, value in query.items() if key != "data"},
+                    compression,
+                ).to_pybytes()
+                for query in result["queries"]
+            ]
+            if len(buffers) == 1:
+                return ArrowResponse(buffers[0])
+
+            # return multi-query results bundled as a zip file
+            return Response(
+                create_zip(
+                    {
+                        f"query_{idx + 1}.arrow": buffer
+                        for idx, buffer in enumerate(buffers)
+                    }
+                ),
+                headers=generate_download_headers("zip"),
+                mimetype="application/zip",
+            )
+
         if result_format == ChartDataResultFormat.JSON:
             response_data = json.dumps(
                 {"result": result["queries"]},
@@ -459,6 +501,12 @@ class ChartDataRestApi(ChartRestApi):
         """
 
         try:
-            return ChartDataQueryContextSchema().load(form_data)
+            query_context = ChartDataQueryContextSchema().load(form_data)
         except KeyError as ex:
             raise ValidationError("Request is incorrect") from ex
+
+        # the payload is sent as is, unless the data needs to be post-processed
+        query_context.encode_json_data = (
+            query_context.result_type != ChartDataResultType.POST_PROCESSED
+        )
+        return query_context
@@ -36,6 +36,7 @@ from flask_babel import gettext as __
 
 from superset import app
 from superset.common.chart_data import ChartDataResultFormat
+from superset.utils.arrow import df_to_arrow
 from superset.utils.core import (
     extract_dataframe_dtypes,
     get_column_names,
@@ -338,6 +339,7 @@ rawPostProcess = [
     "at_a_glance_user_id_sas",
 ]
 
+
 def apply_post_process(
     result: dict[Any, Any],
     form_data: Optional[dict[str, Any]] = None,
@@ -368,6 +370,8 @@ def apply_post_process(
 
         if query["result_format"] == ChartDataResultFormat.JSON:
             df = pd.DataFrame.from_dict(data)
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            df = data.to_pandas()
         elif query["result_format"] == ChartDataResultFormat.CSV:
             df = pd.read_csv(StringIO(data))
 
@@ -400,6 +404,8 @@ def apply_post_process(
 
         if query["result_format"] == ChartDataResultFormat.JSON:
             query["data"] = processed_df.to_dict()
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            query["data"] = df_to_arrow(processed_df.reset_index())
         elif query["result_format"] == ChartDataResultFormat.CSV:
             buf = StringIO()
             processed_df.to_csv(buf)
@@ -0,0 +1,116 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import cast
+
+from flask import current_app
+
+from superset.commands.base import BaseCommand
+from superset.commands.database.exceptions import DatabaseNotFoundError
+from superset.daos.database import DatabaseDAO
+from superset.daos.metadata_catalog import MetadataCatalogDAO
+from superset.extensions import db
+from superset.models.core import Database
+from superset.sql_parse import Table
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshMetadataCatalogCommand(BaseCommand):
+    """
+    Command to refresh the metadata catalog of a database.
+
+    The schemas of the database are listed, and the tables of the schemas and the
+    columns of the tables that were refreshed more than
+    `METADATA_CATALOG_REFRESH_INTERVAL` ago are inspected again. Only the columns of
+    tables that were requested once are refreshed, since inspecting every table of a
+    large warehouse can take hours.
+
+    Errors are logged and don't stop the refresh, so that a schema or table that can't
+    be inspected doesn't prevent the others from being refreshed.
+    """
+
+    _model: Database
+
+    def __init__(self, db_id: int):
+        self._db_id = db_id
+
+    def run(self) -> None:
+        self.validate()
+        refreshed_before = (
+            datetime.now() - current_app.config["METADATA_CATALOG_REFRESH_INTERVAL"]
+        )
+
+        if self._model.db_engine_spec.supports_catalog:
+            catalogs = self._model.get_all_catalog_names(cache=False)
+        else:
+            catalogs = {MetadataCatalogDAO.get_catalog_name(self._model, None)}
+
+        for catalog in catalogs:
+            try:
+                MetadataCatalogDAO.refresh_schemas(self._model, catalog)
+            except Exception:  # pylint: disable=broad-except
+                db.session.rollback()
+                logger.warning(
+                    "Unable to refresh the schemas of catalog %s of database %s",
+                    catalog,
+                    self._model.database_name,
+                    exc_info=True,
+                )
+
+        for catalog, name in MetadataCatalogDAO.get_stale_schemas(
+            self._model,
+            refreshed_before,
+        ):
+            try:
+                MetadataCatalogDAO.refresh_tables(self._model, catalog, name)
+            except Exception:  # pylint: disable=broad-except
+                db.session.rollback()
+                logger.warning(
+                    "Unable to refresh the tables of schema %s of database %s",
+                    name,
+                    self._model.database_name,
+                    exc_info=True,
+                )
+
+        for catalog, schema_name, table_name in MetadataCatalogDAO.get_stale_tables(
+            self._model,
+            refreshed_before,
+        ):
+            table = Table(table_name, schema_name, catalog)
+            try:
+                MetadataCatalogDAO.refresh_table(self._model, table)
+            except Exception:  # pylint: disable=broad-except
+                db.session.rollback()
+                logger.warning(
+                    "Unable to refresh the columns of table %s of database %s",
+                    table,
+                    self._model.database_name,
+                    exc_info=True,
+                )
+
+    def validate(self) -> None:
+        # the command runs in Celery, without a user for the base filter
+        self._model = cast(
+            Database,
+            DatabaseDAO.find_by_id(self._db_id, skip_base_filter=True),
+        )
+        if not self._model:
+            raise DatabaseNotFoundError()
@@ -29,9 +29,11 @@ from superset.commands.database.exceptions import (
 )
 from superset.connectors.sqla.models import SqlaTable
 from superset.daos.database import DatabaseDAO
+from superset.daos.metadata_catalog import MetadataCatalogDAO
 from superset.exceptions import SupersetException
 from superset.extensions import db, security_manager
 from superset.models.core import Database
+from superset.utils.core import DatasourceName
 
 logger = logging.getLogger(__name__)
 
@@ -39,49 +41,88 @@ logger = logging.getLogger(__name__)
 class TablesDatabaseCommand(BaseCommand):
     _model: Database
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         db_id: int,
         catalog_name: str | None,
         schema_name: str,
         force: bool,
+        search: str | None = None,
     ):
         self._db_id = db_id
         self._catalog_name = catalog_name
         self._schema_name = schema_name
         self._force = force
+        self._search = search
+
+    def _get_names(self) -> tuple[list[DatasourceName], list[DatasourceName]]:
+        """
+        Return the names of the tables and views of the schema matching the search.
+        """
+        if MetadataCatalogDAO.is_enabled():
+            catalog_tables = MetadataCatalogDAO.get_tables(
+                self._model,
+                self._catalog_name,
+                self._schema_name,
+                force=self._force,
+                search=self._search,
+            )
+            names = {
+                type_: [
+                    DatasourceName(table.name, self._schema_name, self._catalog_name)
+                    for table in catalog_tables
+                    if table.type == type_
+                ]
+                for type_ in ("table", "view")
+            }
+            return names["table"], names["view"]
+
+        tables = self._model.get_all_table_names_in_schema(
+            catalog=self._catalog_name,
+            schema=self._schema_name,
+            force=self._force,
+            cache=self._model.table_cache_enabled,
+            cache_timeout=self._model.table_cache_timeout,
+        )
+        views = self._model.get_all_view_names_in_schema(
+            catalog=self._catalog_name,
+            schema=self._schema_name,
+            force=self._force,
+            cache=self._model.table_cache_enabled,
+            cache_timeout=self._model.table_cache_timeout,
+        )
+        if self._search:
+            search = self._search.lower()
+            tables = {table for table in tables if search in table.table.lower()}
+            views = {view for view in views if search in view.table.lower()}
+
+        return sorted(tables), sorted(views)
+
+    def _sort_key(self, item: dict[str, Any]) -> tuple[bool, str]:
+        """
+        Sort the options by name, with the ones starting with the search first.
+        """
+        value = item["value"]
+        if self._search:
+            return not value.lower().startswith(self._search.lower()), value
+        return False, value
 
     def run(self) -> dict[str, Any]:
         self.validate()
         try:
+            table_names, view_names = self._get_names()
             tables = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    self._model.get_all_table_names_in_schema(
-                        catalog=self._catalog_name,
-                        schema=self._schema_name,
-                        force=self._force,
-                        cache=self._model.table_cache_enabled,
-                        cache_timeout=self._model.table_cache_timeout,
-                    )
-                ),
+                datasource_names=table_names,
             )
 
             views = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    self._model.get_all_view_names_in_schema(
-                        catalog=self._catalog_name,
-                        schema=self._schema_name,
-                        force=self._force,
-                        cache=self._model.table_cache_enabled,
-                        cache_timeout=self._model.table_cache_timeout,
-                    )
-                ),
+                datasource_names=view_names,
             )
 
             extra_dict_by_name = {
@@ -122,7 +163,7 @@ class TablesDatabaseCommand(BaseCommand):
                     }
                     for view in views
                 ],
-                key=lambda item: item["value"],
+                key=self._sort_key,
             )
 
             payload = {"count": len(tables) + len(views), "result": options}
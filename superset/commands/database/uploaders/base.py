@@ -16,6 +16,7 @@
 # under the License.
 import logging
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from functools import partial
 from typing import Any, Optional, TypedDict
 
@@ -45,6 +46,61 @@ logger = logging.getLogger(__name__)
 READ_CHUNK_SIZE = 1000
 
 
+def _cast_column(series: pd.Series, dtype: Any) -> pd.Series:
+    if series.dtype == dtype:
+        return series
+    if pd.api.types.is_integer_dtype(dtype):
+        # nullable, since a chunk with nulls is read as floats
+        prefix = "UInt" if pd.api.types.is_unsigned_integer_dtype(dtype) else "Int"
+        return series.astype(f"{prefix}{dtype.itemsize * 8}")
+    if pd.api.types.is_bool_dtype(dtype):
+        return series.astype("boolean")
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return pd.to_datetime(series).astype(dtype)
+    if pd.api.types.is_object_dtype(dtype):
+        if (
+            pd.api.types.is_float_dtype(series.dtype)
+            and (series.dropna() % 1 == 0).all()
+        ):
+            # integers read as floats because of nulls, keep them as written
+            series = series.astype("Int64")
+        return series.astype("string").astype(object)
+    return series.astype(dtype)
+
+
+def cast_to_first_dtypes(dfs: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Cast DataFrames read from the chunks of a file to the dtypes of the first one.
+
+    pandas infers the dtypes of each chunk separately, while the table is created from
+    the first one, eg, an integer column is read as floats in a chunk where it has
+    nulls, and those would be rejected by the integer column of the table.
+
+    :throws DatabaseUploadFailed: if a column can't be cast to its first dtype
+    """
+    dtypes: Optional[pd.Series] = None
+    for df in dfs:
+        if dtypes is None:
+            dtypes = df.dtypes
+        else:
+            for column, dtype in dtypes.items():
+                if column not in df.columns:
+                    continue
+                try:
+                    df[column] = _cast_column(df[column], dtype)
+                except (TypeError, ValueError) as ex:
+                    raise DatabaseUploadFailed(
+                        message=_(
+                            "The values of column %(column)s don't match its type "
+                            "%(dtype)s, inferred from the first rows of the file. "
+                            "Please set the type of the column.",
+                            column=column,
+                            dtype=dtype,
+                        )
+                    ) from ex
+        yield df
+
+
 class ReaderOptions(TypedDict, total=False):
     already_exists: str
     index_label: str
@@ -76,6 +132,17 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a file into DataFrames of at most ``UPLOAD_CHUNK_SIZE`` rows
+
+        Readers that can't read files incrementally yield a single DataFrame.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
@@ -83,22 +150,36 @@ class BaseDataReader:
         table_name: str,
         schema_name: Optional[str],
     ) -> None:
-        self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
+        self._dataframes_to_database(
+            cast_to_first_dtypes(self.file_to_dataframes(file)),
+            database,
+            table_name,
+            schema_name,
         )
 
-    def _dataframe_to_database(
+    @staticmethod
+    def _log_progress(
+        dfs: Iterable[pd.DataFrame], data_table: Table
+    ) -> Iterator[pd.DataFrame]:
+        rows = 0
+        for df in dfs:
+            yield df
+            # the DataFrame has been uploaded when the next one is requested
+            rows += len(df.index)
+            logger.info("Uploaded %d rows to %s", rows, data_table)
+
+    def _dataframes_to_database(
         self,
-        df: pd.DataFrame,
+        dfs: Iterable[pd.DataFrame],
         database: Database,
         table_name: str,
         schema_name: Optional[str],
     ) -> None:
         """
-        Upload DataFrame to database
+        Upload DataFrames to database, one at a time
 
-        :param df:
-        :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
+        :param dfs:
+        :throws DatabaseUploadFailed: if there is an error uploading the DataFrames
         """
         try:
             data_table = Table(table=table_name, schema=schema_name)
@@ -111,12 +192,14 @@ class BaseDataReader:
                 "dataframe_index"
             ):
                 to_sql_kwargs["index_label"] = self._options.get("index_label")
-            database.db_engine_spec.df_to_sql(
+            database.db_engine_spec.df_chunks_to_sql(
                 database,
                 data_table,
-                df,
+                self._log_progress(dfs, data_table),
                 to_sql_kwargs=to_sql_kwargs,
             )
+        except DatabaseUploadFailed:
+            raise
         except ValueError as ex:
             raise DatabaseUploadFailed(
                 message=_(
@@ -15,9 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from typing import Any, Optional
 
 import pandas as pd
+from flask import current_app
 from flask_babel import lazy_gettext as _
 from werkzeug.datastructures import FileStorage
 
@@ -86,6 +88,25 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
+    @staticmethod
+    def _read_csv_chunks(
+        file: FileStorage, kwargs: dict[str, Any]
+    ) -> Iterator[pd.DataFrame]:
+        try:
+            with pd.read_csv(filepath_or_buffer=file.stream, **kwargs) as reader:
+                yield from reader
+        except (
+            pd.errors.ParserError,
+            pd.errors.EmptyDataError,
+            UnicodeDecodeError,
+            ValueError,
+        ) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except Exception as ex:
+            raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
+
     def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
         """
         Read CSV file into a DataFrame
@@ -93,8 +114,22 @@ class CSVReader(BaseDataReader):
         :return: pandas DataFrame
         :throws DatabaseUploadFailed: if there is an error reading the file
         """
-        kwargs = {
-            "chunksize": READ_CSV_CHUNK_SIZE,
+        return self._read_csv(file, self._get_read_kwargs(READ_CSV_CHUNK_SIZE))
+
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file into DataFrames of at most ``UPLOAD_CHUNK_SIZE`` rows
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        return self._read_csv_chunks(
+            file, self._get_read_kwargs(current_app.config["UPLOAD_CHUNK_SIZE"])
+        )
+
+    def _get_read_kwargs(self, chunk_size: int) -> dict[str, Any]:
+        return {
+            "chunksize": chunk_size,
             "encoding": "utf-8",
             "header": self._options.get("header_row", 0),
             "decimal": self._options.get("decimal_character", "."),
@@ -118,7 +153,6 @@ class CSVReader(BaseDataReader):
             if self._options.get("column_data_types")
             else None,
         }
-        return self._read_csv(file, kwargs)
 
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
@@ -0,0 +1,67 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from superset import db
+from superset.commands.base import BaseCommand
+from superset.daos.key_value import KEYS_BATCH_SIZE
+from superset.key_value.models import KeyValueEntry
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=consider-using-transaction
+class KeyValuePruneCommand(BaseCommand):
+    """
+    Command to delete the expired entries of the key-value table.
+
+    Expired entries are never returned, so they are deleted periodically instead of
+    on every write, eg, by the metastore cache.
+    """
+
+    def run(self) -> None:
+        """
+        Executes the prune command
+        """
+        ids_to_delete = (
+            db.session.execute(
+                sa.select(KeyValueEntry.id).where(
+                    KeyValueEntry.expires_on <= datetime.now()
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        total_deleted = 0
+        for i in range(0, len(ids_to_delete), KEYS_BATCH_SIZE):
+            result = db.session.execute(
+                sa.delete(KeyValueEntry).where(
+                    KeyValueEntry.id.in_(ids_to_delete[i : i + KEYS_BATCH_SIZE])
+                )
+            )
+            total_deleted += result.rowcount
+            # commit every batch, so that a failure doesn't discard the previous ones
+            db.session.commit()
+
+        logger.info("Deleted %s expired key-value entries", total_deleted)
+
+    def validate(self) -> None:
+        pass
@@ -17,17 +17,27 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from typing import Any, cast, TypedDict
 
+import msgpack
 import pandas as pd
 from flask_babel import gettext as __
 
-from superset import app, db, results_backend, results_backend_use_msgpack
+from superset import (
+    app,
+    db,
+    is_feature_enabled,
+    results_backend,
+    results_backend_use_msgpack,
+)
 from superset.commands.base import BaseCommand
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
+from superset.result_set import SupersetResultSet
 from superset.sql_parse import ParsedQuery
+from superset.sqllab.chunked_results import CHUNKS_KEY, iter_chunks
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.utils import core as utils, csv
 from superset.views.utils import _deserialize_results_payload
@@ -40,7 +50,7 @@ logger = logging.getLogger(__name__)
 class SqlExportResult(TypedDict):
     query: Query
     count: int
-    data: list[Any]
+    data: str | Iterator[str]
 
 
 class SqlResultExportCommand(BaseCommand):
@@ -50,8 +60,10 @@ class SqlResultExportCommand(BaseCommand):
     def __init__(
         self,
         client_id: str,
+        stream: bool = False,
     ) -> None:
         self._client_id = client_id
+        self._stream = stream
 
     def validate(self) -> None:
         self._query = (
@@ -97,6 +109,14 @@ class SqlResultExportCommand(BaseCommand):
             payload = utils.zlib_decompress(
                 blob, decode=not results_backend_use_msgpack
             )
+            if manifest := self._get_chunks_manifest(payload):
+                logger.info("Streaming CSV from results backend chunks")
+                return {
+                    "query": self._query,
+                    "count": sum(manifest["rows"]),
+                    "data": self._iter_csv_chunks(manifest),
+                }
+
             obj = _deserialize_results_payload(
                 payload, self._query, cast(bool, results_backend_use_msgpack)
             )
@@ -132,10 +152,50 @@ class SqlResultExportCommand(BaseCommand):
                 self._query.schema,
             )[:limit]
 
-        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
+        csv_data: str | Iterator[str]
+        if self._stream:
+            # escape and serialize the results lazily, chunk by chunk
+            csv_data = csv.df_to_escaped_csv_chunks(
+                df,
+                chunk_size=config["CSV_EXPORT_CHUNK_SIZE"],
+                index=False,
+                **config["CSV_EXPORT"],
+            )
+        else:
+            csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
 
         return {
             "query": self._query,
             "count": len(df.index),
             "data": csv_data,
         }
+
+    def _get_chunks_manifest(self, payload: bytes | str) -> dict[str, Any] | None:
+        """
+        Return the manifest of results stored in chunks, if they can be streamed.
+
+        Nested fields are expanded over all the rows, so results are only streamed
+        chunk by chunk when the expansion is disabled.
+        """
+        if (
+            not self._stream
+            or not results_backend_use_msgpack
+            or is_feature_enabled("PRESTO_EXPAND_DATA")
+        ):
+            return None
+
+        return msgpack.loads(payload, raw=False).get(CHUNKS_KEY)
+
+    def _iter_csv_chunks(self, manifest: dict[str, Any]) -> Iterator[str]:
+        csv_export = dict(config["CSV_EXPORT"])
+        header = csv_export.pop("header", True)
+        for index, table in enumerate(
+            iter_chunks(results_backend, self._query.results_key, manifest)
+        ):
+            yield from csv.df_to_escaped_csv_chunks(
+                SupersetResultSet.convert_table_to_df(table),
+                chunk_size=config["CSV_EXPORT_CHUNK_SIZE"],
+                index=False,
+                header=header if index == 0 else False,
+                **csv_export,
+            )
@@ -41,6 +41,9 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _as_table: bool
+    _offset: int
+    _limit: int | None
     _blob: Any
     _query: Query
 
@@ -48,9 +51,15 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        as_table: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._as_table = as_table
+        self._offset = offset
+        self._limit = limit
 
     def validate(self) -> None:
         if not results_backend:
@@ -106,9 +115,16 @@ class SqlExecutionResultsCommand(BaseCommand):
         payload = utils.zlib_decompress(
             self._blob, decode=not results_backend_use_msgpack
         )
+        # rows past the display limit are dropped, so they don't need to be read
+        limits = [limit for limit in (self._limit, self._rows) if limit]
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                self._as_table,
+                offset=self._offset,
+                limit=min(limits) if limits else None,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
@@ -22,6 +22,7 @@ class ChartDataResultFormat(StrEnum):
     Chart data response format
     """
 
+    ARROW = "arrow"
     CSV = "csv"
     JSON = "json"
     XLSX = "xlsx"
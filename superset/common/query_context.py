@@ -20,6 +20,7 @@ import logging
 from typing import Any, ClassVar, TYPE_CHECKING
 
 import pandas as pd
+import pyarrow as pa
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context_processor import (
@@ -28,6 +29,7 @@ from superset.common.query_context_processor import (
 )
 from superset.common.query_object import QueryObject
 from superset.models.slice import Slice
+from superset.utils import json
 from superset.utils.core import GenericDataType
 
 if TYPE_CHECKING:
@@ -46,6 +48,9 @@ class QueryContext:
 
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
+    # encode the records of JSON results when building the payload, for callers
+    # that only serialize it
+    encode_json_data: bool = False
 
     datasource: BaseDatasource
     slice_: Slice | None = None
@@ -90,7 +95,7 @@ class QueryContext:
         self,
         df: pd.DataFrame,
         coltypes: list[GenericDataType],
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | json.RawJSON | pa.Table:
         return self._processor.get_data(df, coltypes)
 
     def get_payload(
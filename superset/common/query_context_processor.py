@@ -19,10 +19,12 @@ from __future__ import annotations
 import copy
 import logging
 import re
+from functools import partial
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from flask_babel import gettext as _
 from pandas import DateOffset
 
@@ -40,6 +42,7 @@ from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import CacheRegion, TimeGrain
 from superset.daos.annotation_layer import AnnotationLayerDAO
 from superset.daos.chart import ChartDAO
+from superset.dataframe import df_to_json
 from superset.exceptions import (
     InvalidPostProcessingError,
     QueryObjectValidationError,
@@ -48,8 +51,12 @@ from superset.exceptions import (
 from superset.extensions import cache_manager, security_manager
 from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
-from superset.utils import csv, excel
+from superset.utils import arrow, csv, excel, json
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import (
+    map_with_flask_context,
+    merge_into_thread_session,
+)
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -119,6 +126,7 @@ class QueryContextProcessor:
     def __init__(self, query_context: QueryContext):
         self._query_context = query_context
         self._qc_datasource = query_context.datasource
+        self._queries_run_concurrently = False
 
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
@@ -138,37 +146,16 @@ class QueryContextProcessor:
         )
 
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                if invalid_columns := [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
-                        )
-                    )
-
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+            with QueryCacheManager.single_flight(
+                key=cache_key,
+                region=CacheRegion.DATA,
+                stale=cache,
+                force_query=force_query,
+            ) as cached:
+                if cached:
+                    cache = cached
+                else:
+                    self._load_df_payload(cache, query_obj, cache_key, force_query)
 
         # the N-dimensional DataFrame has converted into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -202,6 +189,43 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    def _load_df_payload(
+        self,
+        cache: QueryCacheManager,
+        query_obj: QueryObject,
+        cache_key: str,
+        force_query: bool,
+    ) -> None:
+        """Run the query of a df payload missing from the cache, and cache it"""
+        try:
+            if invalid_columns := [
+                col
+                for col in get_column_names_from_columns(query_obj.columns)
+                + get_column_names_from_metrics(query_obj.metrics or [])
+                if col not in self._qc_datasource.column_names and col != DTTM_ALIAS
+            ]:
+                raise QueryObjectValidationError(
+                    _(
+                        "Columns missing in dataset: %(invalid_columns)s",
+                        invalid_columns=invalid_columns,
+                    )
+                )
+
+            query_result = self.get_query_result(query_obj)
+            annotation_data = self.get_annotation_data(query_obj)
+            cache.set_query_result(
+                key=cache_key,
+                query_result=query_result,
+                annotation_data=annotation_data,
+                force_query=force_query,
+                timeout=self.get_cache_timeout(),
+                datasource_uid=self._qc_datasource.uid,
+                region=CacheRegion.DATA,
+            )
+        except QueryObjectValidationError as ex:
+            cache.error_message = str(ex)
+            cache.status = QueryStatus.FAILED
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -363,6 +387,8 @@ class QueryContextProcessor:
         """
         if join_column_producer:
             df[name] = df.apply(lambda row: join_column_producer(row, 0), axis=1)
+        elif not df.empty and pd.api.types.is_datetime64_any_dtype(df.iloc[:, 0]):
+            df[name] = self.generate_join_keys(df.iloc[:, 0], time_grain, time_offset)
         else:
             df[name] = df.apply(
                 lambda row: self.generate_join_column(row, 0, time_grain, time_offset),
@@ -375,11 +401,11 @@ class QueryContextProcessor:
         query_object: QueryObject,
     ) -> CachedTimeOffset:
         query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
-        queries: list[str] = []
-        cache_keys: list[str | None] = []
+        queries: dict[str, str] = {}
+        cache_keys: dict[str, str | None] = {}
         offset_dfs: dict[str, pd.DataFrame] = {}
+        # offsets missing from the cache, with their query object and cache key
+        pending: dict[str, tuple[QueryObject, str | None]] = {}
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -398,6 +424,9 @@ class QueryContextProcessor:
         join_keys = [col for col in df.columns if col not in metric_names]
 
         for offset in query_object.time_offsets:
+            # ensure query_object is immutable
+            query_object_clone = copy.copy(query_object)
+            query_object_clone.filter = copy.deepcopy(query_object.filter)
             try:
                 # pylint: disable=line-too-long
                 # Since the x-axis is also a column name for the time filter, x_axis_label will be set as granularity
@@ -464,39 +493,38 @@ class QueryContextProcessor:
             # whether hit on the cache
             if cache.is_loaded:
                 offset_dfs[offset] = cache.df
-                queries.append(cache.query)
-                cache_keys.append(cache_key)
+                queries[offset] = cache.query
+                cache_keys[offset] = cache_key
                 continue
 
-            query_object_clone_dct = query_object_clone.to_dict()
+            pending[offset] = (query_object_clone, cache_key)
+
+        # the offset queries are independent, so they run concurrently
+        concurrency = self.get_time_offset_query_concurrency()
+        results = map_with_flask_context(
+            partial(
+                self._run_time_offset_query,
+                query_object,
+                concurrency > 1 and len(pending) > 1,
+            ),
+            [query_object_clone for query_object_clone, _ in pending.values()],
+            max_workers=concurrency,
+        )
+        for (offset, (query_object_clone, cache_key)), result in zip(
+            pending.items(), results
+        ):
+            queries[offset] = result.query
+            cache_keys[offset] = None
+
             # rename metrics: SUM(value) => SUM(value) 1 year ago
             metrics_mapping = {
                 metric: TIME_COMPARISON.join([metric, offset])
                 for metric in metric_names
             }
-
-            # When the original query has limit or offset we wont apply those
-            # to the subquery so we prevent data inconsistency due to missing records
-            # in the dataframes when performing the join
-            if query_object.row_limit or query_object.row_offset:
-                query_object_clone_dct["row_limit"] = config["ROW_LIMIT"]
-                query_object_clone_dct["row_offset"] = 0
-
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
-
-            queries.append(result.query)
-            cache_keys.append(None)
-
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
-                offset_metrics_df = pd.DataFrame(
-                    {
-                        col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
-                    }
+                offset_metrics_df = self.get_empty_offset_df(
+                    df, join_keys, list(metrics_mapping.values())
                 )
             else:
                 # 1. normalize df, set dttm column
@@ -512,7 +540,7 @@ class QueryContextProcessor:
                 "df": offset_metrics_df,
                 "query": result.query,
             }
-            cache.set(
+            QueryCacheManager.set(
                 key=cache_key,
                 value=value,
                 timeout=self.get_cache_timeout(),
@@ -522,14 +550,103 @@ class QueryContextProcessor:
             offset_dfs[offset] = offset_metrics_df
 
         if offset_dfs:
+            # join the offsets in their order, regardless of which ones were cached
             df = self.join_offset_dfs(
                 df,
-                offset_dfs,
+                {offset: offset_dfs[offset] for offset in query_object.time_offsets},
                 time_grain,
                 join_keys,
             )
 
-        return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
+        # keep the order of the offsets, regardless of which ones were cached
+        return CachedTimeOffset(
+            df=df,
+            queries=[queries[offset] for offset in query_object.time_offsets],
+            cache_keys=[cache_keys[offset] for offset in query_object.time_offsets],
+        )
+
+    @staticmethod
+    def get_empty_offset_df(
+        df: pd.DataFrame,
+        join_keys: list[str],
+        metric_names: list[str],
+    ) -> pd.DataFrame:
+        """
+        Return the result of a time offset without rows, as a single row of nulls.
+
+        The join keys keep the types of the main DataFrame, eg, a null datetime for
+        the temporal column, so that both get the same type of offset join column.
+
+        :param df: The main DataFrame.
+        :param join_keys: The keys to join on.
+        :param metric_names: The names of the offset metrics.
+        """
+        return (
+            df[join_keys]
+            .iloc[:0]
+            .reindex([0])
+            .assign(**{metric: np.NaN for metric in metric_names})
+        )
+
+    def _run_time_offset_query(
+        self,
+        query_object: QueryObject,
+        in_worker_thread: bool,
+        query_object_clone: QueryObject,
+    ) -> QueryResult:
+        """Run the query of a time offset, which can happen in a worker thread"""
+        datasource = self._qc_datasource
+        if in_worker_thread:
+            datasource = merge_into_thread_session(datasource)
+        query_object_clone_dct = query_object_clone.to_dict()
+
+        # When the original query has limit or offset we wont apply those
+        # to the subquery so we prevent data inconsistency due to missing records
+        # in the dataframes when performing the join
+        if query_object.row_limit or query_object.row_offset:
+            query_object_clone_dct["row_limit"] = config["ROW_LIMIT"]
+            query_object_clone_dct["row_offset"] = 0
+
+        if isinstance(datasource, Query):
+            return datasource.exc_query(query_object_clone_dct)
+        return datasource.query(query_object_clone_dct)
+
+    def get_query_concurrency(self) -> int:
+        """The maximum number of queries of the query context that run concurrently"""
+        if database := getattr(self._qc_datasource, "database", None):
+            return database.chart_data_query_concurrency
+        return config["CHART_DATA_QUERY_CONCURRENCY"]
+
+    def _copy_for_worker_thread(
+        self,
+        query_obj: QueryObject,
+    ) -> tuple[QueryContext, QueryObject]:
+        """
+        Copy the query context and a query object for a worker thread.
+
+        The datasource and the chart are merged into the session of the worker, so
+        that their lazy loads don't go through the session of the request.
+        """
+        # pylint: disable=protected-access
+        query_context = copy.copy(self._query_context)
+        query_context.datasource = merge_into_thread_session(query_context.datasource)
+        query_context.slice_ = merge_into_thread_session(query_context.slice_)
+        query_context._processor = QueryContextProcessor(query_context)
+        # the offsets of queries that already run concurrently run one after the
+        # other, so that the thread pools don't nest past the limit of the database
+        query_context._processor._queries_run_concurrently = True
+
+        query_obj = copy.copy(query_obj)
+        query_obj.datasource = merge_into_thread_session(query_obj.datasource)
+        return query_context, query_obj
+
+    def get_time_offset_query_concurrency(self) -> int:
+        """The maximum number of time offset queries that run concurrently"""
+        if self._queries_run_concurrently:
+            return 1
+        if database := getattr(self._qc_datasource, "database", None):
+            return database.time_offset_query_concurrency
+        return config["TIME_OFFSET_QUERY_CONCURRENCY"]
 
     def join_offset_dfs(
         self,
@@ -605,6 +722,55 @@ class QueryContextProcessor:
                 )
         return df
 
+    @staticmethod
+    def generate_join_keys(
+        column: pd.Series,
+        time_grain: str,
+        time_offset: str | None = None,
+    ) -> pd.Series:
+        """
+        Vectorized version of ``generate_join_column`` for datetime columns.
+
+        Instead of formatting each value, values are mapped to integer codes of
+        their period, eg, ``202001`` for ``2020-01`` when the time grain is a month,
+        which are cheaper to compute and to join on.
+
+        :param column: The temporal column
+        :param time_grain: The time grain used to calculate the join keys
+        :param time_offset: The time offset applied to the values
+        :returns: The join keys
+        """
+        if time_offset:
+            column = column + DateOffset(**normalize_time_delta(time_offset))
+
+        if time_grain in (
+            TimeGrain.WEEK_STARTING_SUNDAY,
+            TimeGrain.WEEK_ENDING_SATURDAY,
+        ):
+            # same as `%U`, the week of the year starting on Sunday
+            weekday = (column.dt.dayofweek + 1) % 7
+            return column.dt.year * 100 + (column.dt.dayofyear + 6 - weekday) // 7
+
+        if time_grain in (
+            TimeGrain.WEEK,
+            TimeGrain.WEEK_STARTING_MONDAY,
+            TimeGrain.WEEK_ENDING_SUNDAY,
+        ):
+            # same as `%W`, the week of the year starting on Monday
+            weekday = column.dt.dayofweek
+            return column.dt.year * 100 + (column.dt.dayofyear + 6 - weekday) // 7
+
+        if time_grain == TimeGrain.MONTH:
+            return column.dt.year * 100 + column.dt.month
+
+        if time_grain == TimeGrain.QUARTER:
+            return column.dt.year * 10 + column.dt.quarter
+
+        if time_grain == TimeGrain.YEAR:
+            return column.dt.year
+
+        return column
+
     @staticmethod
     def generate_join_column(
         row: pd.Series,
@@ -644,7 +810,7 @@ class QueryContextProcessor:
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | json.RawJSON | pa.Table:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -662,6 +828,12 @@ class QueryContextProcessor:
                 result = excel.df_to_excel(df, **config["EXCEL_EXPORT"])
             return result or ""
 
+        if self._query_context.result_format == ChartDataResultFormat.ARROW:
+            return arrow.df_to_arrow(df)
+
+        if self._query_context.encode_json_data:
+            return df_to_json(df)
+
         return df.to_dict(orient="records")
 
     def get_payload(
@@ -671,16 +843,27 @@ class QueryContextProcessor:
     ) -> dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
-        # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
+        # Get all the payloads from the QueryObjects, which are independent of each
+        # other and run concurrently
+        concurrency = self.get_query_concurrency()
+        in_worker_thread = concurrency > 1 and len(self._query_context.queries) > 1
+
+        def get_query_result(query_obj: QueryObject) -> dict[str, Any]:
+            query_context = self._query_context
+            if in_worker_thread:
+                query_context, query_obj = self._copy_for_worker_thread(query_obj)
+            return get_query_results(
+                query_obj.result_type or query_context.result_type,
+                query_context,
                 query_obj,
                 force_cached,
             )
-            for query_obj in self._query_context.queries
-        ]
+
+        query_results = map_with_flask_context(
+            get_query_result,
+            self._query_context.queries,
+            max_workers=concurrency,
+        )
         return_value = {"queries": query_results}
 
         if cache_query_context:
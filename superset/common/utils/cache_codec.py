@@ -0,0 +1,194 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import pickle
+from typing import Any, Optional, TYPE_CHECKING
+
+import pyarrow as pa
+from pandas import DataFrame
+
+if TYPE_CHECKING:
+    from superset.stats_logger import BaseStatsLogger
+
+logger = logging.getLogger(__name__)
+
+# key of the cached value holding the encoded DataFrame, replacing `df`
+ENCODED_DF_KEY = "df_encoded"
+
+
+class DataFrameCodec:
+    """
+    Serialize the DataFrames of query results stored in the data cache.
+    """
+
+    name = ""
+
+    def encode(self, df: DataFrame) -> bytes:
+        raise NotImplementedError()
+
+    def decode(self, data: bytes) -> DataFrame:
+        raise NotImplementedError()
+
+
+class PickleDataFrameCodec(DataFrameCodec):
+    name = "pickle"
+
+    def encode(self, df: DataFrame) -> bytes:
+        return pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> DataFrame:
+        return pickle.loads(data)
+
+
+class ArrowDataFrameCodec(DataFrameCodec):
+    """
+    Store DataFrames as (optionally compressed) Arrow IPC streams.
+
+    The codec raises `ValueError` for DataFrames that can't be converted to Arrow
+    without changing their values, eg, object columns holding lists or a mix of
+    integers and nulls, which would be read back as arrays or floats.
+    """
+
+    name = "arrow"
+
+    def __init__(self, compression: Optional[str] = "zstd") -> None:
+        self.compression = compression
+
+    @staticmethod
+    def _is_lossless(table: pa.Table, df: DataFrame) -> bool:
+        for field, dtype in zip(table.schema, df.dtypes):
+            if dtype == object and not (
+                pa.types.is_string(field.type)
+                or pa.types.is_large_string(field.type)
+                or pa.types.is_binary(field.type)
+                or pa.types.is_large_binary(field.type)
+                or pa.types.is_decimal(field.type)
+                or pa.types.is_date(field.type)
+                or pa.types.is_boolean(field.type)
+                or pa.types.is_null(field.type)
+            ):
+                return False
+        return True
+
+    def encode(self, df: DataFrame) -> bytes:
+        try:
+            table = pa.Table.from_pandas(df)
+        except pa.ArrowException as ex:
+            raise ValueError(str(ex)) from ex
+
+        if not self._is_lossless(table, df):
+            raise ValueError("The DataFrame can't be converted to Arrow losslessly")
+
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def decode(self, data: bytes) -> DataFrame:
+        return pa.ipc.open_stream(data).read_all().to_pandas()
+
+
+CODECS: dict[str, type[DataFrameCodec]] = {
+    codec.name: codec for codec in (PickleDataFrameCodec, ArrowDataFrameCodec)
+}
+
+
+def get_codec(codec_config: dict[str, Any]) -> DataFrameCodec | None:
+    """
+    Return the codec configured in `DATA_CACHE_CODEC_CONFIG`, if any.
+    """
+    if not (name := codec_config.get("CODEC")):
+        return None
+    if name == ArrowDataFrameCodec.name:
+        return ArrowDataFrameCodec(codec_config.get("COMPRESSION"))
+    return CODECS[name]()
+
+
+def encode_cache_value(
+    value: dict[str, Any],
+    codec_config: dict[str, Any],
+    stats_logger: BaseStatsLogger,
+    region: str,
+) -> dict[str, Any] | None:
+    """
+    Encode the DataFrame of a value before it's stored in the data cache.
+
+    DataFrames smaller than `MIN_SIZE` bytes in memory are stored as is, while larger
+    ones are encoded with the configured codec, falling back to pickle when the codec
+    can't encode them. The raw and encoded sizes are reported to the stats logger per
+    cache region.
+
+    :param value: The value to be cached
+    :param codec_config: The `DATA_CACHE_CODEC_CONFIG` settings
+    :param stats_logger: The stats logger
+    :param region: The cache region
+    :returns: The value to cache, or None if it's larger than `MAX_SIZE` bytes
+    """
+    df = value.get("df")
+    if not isinstance(df, DataFrame):
+        return value
+
+    prefix = f"cache_codec.{region}"
+    raw_size = int(df.memory_usage(index=True, deep=True).sum())
+    stats_logger.gauge(f"{prefix}.raw_bytes", raw_size)
+
+    size = raw_size
+    codec = get_codec(codec_config)
+    if codec and raw_size >= codec_config.get("MIN_SIZE", 0):
+        try:
+            data = codec.encode(df)
+        except ValueError as ex:
+            logger.debug("Unable to encode DataFrame with %s: %s", codec.name, ex)
+            codec = PickleDataFrameCodec()
+            data = codec.encode(df)
+
+        size = len(data)
+        stats_logger.incr(f"{prefix}.{codec.name}")
+        stats_logger.gauge(f"{prefix}.encoded_bytes", size)
+        value = {
+            **value,
+            "df": None,
+            ENCODED_DF_KEY: {"codec": codec.name, "data": data},
+        }
+    else:
+        stats_logger.incr(f"{prefix}.raw")
+
+    if (max_size := codec_config.get("MAX_SIZE")) and size > max_size:
+        logger.warning(
+            "Not caching a value of %d bytes, larger than the %d bytes limit",
+            size,
+            max_size,
+        )
+        stats_logger.incr(f"{prefix}.too_large")
+        return None
+
+    return value
+
+
+def decode_cache_value(value: dict[str, Any]) -> dict[str, Any]:
+    """
+    Decode the DataFrame of a value read from the data cache.
+    """
+    if not (encoded := value.get(ENCODED_DF_KEY)):
+        return value
+
+    decoded = {key: item for key, item in value.items() if key != ENCODED_DF_KEY}
+    decoded["df"] = CODECS[encoded["codec"]]().decode(encoded["data"])
+    return decoded
@@ -17,6 +17,11 @@
 from __future__ import annotations
 
 import logging
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, ExitStack
+from datetime import timedelta
 from typing import Any
 
 from flask_caching import Cache
@@ -24,8 +29,13 @@ from pandas import DataFrame
 
 from superset import app
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.cache_codec import decode_cache_value, encode_cache_value
 from superset.constants import CacheRegion
-from superset.exceptions import CacheLoadError
+from superset.distributed_lock import KeyValueDistributedLock
+from superset.exceptions import (
+    CacheLoadError,
+    CreateKeyValueDistributedLockFailedException,
+)
 from superset.extensions import cache_manager
 from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
@@ -42,6 +52,23 @@ _cache: dict[CacheRegion, Cache] = {
     CacheRegion.DATA: cache_manager.data_cache,
 }
 
+SINGLE_FLIGHT_DEFAULTS: dict[str, Any] = {
+    "LOCK_BACKEND": "cache",
+    "LOCK_TIMEOUT": 300,
+    "WAIT_TIMEOUT": 60,
+    "POLL_INTERVAL": 0.5,
+    "STALE_TIMEOUT": 0,
+}
+
+
+def get_single_flight_config(region: CacheRegion) -> dict[str, Any] | None:
+    """
+    Return the single-flight settings of a cache region, or None if it's disabled
+    """
+    if (settings := config["CACHE_SINGLE_FLIGHT_CONFIG"].get(region)) is None:
+        return None
+    return {**SINGLE_FLIGHT_DEFAULTS, **settings}
+
 
 class QueryCacheManager:
     """
@@ -65,6 +92,7 @@ class QueryCacheManager:
         cache_dttm: str | None = None,
         cache_value: dict[str, Any] | None = None,
         sql_rowcount: int | None = None,
+        stale_value: dict[str, Any] | None = None,
     ) -> None:
         self.df = df
         self.query = query
@@ -81,6 +109,7 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
         self.sql_rowcount = sql_rowcount
+        self.stale_value = stale_value
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -154,37 +183,14 @@ class QueryCacheManager:
 
         if cache_value := _cache[region].get(key):
             logger.debug("Cache key: %s", key)
-            stats_logger.incr("loading_from_cache")
-            try:
-                query_cache.df = cache_value["df"]
-                query_cache.query = cache_value["query"]
-                query_cache.annotation_data = cache_value.get("annotation_data", {})
-                query_cache.applied_template_filters = cache_value.get(
-                    "applied_template_filters", []
-                )
-                query_cache.applied_filter_columns = cache_value.get(
-                    "applied_filter_columns", []
-                )
-                query_cache.rejected_filter_columns = cache_value.get(
-                    "rejected_filter_columns", []
-                )
-                query_cache.status = QueryStatus.SUCCESS
-                query_cache.is_loaded = True
-                query_cache.is_cached = cache_value is not None
-                query_cache.sql_rowcount = cache_value.get("sql_rowcount", None)
-                query_cache.cache_dttm = (
-                    cache_value["dttm"] if cache_value is not None else None
-                )
-                query_cache.cache_value = cache_value
-                stats_logger.incr("loaded_from_cache")
-            except KeyError as ex:
-                logger.exception(ex)
-                logger.error(
-                    "Error reading cache: %s",
-                    error_msg_from_exception(ex),
-                    exc_info=True,
-                )
-            logger.debug("Serving from cache")
+            if cache_value.get("stale_after", float("inf")) < time.time():
+                # kept past its timeout to be served while the value is refreshed
+                query_cache.stale_value = cache_value
+            else:
+                query_cache.load_cache_value(cache_value)
+
+        if force_cached and not query_cache.is_loaded and query_cache.stale_value:
+            query_cache.load_cache_value(query_cache.stale_value)
 
         if force_cached and not query_cache.is_loaded:
             logger.warning(
@@ -193,6 +199,39 @@ class QueryCacheManager:
             raise CacheLoadError("Error loading data from cache")
         return query_cache
 
+    def load_cache_value(self, cache_value: dict[str, Any]) -> None:
+        """
+        Load a value read from the cache
+        """
+        stats_logger.incr("loading_from_cache")
+        try:
+            cache_value = decode_cache_value(cache_value)
+            self.df = cache_value["df"]
+            self.query = cache_value["query"]
+            self.annotation_data = cache_value.get("annotation_data", {})
+            self.applied_template_filters = cache_value.get(
+                "applied_template_filters", []
+            )
+            self.applied_filter_columns = cache_value.get("applied_filter_columns", [])
+            self.rejected_filter_columns = cache_value.get(
+                "rejected_filter_columns", []
+            )
+            self.status = QueryStatus.SUCCESS
+            self.is_loaded = True
+            self.is_cached = cache_value is not None
+            self.sql_rowcount = cache_value.get("sql_rowcount", None)
+            self.cache_dttm = cache_value["dttm"] if cache_value is not None else None
+            self.cache_value = cache_value
+            stats_logger.incr("loaded_from_cache")
+        except KeyError as ex:
+            logger.exception(ex)
+            logger.error(
+                "Error reading cache: %s",
+                error_msg_from_exception(ex),
+                exc_info=True,
+            )
+        logger.debug("Serving from cache")
+
     @staticmethod
     def set(
         key: str | None,
@@ -204,8 +243,139 @@ class QueryCacheManager:
         """
         set value to specify cache region, proxy for `set_and_log_cache`
         """
-        if key:
-            set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
+        if not key:
+            return
+
+        settings = get_single_flight_config(region)
+        if settings and settings["STALE_TIMEOUT"]:
+            if timeout is None:
+                timeout = config["CACHE_DEFAULT_TIMEOUT"]
+            if timeout and timeout > 0:
+                value = {**value, "stale_after": time.time() + timeout}
+                timeout += settings["STALE_TIMEOUT"]
+
+        encoded_value = encode_cache_value(
+            value,
+            config["DATA_CACHE_CODEC_CONFIG"],
+            stats_logger,
+            region,
+        )
+        if encoded_value is not None:
+            set_and_log_cache(
+                _cache[region], key, encoded_value, timeout, datasource_uid
+            )
+
+    @classmethod
+    @contextmanager
+    def single_flight(
+        cls,
+        key: str,
+        region: CacheRegion = CacheRegion.DEFAULT,
+        stale: QueryCacheManager | None = None,
+        force_query: bool | None = False,
+    ) -> Iterator[QueryCacheManager | None]:
+        """
+        De-duplicate the computation of a value missing from the cache across workers.
+
+        Yields None when the caller should compute and cache the value itself, in
+        which case the lock for the key is held until the context exits, even if it
+        raises. Otherwise yields the value loaded from the cache once another worker
+        has computed it, or the stale value of the key, if any, while another worker
+        refreshes it.
+        """
+        settings = get_single_flight_config(region)
+        if not settings or force_query:
+            yield None
+            return
+
+        with cls._lock(key, region, settings) as acquired:
+            if acquired:
+                yield cls._get_after_lock(key, region)
+                return
+
+        if stale and stale.stale_value:
+            stats_logger.incr("single_flight.stale")
+            stale.load_cache_value(stale.stale_value)
+            yield stale
+            return
+
+        stats_logger.incr("single_flight.wait")
+        deadline = time.monotonic() + settings["WAIT_TIMEOUT"]
+        while time.monotonic() < deadline:
+            time.sleep(settings["POLL_INTERVAL"])
+            query_cache = cls.get(key, region)
+            if query_cache.is_loaded:
+                stats_logger.incr("single_flight.hit")
+                yield query_cache
+                return
+
+            # the lock is released without a value being cached if the query failed
+            with cls._lock(key, region, settings) as acquired:
+                if acquired:
+                    yield cls._get_after_lock(key, region)
+                    return
+
+        logger.warning("Timed out waiting for the value of cache key %s", key)
+        stats_logger.incr("single_flight.timeout")
+        yield None
+
+    @classmethod
+    def _get_after_lock(
+        cls,
+        key: str,
+        region: CacheRegion,
+    ) -> QueryCacheManager | None:
+        """
+        Return the value cached by the worker that held the lock before, if any.
+
+        A worker can cache the value and release the lock between the caller's cache
+        miss and the lock being acquired, in which case the value isn't recomputed.
+        """
+        query_cache = cls.get(key, region)
+        if query_cache.is_loaded:
+            stats_logger.incr("single_flight.hit")
+            return query_cache
+        return None
+
+    @staticmethod
+    @contextmanager
+    def _lock(
+        key: str,
+        region: CacheRegion,
+        settings: dict[str, Any],
+    ) -> Iterator[bool]:
+        """
+        Try to acquire the single-flight lock of a cache key, without blocking
+        """
+        if settings["LOCK_BACKEND"] == "key_value":
+            with ExitStack() as stack:
+                try:
+                    stack.enter_context(
+                        KeyValueDistributedLock(
+                            namespace="query_cache",
+                            lock_expiration=timedelta(seconds=settings["LOCK_TIMEOUT"]),
+                            region=str(region),
+                            key=key,
+                        )
+                    )
+                except CreateKeyValueDistributedLockFailedException:
+                    yield False
+                    return
+                yield True
+            return
+
+        # `add` is atomic on the backends that support it, eg, `SET NX` on Redis
+        cache = _cache[region]
+        lock_key = f"{key}__lock"
+        token = str(uuid.uuid4())
+        if not cache.add(lock_key, token, timeout=settings["LOCK_TIMEOUT"]):
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
 
     @staticmethod
     def delete(
@@ -82,6 +82,14 @@ STATS_LOGGER = DummyStatsLogger()
 # Note that you can use `StdOutEventLogger` for debugging
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
+# Note that `BufferedDBEventLogger` writes the logs in batches from a background
+# thread, so that requests don't wait on the metadata database, eg:
+# EVENT_LOGGER = BufferedDBEventLogger(
+#     max_queue_size=10000,
+#     batch_size=500,
+#     flush_interval=1.0,
+#     overflow="drop",  # or "block", to wait for `block_timeout` seconds when full
+# )
 EVENT_LOGGER = DBEventLogger()
 
 SUPERSET_LOG_VIEW = True
@@ -163,6 +171,17 @@ FILTER_SELECT_ROW_LIMIT = 10000
 # default time filter in explore
 # values may be "Last day", "Last week", "<ISO date> : now", etc.
 DEFAULT_TIME_FILTER = NO_TIME_RANGE
+# max number of time comparison queries of a chart that run concurrently, which can
+# be overridden per database with `time_offset_query_concurrency` in its extra
+# attributes; set to 1 to run them one after the other
+TIME_OFFSET_QUERY_CONCURRENCY = 4
+# max number of queries of a chart data request (eg, a table and its totals) that run
+# concurrently, which can be overridden per database with
+# `chart_data_query_concurrency` in its extra attributes; set to 1 to run them one
+# after the other. When the queries run concurrently their time comparison queries
+# run one after the other, so that a request never runs more queries at once than
+# the largest of the two limits
+CHART_DATA_QUERY_CONCURRENCY = 4
 
 # This is an important setting, and should be lower than your
 # [load balancer / proxy / envoy / kong / ...] timeout settings.
@@ -562,6 +581,11 @@ DEFAULT_FEATURE_FLAGS: dict[str, bool] = {
     # If on, you'll want to add "https://avatars.slack-edge.com" to the list of allowed
     # domains in your TALISMAN_CONFIG
     "SLACK_ENABLE_AVATARS": False,
+    # Store the schemas, tables and columns of the databases in the metadata database,
+    # and serve the table selectors and table metadata from it instead of inspecting the
+    # databases on every request. The catalog is refreshed in the background by the
+    # `metadata_catalog.refresh` Celery task, see `METADATA_CATALOG_REFRESH_INTERVAL`.
+    "METADATA_CATALOG": False,
 }
 
 # ------------------------------
@@ -586,6 +610,30 @@ SSH_TUNNEL_TIMEOUT_SEC = 10.0
 #: Timeout (seconds) for transport socket (``socket.settimeout``)
 SSH_TUNNEL_PACKET_TIMEOUT_SEC = 1.0
 
+# ----------------------------------------------------------------------
+# Engine pooling
+# ----------------------------------------------------------------------
+# By default a new SQLAlchemy engine (with a ``NullPool``) is created every time a
+# database is queried, so each query pays for a full connection handshake. When
+# enabled, engines are kept in a process-local registry keyed by the resolved
+# connection parameters (URL, effective user, OAuth2 token and SSH tunnel) and reuse
+# their pooled connections. Engines are evicted in LRU order and recreated after
+# ``DB_ENGINE_POOL_TTL`` seconds, or when the database or its SSH tunnel change.
+DB_ENGINE_POOL_ENABLED = False
+#: Maximum number of engines kept per process
+DB_ENGINE_POOL_MAX_ENGINES = 100
+#: Time (seconds) after which an engine is disposed and recreated
+DB_ENGINE_POOL_TTL = 3600
+#: Arguments passed to ``create_engine`` for pooled engines; these are overridden by
+#: the ``engine_params`` of each database. ``pool_size`` and ``max_overflow`` are
+#: only applied to dialects that use a ``QueuePool``.
+DB_ENGINE_POOL_PARAMS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
 
 # Feature flags may also be set via 'SUPERSET_FEATURE_' prefixed environment vars.
 DEFAULT_FEATURE_FLAGS.update(
@@ -771,6 +819,64 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Single-flight de-duplication of identical queries missing the cache, per cache region
+# (see `CacheRegion`, eg, "data"). When a region is configured, only the worker
+# holding the lock of a cache key runs the query, while the others wait for its
+# result, polling the cache every `POLL_INTERVAL` seconds for up to `WAIT_TIMEOUT`
+# seconds, before running the query themselves. The lock is taken with an atomic
+# `add` on the region's cache backend (`LOCK_BACKEND: "cache"`, eg, `SET NX` on
+# Redis) or in the metastore (`LOCK_BACKEND: "key_value"`, using
+# `KeyValueDistributedLock`), is released when the query ends, even if it fails, and
+# expires after `LOCK_TIMEOUT` seconds otherwise. With a non-zero `STALE_TIMEOUT`,
+# cached values are kept that many seconds past their timeout, and served to the
+# waiting workers while the value is refreshed.
+CACHE_SINGLE_FLIGHT_CONFIG: dict[str, dict[str, Any]] = {
+    # "data": {
+    #     "LOCK_BACKEND": "cache",
+    #     "LOCK_TIMEOUT": 300,
+    #     "WAIT_TIMEOUT": 60,
+    #     "POLL_INTERVAL": 0.5,
+    #     "STALE_TIMEOUT": 0,
+    # },
+}
+
+# Serialization of the DataFrames of query results stored in the cache (DATA_CACHE_CONFIG
+# and CACHE_CONFIG). DataFrames taking at least `MIN_SIZE` bytes in memory are encoded
+# with `CODEC`: "arrow" stores them as Arrow IPC streams compressed with `COMPRESSION`
+# ("zstd", "lz4" or None), falling back to "pickle" for DataFrames that Arrow can't
+# represent losslessly. Smaller DataFrames, or all of them when `CODEC` is None, are
+# stored as is. Values larger than `MAX_SIZE` bytes once encoded, eg, the maximum
+# value size of the cache backend, are not cached. The raw and encoded sizes are
+# reported to the stats logger per cache region.
+DATA_CACHE_CODEC_CONFIG: dict[str, Any] = {
+    "CODEC": "arrow",
+    "COMPRESSION": "zstd",
+    "MIN_SIZE": 64 * 1024,
+    "MAX_SIZE": None,
+}
+
+# Timeout (seconds) of the row level security filters resolved for a set of roles and
+# a table, stored in the default cache. Cached filters are invalidated whenever RLS
+# filters, their roles or their tables are modified.
+RLS_FILTERS_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
+# Timeout (seconds) of the permission matrices, ie, the (permission, view menu) pairs
+# granted by each role, stored in the default cache and used for access checks.
+# Cached matrices are invalidated whenever roles, permissions or view menus are
+# modified. Without a shared cache the matrices are only cached per request.
+PERMISSIONS_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
+# Timeout (seconds) of the datasets of a dashboard, trimmed to the data needed by its
+# charts, stored in the default cache. Cached datasets are keyed by the last time the
+# dashboard, its charts, its datasets or their databases were changed. Set to None to
+# disable the cache.
+DASHBOARD_DATASETS_CACHE_TIMEOUT: int | None = int(timedelta(days=1).total_seconds())
+
+# Minimum time between two refreshes of the tables of a schema, or of the columns of a
+# table, stored in the metadata catalog (see the `METADATA_CATALOG` feature flag). The
+# `metadata_catalog.refresh` Celery task refreshes the entries older than this.
+METADATA_CATALOG_REFRESH_INTERVAL = timedelta(hours=6)
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -780,9 +886,12 @@ FILTER_STATE_CACHE_CONFIG: CacheConfig = {
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=90).total_seconds()),
     # Should the timeout be reset when retrieving a cached value?
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
-    # The following parameter only applies to `MetastoreCache`:
+    # The following parameters only apply to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # For how many seconds should values read from the metastore be kept in-process
+    # for hot keys? Values changed by other processes may be stale for that long.
+    "LOCAL_CACHE_TIMEOUT": 0,
 }
 
 # Cache for explore form data state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
@@ -794,9 +903,12 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=7).total_seconds()),
     # Should the timeout be reset when retrieving a cached value?
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
-    # The following parameter only applies to `MetastoreCache`:
+    # The following parameters only apply to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # For how many seconds should values read from the metastore be kept in-process
+    # for hot keys? Values changed by other processes may be stale for that long.
+    "LOCAL_CACHE_TIMEOUT": 0,
 }
 
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
@@ -844,11 +956,25 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # Optional maximum file size in bytes when uploading a CSV
 CSV_UPLOAD_MAX_SIZE = None
 
+# Number of rows read from uploaded CSV and columnar files and written to the database
+# at a time, which bounds the memory used by uploads. Note that the column types of
+# the table are inferred from the first rows, unless they are set in the upload form.
+UPLOAD_CHUNK_SIZE = 100_000
+
 # CSV Options: key/value pairs that will be passed as argument to DataFrame.to_csv
 # method.
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# Number of rows escaped and written at a time when streaming a CSV export, eg, the
+# SQL Lab results download.
+CSV_EXPORT_CHUNK_SIZE = 100_000
+
+# Compression of the buffers of chart data and SQL Lab results requested with the
+# Arrow result format, either "lz4", "zstd" or None. Note that the clients need to
+# support the codec to decompress them.
+ARROW_IPC_COMPRESSION: Literal["lz4", "zstd"] | None = None
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -1029,6 +1155,18 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
             "task": "reports.prune_log",
             "schedule": crontab(minute=0, hour=0),
         },
+        # deletes the expired entries of the key-value table, eg, of the metastore
+        # cache, which are otherwise never deleted
+        "prune_key_value": {
+            "task": "prune_key_value",
+            "schedule": crontab(minute=0, hour="*"),
+        },
+        # refreshes the stale entries of the metadata catalog, when the
+        # `METADATA_CATALOG` feature flag is enabled
+        "metadata_catalog.refresh": {
+            "task": "metadata_catalog.refresh",
+            "schedule": crontab(minute=30, hour="*"),
+        },
         # Uncomment to enable pruning of the query table
         # "prune_query": {
         #     "task": "prune_query",
@@ -1040,6 +1178,19 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
 
 CELERY_CONFIG: type[CeleryConfig] = CeleryConfig
 
+# Charts warmed up in-process by cache warm up strategies (eg, "predictive") take one
+# of `CACHE_WARMUP_DATABASE_CONCURRENCY` slots of their database, so warm ups don't
+# compete with interactive traffic; the limit can be overridden per database with
+# `cache_warmup_concurrency` in its extra attributes. Slots are shared through the
+# default cache (`CACHE_CONFIG`), and expire after `CACHE_WARMUP_SLOT_TIMEOUT`
+# seconds. Warm ups that can't take a slot are retried after
+# `CACHE_WARMUP_RETRY_DELAY` seconds. The "predictive" strategy also stores the time
+# of the last warm up of each chart in the data cache (`DATA_CACHE_CONFIG`), so it
+# requires a persistent backend, eg, Redis, rather than the default `NullCache`.
+CACHE_WARMUP_DATABASE_CONCURRENCY = 1
+CACHE_WARMUP_SLOT_TIMEOUT = int(timedelta(minutes=10).total_seconds())
+CACHE_WARMUP_RETRY_DELAY = int(timedelta(minutes=1).total_seconds())
+
 # Set celery config to None to disable all the above configuration
 # CELERY_CONFIG = None
 
@@ -1143,6 +1294,12 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Number of rows per chunk of the SQL Lab results stored in the results backend with
+# PyArrow and MessagePack. Each chunk is compressed and stored on its own, so that
+# a page of the results or a CSV export only reads the chunks it needs. Set to None
+# to store the results as a single blob.
+RESULTS_BACKEND_CHUNK_SIZE: int | None = 10_000
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1274,6 +1431,17 @@ DB_POLL_INTERVAL_SECONDS: dict[str, int] = {}
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # pylint: disable=line-too-long,useless-suppression
 PRESTO_POLL_INTERVAL = int(timedelta(seconds=1).total_seconds())
 
+# Minimum interval, in seconds, between writes of the progress of a running Presto or
+# Trino query (splits, rows and bytes processed) to the metadata database
+PRESTO_PROGRESS_UPDATE_INTERVAL = 5
+
+# Maximum number of threads of the pool running Trino queries in each process. The
+# Trino client blocks until the query returns its first rows, so the queries are
+# executed in this pool while the calling thread tracks their progress. Queries
+# beyond this limit wait for a thread to be available, and are cancelled without
+# running if they're stopped in the meantime.
+TRINO_EXECUTOR_MAX_WORKERS = 100
+
 # Allow list of custom authentications for each DB engine.
 # Example:
 # from your.module import AuthClass
@@ -1717,6 +1885,12 @@ GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws"] = "polling"
 GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
+# When set, requests polling for async events wait for up to this many milliseconds
+# for new events on the server (long polling) instead of returning immediately, so
+# that clients are notified as soon as a job is done. Each waiting request holds a
+# web server worker, so this requires async workers (eg, gevent) and a Redis
+# `socket_timeout` longer than the timeout.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = 0
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
 
 # Embedded config options
@@ -1774,6 +1948,12 @@ ADVANCED_DATA_TYPES: dict[str, AdvancedDataType] = {
     "port": internet_port,
 }
 
+# When an IN / NOT IN filter on an internet address column still has more than this
+# number of IP addresses and ranges once they are merged, it is compiled as an EXISTS
+# against a VALUES list of ranges instead of one predicate per range. This requires
+# support for VALUES lists with column aliases, eg, Trino, Presto or PostgreSQL.
+INTERNET_ADDRESS_VALUES_THRESHOLD: int | None = None
+
 # By default, the Welcome page features all charts and dashboards the user has access
 # to. This can be changed to show only examples, or a custom view
 # by providing the title and a FAB filter:
@@ -22,9 +22,10 @@ import dataclasses
 import logging
 import re
 from collections import defaultdict
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import chain
 from typing import Any, Callable, cast, Optional, Union
 
 import dateutil.parser
@@ -62,6 +63,7 @@ from sqlalchemy.orm import (
     reconstructor,
     relationship,
     RelationshipProperty,
+    Session,
 )
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.schema import UniqueConstraint
@@ -345,15 +347,14 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
     @property
     def order_by_choices(self) -> list[tuple[str, str]]:
         choices = []
+        asc, desc = __("[asc]"), __("[desc]")
         # self.column_names return sorted column_names
         for column_name in self.column_names:
             column_name = str(column_name or "")
-            choices.append(
-                (json.dumps([column_name, True]), f"{column_name} " + __("[asc]"))
-            )
-            choices.append(
-                (json.dumps([column_name, False]), f"{column_name} " + __("[desc]"))
-            )
+            # same as `json.dumps([column_name, ascending])`, encoding the name once
+            encoded_name = json.dumps(column_name)
+            choices.append((f"[{encoded_name}, true]", f"{column_name} {asc}"))
+            choices.append((f"[{encoded_name}, false]", f"{column_name} {desc}"))
         return choices
 
     @property
@@ -370,6 +371,24 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
     @property
     def data(self) -> dict[str, Any]:
         """Data representation of the datasource sent to the frontend"""
+        return {
+            **self.attributes_data,
+            "database": self.database.data,  # pylint: disable=no-member
+            # one to many
+            "columns": [o.data for o in self.columns],
+            "metrics": [o.data for o in self.metrics],
+            # TODO deprecate, move logic to JS
+            "order_by_choices": self.order_by_choices,
+            "verbose_map": self.verbose_map,
+            "select_star": self.select_star,
+        }
+
+    @property
+    def attributes_data(self) -> dict[str, Any]:
+        """
+        The data representation without the columns, metrics, verbose names and order
+        by choices, nor the database
+        """
         return {
             # simple fields
             "id": self.id,
@@ -377,7 +396,6 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             "column_formats": self.column_formats,
             "currency_formats": self.currency_formats,
             "description": self.description,
-            "database": self.database.data,  # pylint: disable=no-member
             "default_endpoint": self.default_endpoint,
             "filter_select": self.filter_select_enabled,  # TODO deprecate
             "filter_select_enabled": self.filter_select_enabled,
@@ -394,14 +412,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             "edit_url": self.url,
             # sqla-specific
             "sql": self.sql,
-            # one to many
-            "columns": [o.data for o in self.columns],
-            "metrics": [o.data for o in self.metrics],
-            # TODO deprecate, move logic to JS
-            "order_by_choices": self.order_by_choices,
             "owners": [owner.id for owner in self.owners],
-            "verbose_map": self.verbose_map,
-            "select_star": self.select_star,
         }
 
     def data_for_slices(  # pylint: disable=too-many-locals
@@ -411,9 +422,16 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
         The representation of the datasource containing only the required data
         to render the provided slices.
 
-        Used to reduce the payload when loading a dashboard.
+        Used to reduce the payload when loading a dashboard, so only the columns and
+        metrics used by the slices are serialized.
         """
-        data = self.data
+        data = {
+            **self.attributes_data,
+            "database": self.database.short_data,  # pylint: disable=no-member
+            "order_by_choices": self.order_by_choices,
+            "select_star": self.select_star,
+        }
+        del data["description"]
         metric_names = set()
         column_names = set()
         for slc in slices:
@@ -470,22 +488,21 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
                 column_names.update(_columns)
 
         filtered_metrics = [
-            metric
-            for metric in data["metrics"]
-            if metric["metric_name"] in metric_names
+            metric.data for metric in self.metrics if metric.metric_name in metric_names
         ]
 
-        filtered_columns: list[Column] = []
+        filtered_columns: list[dict[str, Any]] = []
         column_types: set[utils.GenericDataType] = set()
-        for column_ in data["columns"]:
-            generic_type = column_.get("type_generic")
+        db_engine_spec = self.database.db_engine_spec  # pylint: disable=no-member
+        db_extra = self.database.get_extra()  # pylint: disable=no-member
+        for column_ in self.columns:
+            generic_type = column_.get_type_generic(db_engine_spec, db_extra)
             if generic_type is not None:
                 column_types.add(generic_type)
-            if column_["column_name"] in column_names:
-                filtered_columns.append(column_)
+            if column_.column_name in column_names:
+                filtered_columns.append(column_.data)
 
         data["column_types"] = list(column_types)
-        del data["description"]
         data.update({"metrics": filtered_metrics})
         data.update({"columns": filtered_columns})
 
@@ -936,12 +953,25 @@ class TableColumn(AuditMixinNullable, ImportExportMixin, CertificationMixin, Mod
         if self.is_dttm:
             return utils.GenericDataType.TEMPORAL
 
+        return self.get_type_generic(self.db_engine_spec, self.db_extra)
+
+    def get_type_generic(
+        self,
+        db_engine_spec: builtins.type[BaseEngineSpec],
+        db_extra: dict[str, Any],
+    ) -> utils.GenericDataType | None:
+        """
+        Return the generic type of the column for a given engine spec and database
+        extra, which are expensive to resolve for each column of a large dataset.
+        """
+        if self.is_dttm:
+            return utils.GenericDataType.TEMPORAL
+
         return (
             column_spec.generic_type
             if (
-                column_spec := self.db_engine_spec.get_column_spec(
-                    self.type,
-                    db_extra=self.db_extra,
+                column_spec := db_engine_spec.get_column_spec(
+                    self.type, db_extra=db_extra
                 )
             )
             else None
@@ -1412,8 +1442,8 @@ class SqlaTable(
         return [(g.duration, g.name) for g in self.database.grains() or []]
 
     @property
-    def data(self) -> dict[str, Any]:
-        data_ = super().data
+    def attributes_data(self) -> dict[str, Any]:
+        data_ = super().attributes_data
         if self.type == "table":
             data_["granularity_sqla"] = self.granularity_sqla
             data_["time_grain_sqla"] = self.time_grain_sqla
@@ -1948,6 +1978,23 @@ class SqlaTable(
             .one()
         )
 
+    @classmethod
+    def get_eager_sqlatable_datasources(
+        cls, datasource_ids: Iterable[int]
+    ) -> list[SqlaTable]:
+        """Returns SqlaTables with their columns, metrics, database and owners."""
+        return (
+            db.session.query(cls)
+            .options(
+                sa.orm.subqueryload(cls.columns),
+                sa.orm.subqueryload(cls.metrics),
+                sa.orm.subqueryload(cls.owners),
+                sa.orm.joinedload(cls.database),
+            )
+            .filter(cls.id.in_(datasource_ids))
+            .all()
+        )
+
     @classmethod
     def get_all_datasources(cls) -> list[SqlaTable]:
         qry = db.session.query(cls)
@@ -2141,3 +2188,71 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+
+def flag_rls_filters_changes(session: Session, _flush_context: Any) -> None:
+    """
+    Flag the session when RLS filters, or the roles and tables they reference, were
+    modified, so that the cached filters are invalidated once the changes are
+    committed. Changes to the ``RLSFilterRoles`` and ``RLSFilterTables`` association
+    tables show up as changes to the related filters.
+    """
+    if any(
+        isinstance(obj, RowLevelSecurityFilter)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ) or any(
+        isinstance(obj, (security_manager.role_model, SqlaTable))
+        for obj in session.deleted
+    ):
+        session.info["rls_filters_changed"] = True
+
+
+def invalidate_rls_filters(session: Session) -> None:
+    if session.info.pop("rls_filters_changed", False):
+        security_manager.bump_rls_filters_version()
+
+
+def discard_rls_filters_changes(session: Session, _transaction: Any) -> None:
+    session.info.pop("rls_filters_changed", None)
+
+
+def flag_permissions_changes(session: Session, _flush_context: Any) -> None:
+    """
+    Flag the session when roles, permissions or view menus were modified, so that the
+    cached permission matrices are invalidated once the changes are committed. Changes
+    to the permissions of a role show up as changes to the role, while renaming or
+    deleting databases and datasets updates their view menus outside of the session.
+    """
+    if any(
+        isinstance(
+            obj,
+            (
+                security_manager.role_model,
+                security_manager.permission_model,
+                security_manager.viewmenu_model,
+                security_manager.permissionview_model,
+            ),
+        )
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ) or any(
+        isinstance(obj, (Database, SqlaTable))
+        for obj in chain(session.dirty, session.deleted)
+    ):
+        session.info["permissions_changed"] = True
+
+
+def invalidate_permissions(session: Session) -> None:
+    if session.info.pop("permissions_changed", False):
+        security_manager.bump_permissions_version()
+
+
+def discard_permissions_changes(session: Session, _transaction: Any) -> None:
+    session.info.pop("permissions_changed", None)
+
+
+sa.event.listen(Session, "after_flush", flag_rls_filters_changes)
+sa.event.listen(Session, "after_commit", invalidate_rls_filters)
+sa.event.listen(Session, "after_soft_rollback", discard_rls_filters_changes)
+sa.event.listen(Session, "after_flush", flag_permissions_changes)
+sa.event.listen(Session, "after_commit", invalidate_permissions)
+sa.event.listen(Session, "after_soft_rollback", discard_permissions_changes)
@@ -20,7 +20,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from flask import g
+from flask import current_app, g
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 
 from superset import is_feature_enabled, security_manager
@@ -32,7 +32,7 @@ from superset.commands.dashboard.exceptions import (
 from superset.daos.base import BaseDAO
 from superset.dashboards.filters import DashboardAccessFilter, is_uuid
 from superset.exceptions import SupersetSecurityException
-from superset.extensions import db
+from superset.extensions import cache_manager, db
 from superset.models.core import FavStar, FavStarClassName
 from superset.models.dashboard import Dashboard, id_or_slug_filter
 from superset.models.embedded_dashboard import EmbeddedDashboard
@@ -77,8 +77,40 @@ class DashboardDAO(BaseDAO[Dashboard]):
 
     @staticmethod
     def get_datasets_for_dashboard(id_or_slug: str) -> list[Any]:
+        """
+        Get the datasets of a dashboard, trimmed to the data needed by its charts.
+
+        The datasets are cached for ``DASHBOARD_DATASETS_CACHE_TIMEOUT`` seconds under
+        a key including the last time the dashboard, its charts, its datasets or their
+        databases were changed, so that any change to them results in a new payload.
+
+        :param id_or_slug: The ID or slug of the dashboard.
+        :returns: The trimmed datasets of the dashboard.
+        """
         dashboard = DashboardDAO.get_by_id_or_slug(id_or_slug)
-        return dashboard.datasets_trimmed_for_slices()
+        timeout = current_app.config["DASHBOARD_DATASETS_CACHE_TIMEOUT"]
+        if timeout is None:
+            return dashboard.datasets_trimmed_for_slices()
+
+        # unlike the last modified headers, the key keeps the microseconds, so that
+        # changes made within the same second result in a new payload
+        changed_on = [dashboard.changed_on] + [
+            slc.changed_on for slc in dashboard.slices
+        ]
+        for datasource in dashboard.datasources:
+            changed_on.append(datasource.changed_on)
+            if database := getattr(datasource, "database", None):
+                changed_on.append(database.changed_on)
+        last_changed_on = max(
+            (dttm for dttm in changed_on if dttm), default=datetime.min
+        )
+        cache_key = f"dashboard:{dashboard.id}:datasets:{last_changed_on.isoformat()}"
+        datasets = cache_manager.cache.get(cache_key)
+        if datasets is None:
+            datasets = dashboard.datasets_trimmed_for_slices()
+            cache_manager.cache.set(cache_key, datasets, timeout=timeout)
+
+        return datasets
 
     @staticmethod
     def get_tabs_for_dashboard(id_or_slug: str) -> dict[str, Any]:
@@ -21,7 +21,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, select
 
 from superset import db
 from superset.daos.base import BaseDAO
@@ -36,6 +36,9 @@ from superset.utils.core import get_user_id
 
 logger = logging.getLogger(__name__)
 
+# number of keys per IN clause, as SQLite has a limit of 999 variables per statement
+KEYS_BATCH_SIZE = 500
+
 
 class KeyValueDAO(BaseDAO[KeyValueEntry]):
     @staticmethod
@@ -46,6 +49,23 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
         filter_ = get_filter(resource, key)
         return db.session.query(KeyValueEntry).filter_by(**filter_).first()
 
+    @staticmethod
+    def get_entries(
+        resource: KeyValueResource,
+        keys: list[UUID],
+    ) -> dict[UUID, KeyValueEntry]:
+        """
+        Get the entries of many keys, with a single query per batch of keys.
+        """
+        entries: dict[UUID, KeyValueEntry] = {}
+        for i in range(0, len(keys), KEYS_BATCH_SIZE):
+            query = db.session.query(KeyValueEntry).filter(
+                KeyValueEntry.resource == resource.value,
+                KeyValueEntry.uuid.in_(keys[i : i + KEYS_BATCH_SIZE]),
+            )
+            entries.update((entry.uuid, entry) for entry in query)
+        return entries
+
     @classmethod
     def get_value(
         cls,
@@ -67,6 +87,29 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
 
         return False
 
+    @staticmethod
+    def delete_entries(resource: KeyValueResource, keys: list[UUID]) -> list[UUID]:
+        """
+        Delete the entries of many keys, with a single statement per batch of keys.
+
+        :returns: The keys of the deleted entries
+        """
+        deleted: list[UUID] = []
+        for i in range(0, len(keys), KEYS_BATCH_SIZE):
+            filters = and_(
+                KeyValueEntry.resource == resource.value,
+                KeyValueEntry.uuid.in_(keys[i : i + KEYS_BATCH_SIZE]),
+            )
+            deleted.extend(
+                db.session.execute(select(KeyValueEntry.uuid).where(filters)).scalars()
+            )
+            db.session.execute(
+                delete(KeyValueEntry)
+                .where(filters)
+                .execution_options(synchronize_session=False)
+            )
+        return deleted
+
     @staticmethod
     def delete_expired_entries(resource: KeyValueResource) -> None:
         (
@@ -127,6 +170,32 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
 
         return KeyValueDAO.create_entry(resource, value, codec, key, expires_on)
 
+    @staticmethod
+    def upsert_entries(
+        resource: KeyValueResource,
+        values: dict[UUID, Any],
+        codec: KeyValueCodec,
+        expires_on: datetime | None = None,
+    ) -> list[KeyValueEntry]:
+        """
+        Create or update the entries of many keys, with a single query to fetch the
+        existing entries per batch of keys.
+        """
+        existing = KeyValueDAO.get_entries(resource, list(values))
+        entries = []
+        for key, value in values.items():
+            if entry := existing.get(key):
+                entry.value = codec.encode(value)
+                entry.expires_on = expires_on
+                entry.changed_on = datetime.now()
+                entry.changed_by_fk = get_user_id()
+            else:
+                entry = KeyValueDAO.create_entry(
+                    resource, value, codec, key, expires_on
+                )
+            entries.append(entry)
+        return entries
+
     @staticmethod
     def update_entry(
         resource: KeyValueResource,
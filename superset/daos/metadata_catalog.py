@@ -0,0 +1,494 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
+
+import sqlalchemy as sa
+from sqlalchemy.exc import IntegrityError
+
+from superset import is_feature_enabled
+from superset.daos.base import BaseDAO
+from superset.extensions import db
+from superset.models.metadata_catalog import (
+    MetadataCatalogColumn,
+    MetadataCatalogSchema,
+    MetadataCatalogTable,
+)
+from superset.sql_parse import Table
+from superset.superset_typing import ResultSetColumnType
+from superset.utils import json
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine.interfaces import Dialect
+
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+# maximum number of rows inserted or deleted per statement
+BATCH_SIZE = 1000
+
+# keys of the inspector columns stored in their own catalog columns
+COLUMN_KEYS = {"name", "column_name", "type", "nullable", "comment"}
+
+# catalog the schemas of databases without catalogs are stored under, instead of NULL,
+# which would be distinct from other NULLs in the unique constraint of the schemas
+NO_CATALOG = ""
+
+T = TypeVar("T")
+
+
+class MetadataCatalogDAO(BaseDAO[MetadataCatalogTable]):
+    """
+    Read-through access to the metadata catalog.
+
+    Schemas, tables and table details are read from the catalog when they were crawled
+    before, and are otherwise inspected in the database and stored. Passing ``force``
+    inspects the database even if the catalog has them, eg, when users refresh the
+    table selector. Writes are committed right away, as they can happen while
+    serving read requests.
+    """
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return is_feature_enabled("METADATA_CATALOG")
+
+    @staticmethod
+    def get_catalog_name(database: Database, catalog: str | None) -> str | None:
+        """
+        Return the catalog the schemas are stored under, ie, the default catalog of the
+        database if none is given.
+        """
+        return catalog or database.get_default_catalog()
+
+    @classmethod
+    def find_schema(
+        cls,
+        database: Database,
+        catalog: str | None,
+        schema: str,
+    ) -> MetadataCatalogSchema | None:
+        return (
+            db.session.query(MetadataCatalogSchema)
+            .filter_by(
+                database_id=database.id,
+                catalog=catalog or NO_CATALOG,
+                name=schema,
+            )
+            .one_or_none()
+        )
+
+    @classmethod
+    def _get_or_create_schema(
+        cls,
+        database: Database,
+        catalog: str | None,
+        schema: str,
+    ) -> MetadataCatalogSchema:
+        schema_ = cls.find_schema(database, catalog, schema)
+        if schema_ is None:
+            schema_ = MetadataCatalogSchema(
+                database_id=database.id,
+                catalog=catalog or NO_CATALOG,
+                name=schema,
+            )
+            db.session.add(schema_)
+            db.session.flush()
+        return schema_
+
+    @staticmethod
+    def _commit(write: Callable[[], T]) -> T:
+        """
+        Run the writes of a refresh and commit them.
+
+        Refreshes can run concurrently, eg, a request reading through the catalog while
+        the crawler refreshes the same schema, in which case the unique constraints
+        reject the rows inserted last. The writes are then run again, on top of the
+        rows of the other refresh.
+        """
+        try:
+            result = write()
+            db.session.commit()  # pylint: disable=consider-using-transaction
+        except IntegrityError:
+            db.session.rollback()
+            result = write()
+            db.session.commit()  # pylint: disable=consider-using-transaction
+        return result
+
+    @classmethod
+    def get_schema_names(
+        cls,
+        database: Database,
+        catalog: str | None,
+        force: bool = False,
+    ) -> set[str]:
+        """
+        Return the names of the schemas of a database catalog.
+        """
+        catalog = cls.get_catalog_name(database, catalog)
+        if not force:
+            names = {
+                name
+                for (name,) in db.session.query(MetadataCatalogSchema.name).filter_by(
+                    database_id=database.id,
+                    catalog=catalog or NO_CATALOG,
+                )
+            }
+            if names:
+                return names
+
+        return cls.refresh_schemas(database, catalog)
+
+    @classmethod
+    def refresh_schemas(cls, database: Database, catalog: str | None) -> set[str]:
+        """
+        Store the schemas of a database catalog, as returned by its inspector.
+
+        Schemas that no longer exist are deleted with their tables, while the tables of
+        the existing ones are kept.
+        """
+        names = database.get_all_schema_names(catalog=catalog, cache=False)
+
+        def write() -> None:
+            existing = {
+                name: id_
+                for id_, name in db.session.query(
+                    MetadataCatalogSchema.id,
+                    MetadataCatalogSchema.name,
+                ).filter_by(database_id=database.id, catalog=catalog or NO_CATALOG)
+            }
+            deleted = [id_ for name, id_ in existing.items() if name not in names]
+            if deleted:
+                table_ids = sa.select(MetadataCatalogTable.id).where(
+                    MetadataCatalogTable.schema_id.in_(deleted)
+                )
+                db.session.execute(
+                    sa.delete(MetadataCatalogColumn)
+                    .where(MetadataCatalogColumn.table_id.in_(table_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                db.session.execute(
+                    sa.delete(MetadataCatalogTable)
+                    .where(MetadataCatalogTable.schema_id.in_(deleted))
+                    .execution_options(synchronize_session=False)
+                )
+                db.session.execute(
+                    sa.delete(MetadataCatalogSchema)
+                    .where(MetadataCatalogSchema.id.in_(deleted))
+                    .execution_options(synchronize_session=False)
+                )
+            db.session.add_all(
+                MetadataCatalogSchema(
+                    database_id=database.id,
+                    catalog=catalog or NO_CATALOG,
+                    name=name,
+                )
+                for name in names - existing.keys()
+            )
+
+        cls._commit(write)
+
+        return set(names)
+
+    @classmethod
+    def get_tables(  # pylint: disable=too-many-arguments
+        cls,
+        database: Database,
+        catalog: str | None,
+        schema: str,
+        force: bool = False,
+        search: str | None = None,
+    ) -> list[MetadataCatalogTable]:
+        """
+        Return the tables and views of a schema.
+
+        :param database: The database
+        :param catalog: The catalog of the schema, the default one if None
+        :param schema: The schema
+        :param force: Whether to list the tables in the database
+        :param search: Only return the tables with a name containing this string,
+            ignoring the case
+        :returns: The tables, sorted by name, with the ones starting with ``search``
+            first
+        """
+        catalog = cls.get_catalog_name(database, catalog)
+        schema_ = cls.find_schema(database, catalog, schema)
+        if force or schema_ is None or schema_.last_refreshed is None:
+            schema_ = cls.refresh_tables(database, catalog, schema)
+
+        query = db.session.query(MetadataCatalogTable).filter_by(schema_id=schema_.id)
+        if search:
+            pattern = (
+                search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            query = query.filter(
+                MetadataCatalogTable.name.ilike(f"%{pattern}%", escape="\\")
+            ).order_by(
+                sa.case(
+                    (MetadataCatalogTable.name.ilike(f"{pattern}%", escape="\\"), 0),
+                    else_=1,
+                )
+            )
+
+        return query.order_by(MetadataCatalogTable.name).all()
+
+    @classmethod
+    def refresh_tables(
+        cls,
+        database: Database,
+        catalog: str | None,
+        schema: str,
+    ) -> MetadataCatalogSchema:
+        """
+        Store the tables and views of a schema, as returned by the inspector.
+
+        The details of the tables that still exist are kept.
+        """
+        names = {
+            (table.table, "table")
+            for table in database.get_all_table_names_in_schema(
+                catalog=catalog,
+                schema=schema,
+                cache=False,
+            )
+        } | {
+            (view.table, "view")
+            for view in database.get_all_view_names_in_schema(
+                catalog=catalog,
+                schema=schema,
+                cache=False,
+            )
+        }
+
+        def write() -> MetadataCatalogSchema:
+            schema_ = cls._get_or_create_schema(database, catalog, schema)
+            existing = {
+                (name, type_): id_
+                for id_, name, type_ in db.session.query(
+                    MetadataCatalogTable.id,
+                    MetadataCatalogTable.name,
+                    MetadataCatalogTable.type,
+                ).filter_by(schema_id=schema_.id)
+            }
+            deleted = [id_ for key, id_ in existing.items() if key not in names]
+            for i in range(0, len(deleted), BATCH_SIZE):
+                # columns are deleted explicitly, as foreign keys might not cascade, eg,
+                # in SQLite
+                batch = deleted[i : i + BATCH_SIZE]
+                db.session.execute(
+                    sa.delete(MetadataCatalogColumn).where(
+                        MetadataCatalogColumn.table_id.in_(batch)
+                    )
+                )
+                db.session.execute(
+                    sa.delete(MetadataCatalogTable).where(
+                        MetadataCatalogTable.id.in_(batch)
+                    )
+                )
+
+            added = [
+                {"schema_id": schema_.id, "name": name, "type": type_}
+                for name, type_ in sorted(names - existing.keys())
+            ]
+            for i in range(0, len(added), BATCH_SIZE):
+                db.session.execute(
+                    sa.insert(MetadataCatalogTable),
+                    added[i : i + BATCH_SIZE],
+                )
+
+            schema_.last_refreshed = datetime.now()
+            return schema_
+
+        return cls._commit(write)
+
+    @classmethod
+    def get_table(
+        cls,
+        database: Database,
+        table: Table,
+        force: bool = False,
+    ) -> MetadataCatalogTable:
+        """
+        Return a table with its columns, keys, indexes and comment.
+
+        :param database: The database
+        :param table: The table, which must have a schema
+        :param force: Whether to inspect the table in the database
+        :raises NoSuchTableError: If the table doesn't exist
+        """
+        catalog = cls.get_catalog_name(database, table.catalog)
+        table_ = (
+            db.session.query(MetadataCatalogTable)
+            .join(MetadataCatalogSchema)
+            .filter(
+                MetadataCatalogSchema.database_id == database.id,
+                MetadataCatalogSchema.catalog == (catalog or NO_CATALOG),
+                MetadataCatalogSchema.name == table.schema,
+                MetadataCatalogTable.name == table.table,
+            )
+            .order_by(MetadataCatalogTable.type)
+            .first()
+        )
+        if force or table_ is None or table_.last_refreshed is None:
+            table_ = cls.refresh_table(
+                database, Table(table.table, table.schema, catalog)
+            )
+
+        return table_
+
+    @classmethod
+    def refresh_table(cls, database: Database, table: Table) -> MetadataCatalogTable:
+        """
+        Store the columns, keys, indexes and comment of a table, as returned by the
+        inspector.
+        """
+        columns = database.get_columns(table)
+        pk_constraint = database.get_pk_constraint(table)
+        foreign_keys = database.get_foreign_keys(table)
+        indexes = database.get_indexes(table)
+        comment = database.get_table_comment(table)
+        dialect = database.get_dialect()
+
+        def write() -> MetadataCatalogTable:
+            schema_ = cls._get_or_create_schema(database, table.catalog, table.schema)
+            # a view can have the name of a table, pick the same one as `get_table`
+            table_ = (
+                db.session.query(MetadataCatalogTable)
+                .filter_by(schema_id=schema_.id, name=table.table)
+                .order_by(MetadataCatalogTable.type)
+                .first()
+            )
+            if table_ is None:
+                table_ = MetadataCatalogTable(
+                    schema_id=schema_.id,
+                    name=table.table,
+                    type="table",
+                )
+                db.session.add(table_)
+
+            table_.columns = [
+                MetadataCatalogColumn(
+                    position=position,
+                    name=column["column_name"],
+                    type=cls.get_type_name(database, dialect, column["type"]),
+                    nullable=column.get("nullable"),
+                    comment=column.get("comment"),
+                    extra=json.dumps(
+                        {
+                            key: value
+                            for key, value in column.items()
+                            if key not in COLUMN_KEYS
+                        },
+                        default=str,
+                    ),
+                )
+                for position, column in enumerate(columns)
+            ]
+            table_.pk_constraint = json.dumps(pk_constraint, default=str)
+            table_.foreign_keys = json.dumps(foreign_keys, default=str)
+            table_.indexes = json.dumps(indexes, default=str)
+            table_.comment = comment
+            table_.last_refreshed = datetime.now()
+            return table_
+
+        return cls._commit(write)
+
+    @staticmethod
+    def get_type_name(database: Database, dialect: Dialect, type_: Any) -> str | None:
+        """
+        Return the type of an inspected column as a string, as used by datasets.
+        """
+        if type_ is None or isinstance(type_, str):
+            return type_
+        try:
+            return database.db_engine_spec.column_datatype_to_string(type_, dialect)
+        except Exception:  # pylint: disable=broad-except
+            # some types can't be compiled, eg, sqla.types.JSON
+            return type_.__class__.__name__
+
+    @staticmethod
+    def get_columns(table: MetadataCatalogTable) -> list[ResultSetColumnType]:
+        """
+        Return the columns of a catalog table like ``Database.get_columns``, with the
+        types as strings.
+        """
+        return [
+            {
+                **json.loads(column.extra or "{}"),
+                "name": column.name,
+                "column_name": column.name,
+                "type": column.type,
+                "nullable": column.nullable,
+                "comment": column.comment,
+            }
+            for column in table.columns
+        ]
+
+    @staticmethod
+    def get_stale_schemas(
+        database: Database,
+        refreshed_before: datetime,
+    ) -> list[tuple[str | None, str]]:
+        """
+        Return the catalog and name of the schemas of a database whose tables were
+        refreshed before a time, or never.
+        """
+        return [
+            (catalog or None, name)
+            for catalog, name in db.session.query(
+                MetadataCatalogSchema.catalog,
+                MetadataCatalogSchema.name,
+            )
+            .filter(
+                MetadataCatalogSchema.database_id == database.id,
+                sa.or_(
+                    MetadataCatalogSchema.last_refreshed.is_(None),
+                    MetadataCatalogSchema.last_refreshed < refreshed_before,
+                ),
+            )
+            .order_by(MetadataCatalogSchema.last_refreshed)
+        ]
+
+    @staticmethod
+    def get_stale_tables(
+        database: Database,
+        refreshed_before: datetime,
+    ) -> list[tuple[str | None, str, str]]:
+        """
+        Return the catalog, schema and name of the tables of a database whose details
+        were refreshed before a time.
+
+        Tables whose details were never requested are not returned, so that only the
+        details that were needed once are kept up to date.
+        """
+        return [
+            (catalog or None, schema, name)
+            for catalog, schema, name in db.session.query(
+                MetadataCatalogSchema.catalog,
+                MetadataCatalogSchema.name,
+                MetadataCatalogTable.name,
+            )
+            .join(MetadataCatalogTable.schema)
+            .filter(
+                MetadataCatalogSchema.database_id == database.id,
+                MetadataCatalogTable.last_refreshed < refreshed_before,
+            )
+            .order_by(MetadataCatalogTable.last_refreshed)
+        ]
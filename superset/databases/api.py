@@ -69,6 +69,7 @@ from superset.commands.importers.exceptions import (
 from superset.commands.importers.v1.utils import get_contents_from_bundle
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP, RouteMethod
 from superset.daos.database import DatabaseDAO, DatabaseUserOAuth2TokensDAO
+from superset.daos.metadata_catalog import MetadataCatalogDAO
 from superset.databases.decorators import check_table_access
 from superset.databases.filters import DatabaseFilter, DatabaseUploadEnabledFilter
 from superset.databases.schemas import (
@@ -98,6 +99,7 @@ from superset.databases.schemas import (
     SchemasResponseSchema,
     SelectStarResponseSchema,
     TableExtraMetadataResponseSchema,
+    TableMetadataQuerySchema,
     TableMetadataResponseSchema,
     UploadFileMetadata,
     ValidateSQLRequest,
@@ -730,12 +732,16 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             return self.response_404()
         try:
             catalog = kwargs["rison"].get("catalog")
-            schemas = database.get_all_schema_names(
-                catalog=catalog,
-                cache=database.schema_cache_enabled,
-                cache_timeout=database.schema_cache_timeout or None,
-                force=kwargs["rison"].get("force", False),
-            )
+            force = kwargs["rison"].get("force", False)
+            if MetadataCatalogDAO.is_enabled():
+                schemas = MetadataCatalogDAO.get_schema_names(database, catalog, force)
+            else:
+                schemas = database.get_all_schema_names(
+                    catalog=catalog,
+                    cache=database.schema_cache_enabled,
+                    cache_timeout=database.schema_cache_timeout or None,
+                    force=force,
+                )
             schemas = security_manager.get_schemas_accessible_by_user(
                 database,
                 catalog,
@@ -805,9 +811,16 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         force = kwargs["rison"].get("force", False)
         catalog_name = kwargs["rison"].get("catalog_name")
         schema_name = kwargs["rison"].get("schema_name", "")
+        search = kwargs["rison"].get("search")
 
         try:
-            command = TablesDatabaseCommand(pk, catalog_name, schema_name, force)
+            command = TablesDatabaseCommand(
+                pk,
+                catalog_name,
+                schema_name,
+                force,
+                search,
+            )
             payload = command.run()
             return self.response(200, **payload)
         except DatabaseNotFoundError:
@@ -989,6 +1002,12 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             name: catalog
             description: >-
               Optional table catalog, if not passed default catalog will be used
+          - in: query
+            schema:
+              type: boolean
+            name: force
+            description: >-
+              Inspect the table even if it's in the metadata catalog
           responses:
             200:
               description: Table metadata information
@@ -1010,7 +1029,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             raise DatabaseNotFoundException("No such database")
 
         try:
-            parameters = QualifiedTableSchema().load(request.args)
+            parameters = TableMetadataQuerySchema().load(request.args)
         except ValidationError as ex:
             raise InvalidPayloadSchemaError(ex) from ex
 
@@ -1021,7 +1040,11 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             # instead of raising 403, raise 404 to hide table existence
             raise TableNotFoundException("No such table") from ex
 
-        payload = database.db_engine_spec.get_table_metadata(database, table)
+        payload = database.db_engine_spec.get_table_metadata(
+            database,
+            table,
+            force=parameters["force"],
+        )
 
         return self.response(200, **payload)
 
@@ -74,6 +74,7 @@ database_tables_query_schema = {
         "force": {"type": "boolean"},
         "schema_name": {"type": "string"},
         "catalog_name": {"type": "string"},
+        "search": {"type": "string"},
     },
     "required": ["schema_name"],
 }
@@ -158,7 +159,13 @@ extra_description = markdown(
     "7. The ``disable_drill_to_detail`` field is a boolean specifying whether or not"
     "drill to detail is disabled for the database."
     "8. The ``allow_multi_catalog`` indicates if the database allows changing "
-    "the default catalog when running queries and creating datasets.",
+    "the default catalog when running queries and creating datasets.<br/>"
+    "9. The ``time_offset_query_concurrency`` is the maximum number of time "
+    "comparison queries of a chart that run concurrently against the database.<br/>"
+    "10. The ``cache_warmup_concurrency`` is the maximum number of charts warmed "
+    "up concurrently against the database by in-process cache warm up strategies.<br/>"
+    "11. The ``chart_data_query_concurrency`` is the maximum number of queries of a "
+    "chart data request that run concurrently against the database.",
     True,
 )
 get_export_ids_schema = {"type": "array", "items": {"type": "integer"}}
@@ -828,6 +835,11 @@ class ImportV1DatabaseExtraSchema(Schema):
     disable_data_preview = fields.Boolean(required=False)
     disable_drill_to_detail = fields.Boolean(required=False)
     allow_multi_catalog = fields.Boolean(required=False)
+    cache_warmup_concurrency = fields.Integer(required=False, validate=Range(min=1))
+    chart_data_query_concurrency = fields.Integer(required=False, validate=Range(min=1))
+    time_offset_query_concurrency = fields.Integer(
+        required=False, validate=Range(min=1)
+    )
     version = fields.String(required=False, allow_none=True)
 
 
@@ -1453,3 +1465,17 @@ class QualifiedTableSchema(Schema):
         load_default=None,
         metadata={"description": "The table catalog"},
     )
+
+
+class TableMetadataQuerySchema(QualifiedTableSchema):
+    """
+    Schema for the parameters of the table metadata endpoint.
+    """
+
+    force = fields.Boolean(
+        required=False,
+        load_default=False,
+        metadata={
+            "description": "Inspect the table even if it's in the metadata catalog"
+        },
+    )
@@ -20,11 +20,12 @@ from typing import Any
 import sqlalchemy as sa
 from flask import current_app
 from flask_appbuilder import Model
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import backref, Mapper, relationship
 from sqlalchemy.types import Text
 
 from superset.constants import PASSWORD_MASK
-from superset.extensions import encrypted_field_factory
+from superset.extensions import encrypted_field_factory, engine_manager
 from superset.models.core import Database
 from superset.models.helpers import (
     AuditMixinNullable,
@@ -93,3 +94,15 @@ class SSHTunnel(AuditMixinNullable, ExtraJSONMixin, ImportExportMixin, Model):
         if self.private_key_password is not None:
             output["private_key_password"] = PASSWORD_MASK
         return output
+
+
+def invalidate_tunnel_engines(
+    _mapper: Mapper,
+    _connection: Connection,
+    target: SSHTunnel,
+) -> None:
+    engine_manager.invalidate(target.database_id)
+
+
+sa.event.listen(SSHTunnel, "after_update", invalidate_tunnel_engines)
+sa.event.listen(SSHTunnel, "after_delete", invalidate_tunnel_engines)
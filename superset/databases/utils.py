@@ -35,8 +35,10 @@ if TYPE_CHECKING:
 def get_foreign_keys_metadata(
     database: Any,
     table: Table,
+    foreign_keys: list[dict[str, Any]] | None = None,
 ) -> list[TableMetadataForeignKeysIndexesResponse]:
-    foreign_keys = database.get_foreign_keys(table)
+    if foreign_keys is None:
+        foreign_keys = database.get_foreign_keys(table)
     for fk in foreign_keys:
         fk["column_names"] = fk.pop("constrained_columns")
         fk["type"] = "fk"
@@ -46,8 +48,10 @@ def get_foreign_keys_metadata(
 def get_indexes_metadata(
     database: Any,
     table: Table,
+    indexes: list[dict[str, Any]] | None = None,
 ) -> list[TableMetadataForeignKeysIndexesResponse]:
-    indexes = database.get_indexes(table)
+    if indexes is None:
+        indexes = database.get_indexes(table)
     for idx in indexes:
         idx["type"] = "index"
     return indexes
@@ -62,27 +66,50 @@ def get_col_type(col: dict[Any, Any]) -> str:
     return dtype
 
 
-def get_table_metadata(database: Any, table: Table) -> TableMetadataResponse:
+def get_table_metadata(
+    database: Any,
+    table: Table,
+    force: bool = False,
+) -> TableMetadataResponse:
     """
     Get table metadata information, including type, pk, fks.
     This function raises SQLAlchemyError when a schema is not found.
 
+    When the metadata catalog is enabled the metadata is read from it, and only
+    inspected in the database if the table wasn't inspected before or ``force`` is set.
+
     :param database: The database model
     :param table: Table instance
+    :param force: Whether to inspect the table even if it's in the metadata catalog
     :return: Dict table metadata ready for API response
     """
+    # pylint: disable=import-outside-toplevel
+    from superset.daos.metadata_catalog import MetadataCatalogDAO
+
     keys = []
-    columns = database.get_columns(table)
-    primary_key = database.get_pk_constraint(table)
+    if MetadataCatalogDAO.is_enabled() and table.schema:
+        catalog_table = MetadataCatalogDAO.get_table(database, table, force)
+        columns = MetadataCatalogDAO.get_columns(catalog_table)
+        primary_key = catalog_table.pk_constraint_dict
+        foreign_keys = get_foreign_keys_metadata(
+            database,
+            table,
+            catalog_table.foreign_keys_list,
+        )
+        indexes = get_indexes_metadata(database, table, catalog_table.indexes_list)
+        table_comment = catalog_table.comment
+    else:
+        columns = database.get_columns(table)
+        primary_key = database.get_pk_constraint(table)
+        foreign_keys = get_foreign_keys_metadata(database, table)
+        indexes = get_indexes_metadata(database, table)
+        table_comment = database.get_table_comment(table)
     if primary_key and primary_key.get("constrained_columns"):
         primary_key["column_names"] = primary_key.pop("constrained_columns")
         primary_key["type"] = "pk"
         keys += [primary_key]
-    foreign_keys = get_foreign_keys_metadata(database, table)
-    indexes = get_indexes_metadata(database, table)
     keys += foreign_keys + indexes
     payload_columns: list[TableMetadataColumnsResponse] = []
-    table_comment = database.get_table_comment(table)
     for col in columns:
         dtype = get_col_type(col)
         payload_columns.append(
@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 from re import Match, Pattern
 from typing import (
@@ -37,6 +38,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 import sqlparse
 from apispec import APISpec
@@ -66,6 +68,7 @@ from superset.exceptions import DisallowedSQLFunction, OAuth2Error, OAuth2Redire
 from superset.sql.parse import SQLScript, Table
 from superset.sql_parse import ParsedQuery
 from superset.superset_typing import (
+    DbapiDescription,
     OAuth2ClientConfig,
     OAuth2State,
     OAuth2TokenResponse,
@@ -394,6 +397,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     force_column_alias_quotes = False
     arraysize = 0
+    # number of rows pulled per ``cursor.fetchmany`` call when streaming results with
+    # ``fetch_data_in_batches``, unless ``arraysize`` is set
+    fetch_batch_size = 10000
     max_column_name_length: int | None = None
     try_remove_schema_from_table_name = True  # pylint: disable=invalid-name
     run_multiple_statements_as_one = False
@@ -965,32 +971,152 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
+            if column_mutators := cls.get_column_mutators(cursor.description):
+                data = cls.apply_column_mutators(data, column_mutators)
 
             return data
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_in_batches(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the result of a query in batches of ``cursor.arraysize`` rows.
+
+        Unlike ``fetch_data``, the full result is never held in memory: each batch is
+        pulled with ``cursor.fetchmany`` and has the column type mutators applied
+        before it is yielded, so callers can convert it (eg, to Arrow) and release the
+        rows before the next batch is fetched.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Iterator over batches of rows
+        """
+        if not cursor.description:
+            return
+
+        batch_size = cls.arraysize or cls.fetch_batch_size
+        cursor.arraysize = batch_size
+        column_mutators = cls.get_column_mutators(cursor.description)
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            try:
+                data = cursor.fetchmany(size)
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+            if not data:
+                return
+            if remaining is not None:
+                remaining -= len(data)
+            if column_mutators:
+                data = cls.apply_column_mutators(data, column_mutators)
+            yield data
+
+    @classmethod
+    def get_column_mutators(
+        cls,
+        description: DbapiDescription | None,
+    ) -> dict[int, Callable[[Any], Any]]:
+        """
+        Map the index of each column that needs its values normalized to the
+        corresponding function in ``column_type_mutators``.
+
+        :param description: The cursor description
+        :return: Mapping from column index to mutator function
+        """
+        if not cls.column_type_mutators:
+            return {}
+
+        # The first two items in the description row are the column name and type.
+        return {
+            idx: func
+            for idx, row in enumerate(description or [])
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+                )
+            )
+        }
+
+    @staticmethod
+    def apply_column_mutators(
+        data: list[tuple[Any, ...]],
+        column_mutators: dict[int, Callable[[Any], Any]],
+    ) -> list[tuple[Any, ...]]:
+        """
+        Apply mutator functions column by column to a batch of rows.
+
+        :param data: Rows fetched from the cursor
+        :param column_mutators: Mapping from column index to mutator function
+        :return: The rows with the mutated values
+        """
+        if not data:
+            return data
+
+        columns: list[Sequence[Any]] = list(zip(*data))
+        for idx, func in column_mutators.items():
+            columns[idx] = [func(value) for value in columns[idx]]
+
+        return list(zip(*columns))
+
+    @classmethod
+    def fetch_arrow_data(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | None:
+        """
+        Fetch the result of a query as a columnar Arrow table.
+
+        Drivers that can hand back Arrow data natively (eg, Snowflake or DuckDB)
+        should override this method, so that the result does not need to be
+        pivoted from rows into columns. When ``None`` is returned the caller falls
+        back to ``fetch_data``.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query as a ``pyarrow.Table``, or ``None``
+        """
+        return None
+
+    @staticmethod
+    def collect_arrow_batches(
+        batches: Iterable[pa.RecordBatch | pa.Table],
+        limit: int | None = None,
+        schema: pa.Schema | None = None,
+    ) -> pa.Table | None:
+        """
+        Collect Arrow batches into a table, reading no more batches than needed.
+
+        :param batches: The record batches, or tables, of the result
+        :param limit: Maximum number of rows to be returned
+        :param schema: The schema of the result, used when there are no batches
+        :return: The rows of the batches as a ``pyarrow.Table``, or ``None`` when
+            there are no batches and no schema
+        """
+        tables: list[pa.Table] = []
+        num_rows = 0
+        for batch in batches:
+            tables.append(
+                batch if isinstance(batch, pa.Table) else pa.Table.from_batches([batch])
+            )
+            num_rows += batch.num_rows
+            if limit and num_rows >= limit:
+                break
+
+        if not tables:
+            return schema.empty_table() if schema is not None else None
+
+        # batches can have different, compatible types, eg, integers of different
+        # widths in the chunks of a Snowflake result
+        table = pa.concat_tables(tables, promote_options="permissive")
+        return table.slice(0, limit) if limit else table
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1068,15 +1194,17 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         cls,
         database: Database,
         table: Table,
+        force: bool = False,
     ) -> TableMetadataResponse:
         """
         Returns basic table metadata
 
         :param database: Database instance
         :param table: A Table instance
+        :param force: Inspect the table even if it's in the metadata catalog
         :return: Basic table metadata
         """
-        return get_table_metadata(database, table)
+        return get_table_metadata(database, table, force)
 
     @classmethod
     def get_extra_table_metadata(
@@ -1285,13 +1413,67 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
-                engine.dialect.supports_multivalues_insert
-                or cls.supports_multivalues_insert
-            ):
-                to_sql_kwargs["method"] = "multi"
+            if method := cls.get_df_to_sql_method(database, engine):
+                to_sql_kwargs["method"] = method
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from Pandas DataFrames to a database, one DataFrame at a time.
+
+        The first DataFrame is uploaded with the `if_exists` strategy of
+        `to_sql_kwargs`, and the following ones are appended to the table, so that
+        only one DataFrame is held in memory at a time. Can be overridden for engines
+        that can't append to a table, e.g. Hive.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param dfs: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        for i, df in enumerate(dfs):
+            cls.df_to_sql(
+                database,
+                table,
+                df,
+                to_sql_kwargs={**to_sql_kwargs, "if_exists": "append"}
+                if i
+                else dict(to_sql_kwargs),
+            )
+
+    @classmethod
+    def get_df_to_sql_method(
+        cls,
+        database: Database,  # pylint: disable=unused-argument
+        engine: Engine,
+    ) -> str | Callable[..., Any] | None:
+        """
+        Return the `method` of `pandas.DataFrame.to_sql` used to insert the rows.
+
+        Engines with a faster bulk loading path than `INSERT` statements, e.g. `COPY`
+        in Postgres, return a callable implementing it, see
+        https://pandas.pydata.org/docs/user_guide/io.html#io-sql-method
+
+        :param database: The database the data is uploaded to
+        :param engine: The engine used to upload the data
+        :return: The insertion method, or None for one `INSERT` per row
+        """
+        if (
+            engine.dialect.supports_multivalues_insert
+            or cls.supports_multivalues_insert
+        ):
+            return "multi"
+        return None
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import re
 import urllib
+from collections.abc import Iterator
 from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
@@ -248,6 +249,18 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
             data = [r.values() for r in data]  # type: ignore
         return data
 
+    @classmethod
+    def fetch_data_in_batches(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        for data in super().fetch_data_in_batches(cursor, limit):
+            # Support type BigQuery Row, see ``fetch_data``
+            if data and type(data[0]).__name__ == "Row":
+                data = [r.values() for r in data]  # type: ignore
+            yield data
+
     @staticmethod
     def _mutate_label(label: str) -> str:
         """
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 from urllib import parse
@@ -144,3 +145,14 @@ class DrillEngineSpec(BaseEngineSpec):
             if str(ex) == "generator raised StopIteration":
                 return []
             raise
+
+    @classmethod
+    def fetch_data_in_batches(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch all rows at once, handling empty results in ``fetch_data``.
+        """
+        yield cls.fetch_data(cursor, limit)
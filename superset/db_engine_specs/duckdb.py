@@ -21,6 +21,7 @@ from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -236,6 +237,27 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
     ) -> set[str]:
         return set(inspector.get_table_names(schema))
 
+    @classmethod
+    def fetch_arrow_data(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | None:
+        """
+        Fetch the results directly as Arrow, avoiding the row pivot.
+
+        The results are read in record batches, so that no more rows than needed
+        are fetched when there's a limit.
+        """
+        if not cursor.description or not hasattr(cursor, "fetch_record_batch"):
+            return None
+
+        try:
+            reader = cursor.fetch_record_batch(cls.fetch_batch_size)
+            return cls.collect_arrow_batches(reader, limit, reader.schema)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @staticmethod
     def get_extra_params(database: Database) -> dict[str, Any]:
         """
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
@@ -417,3 +418,18 @@ class GSheetsEngineSpec(ShillelaghEngineSpec):
         database.extra = json.dumps(extra)
         db.session.add(database)
         db.session.commit()  # pylint: disable=consider-using-transaction
+
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from Pandas DataFrames to a new sheet.
+
+        Appending to a sheet is not supported, so the DataFrames are uploaded at once.
+        """
+        cls.df_to_sql(database, table, pd.concat(dfs), to_sql_kwargs)
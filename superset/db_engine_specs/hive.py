@@ -21,6 +21,7 @@ import os
 import re
 import tempfile
 import time
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
 from urllib import parse
@@ -164,6 +165,17 @@ class HiveEngineSpec(PrestoEngineSpec):
         except pyhive.exc.ProgrammingError:
             return []
 
+    @classmethod
+    def fetch_data_in_batches(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        The query state is checked in ``fetch_data``, so results are fetched at once.
+        """
+        yield cls.fetch_data(cursor, limit)
+
     @classmethod
     def df_to_sql(
         cls,
@@ -187,6 +199,30 @@ class HiveEngineSpec(PrestoEngineSpec):
         :param df: The dataframe with data to be uploaded
         :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
         """
+        cls.df_chunks_to_sql(database, table, [df], to_sql_kwargs)
+
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from Pandas DataFrames to a database.
+
+        Hive tables can't be appended to, so the DataFrames are written one at a time
+        to a single Parquet file, which is staged as the location of a new table. The
+        schema of the table is inferred from the first DataFrame.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param: table The table to upload the data to
+        :param dfs: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
 
         if to_sql_kwargs["if_exists"] == "append":
             raise SupersetException("Append operation not currently supported")
@@ -222,14 +258,26 @@ class HiveEngineSpec(PrestoEngineSpec):
 
             return hive_type_by_dtype.get(dtype, "STRING")
 
-        schema_definition = ", ".join(
-            f"`{name}` {_get_hive_type(dtype)}" for name, dtype in df.dtypes.items()
-        )
-
         with tempfile.NamedTemporaryFile(
             dir=current_app.config["UPLOAD_FOLDER"], suffix=".parquet"
         ) as file:
-            pq.write_table(pa.Table.from_pandas(df), where=file.name)
+            writer: pq.ParquetWriter | None = None
+            schema_definition = ""
+            for df in dfs:
+                if writer is None:
+                    schema_definition = ", ".join(
+                        f"`{name}` {_get_hive_type(dtype)}"
+                        for name, dtype in df.dtypes.items()
+                    )
+                    data = pa.Table.from_pandas(df)
+                    writer = pq.ParquetWriter(file.name, data.schema)
+                else:
+                    data = pa.Table.from_pandas(df, schema=writer.schema)
+                writer.write_table(data)
+
+            if writer is None:
+                raise SupersetException("No data to upload")
+            writer.close()
 
             with cls.get_engine(
                 database,
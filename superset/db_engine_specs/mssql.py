@@ -16,6 +16,7 @@
 # under the License.
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from re import Pattern
 from typing import Any, Optional
@@ -148,6 +149,15 @@ class MssqlEngineSpec(BaseEngineSpec):
         # Lists of `pyodbc.Row` need to be unpacked further
         return cls.pyodbc_rows_to_tuples(data)
 
+    @classmethod
+    def fetch_data_in_batches(
+        cls,
+        cursor: Any,
+        limit: Optional[int] = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        for data in super().fetch_data_in_batches(cursor, limit):
+            yield cls.pyodbc_rows_to_tuples(data)
+
     @classmethod
     def extract_error_message(cls, ex: Exception) -> str:
         if str(ex).startswith("(8155,"):
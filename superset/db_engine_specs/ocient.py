@@ -18,6 +18,7 @@
 import contextlib
 import re
 import threading
+from collections.abc import Iterator
 from re import Pattern
 from typing import Any, Callable, NamedTuple, Optional
 
@@ -356,6 +357,17 @@ class OcientEngineSpec(BaseEngineSpec):
                 ]
         return rows
 
+    @classmethod
+    def fetch_data_in_batches(
+        cls,
+        cursor: Any,
+        limit: Optional[int] = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Rows are sanitized in ``fetch_data``, so results are fetched at once.
+        """
+        yield cls.fetch_data(cursor, limit)
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "DATEADD(S, {col}, '1970-01-01')"
@@ -19,13 +19,16 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 from datetime import datetime
+from io import StringIO
 from re import Pattern
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -38,8 +41,11 @@ from superset.models.sql_lab import Query
 from superset.sql.parse import SQLScript
 from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType
+from superset.utils.csv import rows_to_text_format
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.models.core import Database  # pragma: no cover
 
 logger = logging.getLogger()
@@ -193,6 +199,32 @@ class PostgresBaseEngineSpec(BaseEngineSpec):
         return None
 
 
+def copy_from_stdin(
+    table: SQLTable,
+    conn: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """
+    Insert rows with ``COPY ... FROM STDIN``, as the ``method`` of ``DataFrame.to_sql``.
+
+    This requires the psycopg2 driver.
+    """
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.quote(table.name)
+    if table.schema:
+        table_name = f"{preparer.quote_schema(table.schema)}.{table_name}"
+    columns = ", ".join(preparer.quote(key) for key in keys)
+
+    buffer = StringIO()
+    buffer.writelines(rows_to_text_format(data_iter))
+    buffer.seek(0)
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN", buffer)
+        return cursor.rowcount
+
+
 class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
     engine = "postgresql"
     engine_aliases = {"postgres"}
@@ -211,6 +243,9 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
     max_column_name_length = 63
     try_remove_schema_from_table_name = False  # pylint: disable=invalid-name
 
+    # insert the rows of uploaded files with ``COPY ... FROM STDIN``
+    supports_copy_from_stdin = True
+
     column_type_mappings = (
         (
             re.compile(r"^double precision", re.IGNORECASE),
@@ -234,6 +269,16 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
         ),
     )
 
+    @classmethod
+    def get_df_to_sql_method(
+        cls,
+        database: Database,
+        engine: Engine,
+    ) -> str | Callable[..., Any] | None:
+        if cls.supports_copy_from_stdin and engine.dialect.driver == "psycopg2":
+            return copy_from_stdin
+        return super().get_df_to_sql_method(database, engine)
+
     @classmethod
     def get_schema_from_engine_params(
         cls,
@@ -158,6 +158,51 @@ def get_children(column: ResultSetColumnType) -> list[ResultSetColumnType]:
     raise Exception(f"Unknown type {type_}!")  # pylint: disable=broad-exception-raised
 
 
+class QueryProgressTracker:
+    """
+    Track the progress of a running Presto or Trino query from its stats.
+
+    The progress, along with the number of splits, rows and bytes processed, is
+    written to the ``Query`` row at most once per ``interval`` seconds, so that
+    frequent polling doesn't translate into as many metadata database writes.
+    """
+
+    def __init__(self, query: Query, interval: float) -> None:
+        self.query = query
+        self.interval = interval
+        self._last_update: float | None = None
+
+    def update(self, stats: dict[str, Any]) -> None:
+        completed_splits = float(stats.get("completedSplits") or 0)
+        total_splits = float(stats.get("totalSplits") or 0)
+        if not (completed_splits and total_splits):
+            return
+
+        now = time.monotonic()
+        if self._last_update is not None and now - self._last_update < self.interval:
+            return
+
+        logger.info(
+            "Query %s progress: %s / %s splits",
+            self.query.id,
+            completed_splits,
+            total_splits,
+        )
+        progress = 100 * (completed_splits / total_splits)
+        self.query.progress = max(self.query.progress or 0, progress)
+        self.query.set_extra_json_key(
+            "progress_stats",
+            {
+                "completed_splits": stats.get("completedSplits"),
+                "total_splits": stats.get("totalSplits"),
+                "processed_rows": stats.get("processedRows"),
+                "processed_bytes": stats.get("processedBytes"),
+            },
+        )
+        db.session.commit()
+        self._last_update = now
+
+
 class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
     """
     A base class that share common functions between Presto and Trino
@@ -1317,42 +1362,37 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         poll_interval = query.database.connect_args.get(
             "poll_interval", current_app.config["PRESTO_POLL_INTERVAL"]
         )
+        tracker = QueryProgressTracker(
+            query, current_app.config["PRESTO_PROGRESS_UPDATE_INTERVAL"]
+        )
         logger.info("Query %i: Polling the cursor for progress", query_id)
+        polled_at = time.monotonic()
         polled = cursor.poll()
         # poll returns dict -- JSON status information or ``None``
         # if the query is done
         # https://github.com/dropbox/PyHive/blob/
         # b34bdbf51378b3979eaf5eca9e956f06ddc36ca0/pyhive/presto.py#L178
         while polled:
-            # Update the object and wait for the kill signal.
-            stats = polled.get("stats", {})
-
-            query = db.session.query(type(query)).filter_by(id=query_id).one()
-            if query.status in [QueryStatus.STOPPED, QueryStatus.TIMED_OUT]:
+            # Check for the kill signal, only reading the status of the query
+            status = (
+                db.session.query(type(query).status).filter_by(id=query_id).scalar()
+            )
+            if status in [QueryStatus.STOPPED, QueryStatus.TIMED_OUT]:
                 cursor.cancel()
                 break
 
-            if stats:
-                state = stats.get("state")
-
+            if stats := polled.get("stats", {}):
                 # if already finished, then stop polling
-                if state == "FINISHED":
+                if stats.get("state") == "FINISHED":
                     break
 
-                completed_splits = float(stats.get("completedSplits"))
-                total_splits = float(stats.get("totalSplits"))
-                if total_splits and completed_splits:
-                    progress = 100 * (completed_splits / total_splits)
-                    logger.info(
-                        "Query %s progress: %s / %s splits",
-                        query_id,
-                        completed_splits,
-                        total_splits,
-                    )
-                    query.progress = max(query.progress, progress)
-                    db.session.commit()
-            time.sleep(poll_interval)
+                tracker.update(stats)
+
+            # the poll itself may have waited for the coordinator to respond, so only
+            # wait for the rest of the interval
+            time.sleep(max(0.0, poll_interval - (time.monotonic() - polled_at)))
             logger.info("Query %i: Polling the cursor for progress", query_id)
+            polled_at = time.monotonic()
             polled = cursor.poll()
 
     @classmethod
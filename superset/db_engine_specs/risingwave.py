@@ -21,3 +21,4 @@ class RisingWaveDbEngineSpec(PostgresEngineSpec):
     engine = "risingwave"
     engine_name = "RisingWave"
     default_driver = ""
+    supports_copy_from_stdin = False
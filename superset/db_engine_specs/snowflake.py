@@ -21,6 +21,7 @@ from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING, TypedDict
 from urllib import parse
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from cryptography.hazmat.backends import default_backend
@@ -166,6 +167,33 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
 
         return uri, connect_args
 
+    @classmethod
+    def fetch_arrow_data(
+        cls,
+        cursor: Any,
+        limit: Optional[int] = None,
+    ) -> Optional[pa.Table]:
+        """
+        Fetch the results as Arrow batches when the connector returned them in the
+        Arrow result format, avoiding the row pivot.
+
+        The chunks of the result are downloaded as they're read, so that no more
+        chunks than needed are fetched when there's a limit.
+        """
+        if not cursor.description or not hasattr(cursor, "fetch_arrow_batches"):
+            return None
+
+        # pylint: disable=import-outside-toplevel
+        from snowflake.connector.errors import NotSupportedError
+
+        try:
+            return cls.collect_arrow_batches(cursor.fetch_arrow_batches(), limit)
+        except NotSupportedError:
+            # the result set was returned in the JSON format
+            return None
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @classmethod
     def get_schema_from_engine_params(
         cls,
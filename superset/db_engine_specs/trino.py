@@ -18,16 +18,18 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import os
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any, TYPE_CHECKING
 
-from flask import ctx, current_app, Flask, g
+from flask import current_app
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchTableError
 
 from superset import db
+from superset.common.db_query_status import QueryStatus
 from superset.constants import QUERY_CANCEL_KEY, QUERY_EARLY_CANCEL_KEY, USER_AGENT
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import BaseEngineSpec, convert_inspector_columns
@@ -37,11 +39,12 @@ from superset.db_engine_specs.exceptions import (
     SupersetDBAPIOperationalError,
     SupersetDBAPIProgrammingError,
 )
-from superset.db_engine_specs.presto import PrestoBaseEngineSpec
+from superset.db_engine_specs.presto import PrestoBaseEngineSpec, QueryProgressTracker
 from superset.models.sql_lab import Query
 from superset.sql_parse import Table
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import core as utils, json
+from superset.utils.concurrency import with_flask_context
 
 if TYPE_CHECKING:
     from superset.models.core import Database
@@ -51,6 +54,33 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Return the thread pool shared by the Trino queries of the process.
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=current_app.config["TRINO_EXECUTOR_MAX_WORKERS"],
+                thread_name_prefix="trino",
+            )
+        return _executor
+
+
+def _reset_executor() -> None:
+    # the threads of the pool are not copied to forked processes
+    global _executor, _executor_lock  # pylint: disable=global-statement
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_executor)
+
 
 class TrinoEngineSpec(PrestoBaseEngineSpec):
     engine = "trino"
@@ -207,70 +237,50 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
         """
         Trigger execution of a query and handle the resulting cursor.
 
-        Trino's client blocks until the query is complete, so we need to run it
-        in another thread and invoke `handle_cursor` to poll for the query ID
-        to appear on the cursor in parallel.
+        Trino's client blocks until the query returns its first rows, so the query
+        is run in a shared thread pool while this thread waits for its ID to be
+        assigned, invokes `handle_cursor` and tracks its progress until the
+        execution completes. A query stopped while it waits for a thread of the pool
+        is cancelled without running, and raises a `CancelledError`.
         """
-        # Fetch the query ID beforehand, since it might fail inside the thread due to
-        # how the SQLAlchemy session is handled.
         query_id = query.id
-        query_database = query.database
-
-        execute_result: dict[str, Any] = {}
-        execute_event = threading.Event()
-
-        def _execute(
-            results: dict[str, Any],
-            event: threading.Event,
-            app: Flask,
-            g_copy: ctx._AppCtxGlobals,
-        ) -> None:
-            logger.debug("Query %d: Running query: %s", query_id, sql)
-
-            try:
-                # Flask contexts are local to the thread that handles the request.
-                # When you spawn a new thread, it does not inherit the contexts
-                # from the parent thread,
-                # meaning the g object and other context-bound variables are not
-                # accessible
-                with app.app_context():
-                    for key, value in g_copy.__dict__.items():
-                        setattr(g, key, value)
-                    cls.execute(cursor, sql, query_database)
-            except Exception as ex:  # pylint: disable=broad-except
-                results["error"] = ex
-            finally:
-                event.set()
-
-        execute_thread = threading.Thread(
-            target=_execute,
-            args=(
-                execute_result,
-                execute_event,
-                current_app._get_current_object(),  # pylint: disable=protected-access
-                g._get_current_object(),  # pylint: disable=protected-access
-            ),
+        logger.debug("Query %d: Running query: %s", query_id, sql)
+        future = get_executor().submit(
+            with_flask_context(cls.execute), cursor, sql, query.database
         )
-        execute_thread.start()
 
-        # Wait for the thread to start before continuing
-        time.sleep(0.1)
-        # Wait for a query ID to be available before handling the cursor, as
-        # it's required by that method; it may never become available on error.
-        while not cursor.query_id and not execute_event.is_set():
-            time.sleep(0.1)
+        # The client doesn't signal when the query ID is assigned, which happens as
+        # soon as the coordinator accepts the query; it may never be assigned on
+        # error, in which case the execution completes.
+        poll_interval = current_app.config["PRESTO_POLL_INTERVAL"]
+        while not cursor.query_id and wait([future], timeout=poll_interval).not_done:
+            # a query waiting for a thread has no ID to kill it with, so it's stopped
+            # by cancelling its execution
+            if not future.running() and cls._is_stopped(query) and future.cancel():
+                logger.info("Query %d: Cancelled queued query", query_id)
+                future.result()
 
         logger.debug("Query %d: Handling cursor", query_id)
         cls.handle_cursor(cursor, query)
 
-        # Block until the query completes; same behaviour as the client itself
+        # Block until the query completes; same behaviour as the client itself. The
+        # stats of the query are updated by the client on each response from the
+        # coordinator.
         logger.debug("Query %d: Waiting for query to complete", query_id)
-        execute_event.wait()
+        tracker = QueryProgressTracker(
+            query, current_app.config["PRESTO_PROGRESS_UPDATE_INTERVAL"]
+        )
+        while wait([future], timeout=tracker.interval).not_done:
+            tracker.update(cursor.stats or {})
 
-        # Unfortunately we'll mangle the stack trace due to the thread, but
         # throwing the original exception allows mapping database errors as normal
-        if err := execute_result.get("error"):
-            raise err
+        future.result()
+
+    @staticmethod
+    def _is_stopped(query: Query) -> bool:
+        # only read the status, as the query is stopped by another thread or worker
+        status = db.session.query(type(query).status).filter_by(id=query.id).scalar()
+        return status == QueryStatus.STOPPED
 
     @classmethod
     def prepare_cancel_query(cls, query: Query) -> None:
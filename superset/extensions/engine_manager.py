@@ -0,0 +1,270 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time as time_, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, NamedTuple, Optional, TYPE_CHECKING
+from uuid import UUID
+
+import sshtunnel
+from flask import Flask
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import QueuePool
+
+from superset.extensions.stats_logger import BaseStatsLoggerManager
+from superset.utils.hashing import md5_sha_from_dict
+
+if TYPE_CHECKING:
+    from superset.databases.ssh_tunnel.models import SSHTunnel
+
+logger = logging.getLogger(__name__)
+
+# arguments that are only accepted by ``create_engine`` for queue based pools
+QUEUE_POOL_PARAMS = {"pool_size", "max_overflow", "pool_timeout", "pool_use_lifo"}
+
+
+def stable_default(value: Any) -> Any:
+    """
+    Convert a value that is not JSON serializable for the fingerprint of an engine.
+
+    Only values with a stable representation are converted; other objects (eg, a
+    callable, whose default representation includes its address) would result in a
+    new key on every call, so they raise a ``TypeError``.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, (date, datetime, time_, timedelta, Decimal, UUID, Enum)):
+        return repr(value)
+    raise TypeError(f"Unable to fingerprint object of type {type(value)}")
+
+
+class EngineKey(NamedTuple):
+    database_id: Optional[int]
+    fingerprint: str
+
+
+@dataclass
+class EngineEntry:
+    engine: Engine
+    created_at: float
+    tunnel: Optional[sshtunnel.SSHTunnelForwarder] = None
+
+    def is_busy(self) -> bool:
+        checkedout = getattr(self.engine.pool, "checkedout", None)
+        return bool(checkedout and checkedout())
+
+    def close(self) -> None:
+        self.engine.dispose()
+        if self.tunnel:
+            self.tunnel.stop()
+
+
+class EngineManager:
+    """
+    Process-local registry of pooled SQLAlchemy engines.
+
+    Engines are keyed by the fully resolved connection parameters (URL, connect
+    arguments, effective user, OAuth2 token and SSH tunnel), so that connections are
+    only shared between callers that would have created the same engine. Entries are
+    evicted in LRU order once ``DB_ENGINE_POOL_MAX_ENGINES`` is reached, and are
+    recreated after ``DB_ENGINE_POOL_TTL`` seconds.
+    """
+
+    def __init__(self, stats_logger_manager: BaseStatsLoggerManager) -> None:
+        self._stats_logger_manager = stats_logger_manager
+        self._engines: OrderedDict[EngineKey, EngineEntry] = OrderedDict()
+        # evicted engines with connections still checked out; these are closed once
+        # the connections are returned, so in-flight queries are not interrupted
+        self._retired: list[EngineEntry] = []
+        self._lock = threading.RLock()
+        self.enabled = False
+        self.max_engines = 0
+        self.ttl = 0
+        self.pool_params: dict[str, Any] = {}
+
+    def init_app(self, app: Flask) -> None:
+        self.enabled = app.config["DB_ENGINE_POOL_ENABLED"]
+        self.max_engines = app.config["DB_ENGINE_POOL_MAX_ENGINES"]
+        self.ttl = app.config["DB_ENGINE_POOL_TTL"]
+        self.pool_params = app.config["DB_ENGINE_POOL_PARAMS"]
+
+    @staticmethod
+    def get_key(
+        database_id: Optional[int],
+        sqlalchemy_url: URL,
+        params: dict[str, Any],
+        ssh_tunnel: Optional[SSHTunnel] = None,
+    ) -> Optional[EngineKey]:
+        """
+        Build the key for an engine from its resolved connection parameters.
+
+        Credentials are part of the key so that a changed password or a refreshed
+        OAuth2 token results in a new engine, but only their hash is stored. Returns
+        ``None`` when the parameters can't be fingerprinted reliably, in which case
+        the engine shouldn't be pooled.
+        """
+        payload = {
+            "url": sqlalchemy_url.render_as_string(hide_password=False),
+            "params": params,
+            "ssh_tunnel": (
+                [
+                    ssh_tunnel.id,
+                    ssh_tunnel.server_address,
+                    ssh_tunnel.server_port,
+                    ssh_tunnel.username,
+                    ssh_tunnel.password,
+                    ssh_tunnel.private_key,
+                    ssh_tunnel.private_key_password,
+                ]
+                if ssh_tunnel
+                else None
+            ),
+        }
+        try:
+            fingerprint = md5_sha_from_dict(payload, default=stable_default)
+        except TypeError:
+            logger.warning(
+                "Unable to fingerprint the engine parameters of database %s, the "
+                "engine won't be pooled",
+                database_id,
+                exc_info=True,
+            )
+            return None
+
+        return EngineKey(database_id, fingerprint)
+
+    def get_pool_params(self, sqlalchemy_url: URL) -> dict[str, Any]:
+        """
+        Return the configured pool arguments that apply to the dialect's pool class.
+        """
+        pool_class = sqlalchemy_url.get_dialect().get_pool_class(sqlalchemy_url)
+        if issubclass(pool_class, QueuePool):
+            return dict(self.pool_params)
+
+        return {
+            key: value
+            for key, value in self.pool_params.items()
+            if key not in QUEUE_POOL_PARAMS
+        }
+
+    def get_engine(
+        self,
+        key: EngineKey,
+        creator: Callable[[], tuple[Engine, Optional[sshtunnel.SSHTunnelForwarder]]],
+    ) -> Engine:
+        """
+        Return the engine for a given key, creating it if needed.
+
+        :param key: The key returned by ``get_key``
+        :param creator: Function returning a new engine and its SSH tunnel, if any
+        :return: A pooled SQLAlchemy engine
+        """
+        stats_logger = self._stats_logger_manager.instance
+        with self._lock:
+            self._close_retired()
+            entry = self._get_entry(key)
+
+        if entry:
+            stats_logger.incr("engine_manager.hit")
+        else:
+            # engines are created outside of the lock, since starting an SSH tunnel
+            # or creating an engine can be slow and shouldn't block other databases
+            stats_logger.incr("engine_manager.miss")
+            engine, tunnel = creator()
+            new_entry = EngineEntry(engine, time.monotonic(), tunnel)
+
+            with self._lock:
+                # another thread might have created the engine in the meantime
+                entry = self._get_entry(key)
+                if not entry:
+                    entry = new_entry
+                    self._engines[key] = entry
+                    while len(self._engines) > self.max_engines:
+                        stats_logger.incr("engine_manager.evicted")
+                        self._evict(next(iter(self._engines)))
+
+            if entry is not new_entry:
+                new_entry.close()
+
+        stats_logger.gauge("engine_manager.engines", len(self._engines))
+        self._log_pool_metrics(key, entry.engine)
+        return entry.engine
+
+    def _get_entry(self, key: EngineKey) -> Optional[EngineEntry]:
+        """
+        Return the live entry for a key, evicting it if it expired.
+
+        Must be called with the lock held.
+        """
+        entry = self._engines.get(key)
+        if entry and time.monotonic() - entry.created_at > self.ttl:
+            self._stats_logger_manager.instance.incr("engine_manager.expired")
+            self._evict(key)
+            return None
+
+        if entry:
+            self._engines.move_to_end(key)
+        return entry
+
+    def invalidate(self, database_id: int) -> None:
+        """
+        Drop all the engines of a database, eg, after it or its SSH tunnel changed.
+        """
+        with self._lock:
+            for key in [key for key in self._engines if key.database_id == database_id]:
+                self._evict(key)
+
+    def dispose_all(self) -> None:
+        with self._lock:
+            for key in list(self._engines):
+                self._evict(key)
+
+    def _evict(self, key: EngineKey) -> None:
+        entry = self._engines.pop(key)
+        if entry.tunnel and entry.is_busy():
+            self._retired.append(entry)
+        else:
+            entry.close()
+
+    def _close_retired(self) -> None:
+        busy = []
+        for entry in self._retired:
+            if entry.is_busy():
+                busy.append(entry)
+            else:
+                entry.close()
+        self._retired = busy
+
+    def _log_pool_metrics(self, key: EngineKey, engine: Engine) -> None:
+        stats_logger = self._stats_logger_manager.instance
+        prefix = f"engine_manager.pool.{key.database_id}"
+        for metric in ("size", "checkedin", "checkedout", "overflow"):
+            if func := getattr(engine.pool, metric, None):
+                try:
+                    stats_logger.gauge(f"{prefix}.{metric}", func())
+                except Exception:  # pylint: disable=broad-except
+                    logger.debug("Unable to read pool metric %s", metric)
@@ -15,6 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID, uuid3
@@ -24,6 +27,7 @@ from flask_caching import BaseCache
 from sqlalchemy.exc import SQLAlchemyError
 
 from superset import db
+from superset.constants import LRU_CACHE_MAX_SIZE
 from superset.key_value.exceptions import KeyValueCreateFailedError
 from superset.key_value.types import (
     KeyValueCodec,
@@ -39,15 +43,29 @@ logger = logging.getLogger(__name__)
 
 
 class SupersetMetastoreCache(BaseCache):
+    """
+    Cache backed by the key-value table of the metastore.
+
+    Expired entries are ignored when reading, and deleted by the `prune_key_value`
+    Celery task. When `local_timeout` is set, encoded values read from the metastore
+    are also kept in-process for that many seconds, so hot keys don't hit the
+    metastore on every read; values set or deleted by other processes may then be
+    stale for up to `local_timeout` seconds.
+    """
+
     def __init__(
         self,
         namespace: UUID,
         codec: KeyValueCodec,
         default_timeout: int = 300,
+        local_timeout: int = 0,
     ) -> None:
         super().__init__(default_timeout)
         self.namespace = namespace
         self.codec = codec
+        self.local_timeout = local_timeout
+        self._local: OrderedDict[UUID, tuple[float, bytes]] = OrderedDict()
+        self._local_lock = threading.Lock()
 
     @classmethod
     def factory(
@@ -66,6 +84,7 @@ class SupersetMetastoreCache(BaseCache):
                 "use at your own risk."
             )
         kwargs["codec"] = codec
+        kwargs["local_timeout"] = config.get("LOCAL_CACHE_TIMEOUT", 0)
         return cls(*args, **kwargs)
 
     def get_key(self, key: str) -> UUID:
@@ -77,44 +96,111 @@ class SupersetMetastoreCache(BaseCache):
             return datetime.now() + timedelta(seconds=timeout)
         return None
 
+    def _get_local(self, key: UUID) -> Optional[bytes]:
+        with self._local_lock:
+            if (item := self._local.get(key)) is None:
+                return None
+            expiry, value = item
+            if expiry <= time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return value
+
+    def _set_local(
+        self,
+        key: UUID,
+        value: bytes,
+        expires_on: Optional[datetime],
+    ) -> None:
+        timeout: float = self.local_timeout
+        if expires_on is not None:
+            timeout = min(timeout, (expires_on - datetime.now()).total_seconds())
+        with self._local_lock:
+            self._local[key] = (time.monotonic() + timeout, value)
+            self._local.move_to_end(key)
+            while len(self._local) > LRU_CACHE_MAX_SIZE:
+                self._local.popitem(last=False)
+
+    def _invalidate_local(self, keys: list[UUID]) -> None:
+        with self._local_lock:
+            for key in keys:
+                self._local.pop(key, None)
+
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        return bool(self.set_many({key: value}, timeout))
+
+    def set_many(
+        self,
+        mapping: dict[str, Any],
+        timeout: Optional[int] = None,
+    ) -> list[Any]:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
-        KeyValueDAO.upsert_entry(
+        values = {self.get_key(key): value for key, value in mapping.items()}
+        KeyValueDAO.upsert_entries(
             resource=RESOURCE,
-            key=self.get_key(key),
-            value=value,
+            values=values,
             codec=self.codec,
             expires_on=self._get_expiry(timeout),
         )
         db.session.commit()  # pylint: disable=consider-using-transaction
-        return True
+        self._invalidate_local(list(values))
+        return list(mapping)
 
     def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
+        uuid = self.get_key(key)
         try:
-            KeyValueDAO.delete_expired_entries(RESOURCE)
+            # an expired entry with the same key would make the insert fail
+            if (entry := KeyValueDAO.get_entry(RESOURCE, uuid)) and entry.is_expired():
+                db.session.delete(entry)
+                db.session.flush()
             KeyValueDAO.create_entry(
                 resource=RESOURCE,
                 value=value,
                 codec=self.codec,
-                key=self.get_key(key),
+                key=uuid,
                 expires_on=self._get_expiry(timeout),
             )
             db.session.commit()  # pylint: disable=consider-using-transaction
+            self._invalidate_local([uuid])
             return True
         except (SQLAlchemyError, KeyValueCreateFailedError):
             db.session.rollback()  # pylint: disable=consider-using-transaction
             return False
 
     def get(self, key: str) -> Any:
+        return self.get_many(key)[0]
+
+    def get_many(self, *keys: str) -> list[Any]:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
-        return KeyValueDAO.get_value(RESOURCE, self.get_key(key), self.codec)
+        uuids = [self.get_key(key) for key in keys]
+        encoded: dict[UUID, bytes] = {}
+        missing = []
+        for uuid in uuids:
+            if self.local_timeout and (value := self._get_local(uuid)) is not None:
+                encoded[uuid] = value
+            else:
+                missing.append(uuid)
+
+        if missing:
+            for uuid, entry in KeyValueDAO.get_entries(RESOURCE, missing).items():
+                if entry.is_expired():
+                    continue
+                encoded[uuid] = entry.value
+                if self.local_timeout:
+                    self._set_local(uuid, entry.value, entry.expires_on)
+
+        return [
+            self.codec.decode(encoded[uuid]) if uuid in encoded else None
+            for uuid in uuids
+        ]
 
     def has(self, key: str) -> bool:
         entry = self.get(key)
@@ -122,9 +208,15 @@ class SupersetMetastoreCache(BaseCache):
             return True
         return False
 
-    @transaction()
     def delete(self, key: str) -> Any:
+        return bool(self.delete_many(key))
+
+    @transaction()
+    def delete_many(self, *keys: str) -> list[Any]:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
-        return KeyValueDAO.delete_entry(RESOURCE, self.get_key(key))
+        uuids = {self.get_key(key): key for key in keys}
+        self._invalidate_local(list(uuids))
+        deleted = KeyValueDAO.delete_entries(RESOURCE, list(uuids))
+        return [uuids[uuid] for uuid in deleted]
@@ -43,6 +43,7 @@ from superset.extensions import (
     csrf,
     db,
     encrypted_field_factory,
+    engine_manager,
     feature_flag_manager,
     machine_auth_provider_factory,
     manifest_processor,
@@ -422,6 +423,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.configure_async_queries()
         self.configure_ssh_manager()
         self.configure_stats_manager()
+        self.configure_engine_manager()
 
         # Hook that provides administrators a handle on the Flask APP
         # after initialization
@@ -524,6 +526,9 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def configure_ssh_manager(self) -> None:
         ssh_manager_factory.init_app(self.superset_app)
 
+    def configure_engine_manager(self) -> None:
+        engine_manager.init_app(self.superset_app)
+
     def configure_stats_manager(self) -> None:
         stats_logger_manager.init_app(self.superset_app)
 
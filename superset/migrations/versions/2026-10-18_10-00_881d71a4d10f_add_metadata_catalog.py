@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add metadata catalog
+
+Revision ID: 881d71a4d10f
+Revises: 48cbb571fa3a
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "881d71a4d10f"
+down_revision = "48cbb571fa3a"
+
+
+def upgrade():
+    op.create_table(
+        "metadata_catalog_schemas",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("database_id", sa.Integer(), nullable=False),
+        sa.Column("catalog", sa.String(length=256), nullable=False, server_default=""),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("last_refreshed", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["database_id"], ["dbs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "database_id",
+            "catalog",
+            "name",
+            name="uq_metadata_catalog_schemas_name",
+        ),
+    )
+
+    op.create_table(
+        "metadata_catalog_tables",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("schema_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=250), nullable=False),
+        sa.Column("type", sa.String(length=16), nullable=False),
+        sa.Column("comment", sa.Text(), nullable=True),
+        sa.Column("pk_constraint", sa.Text(), nullable=True),
+        sa.Column("foreign_keys", sa.Text(), nullable=True),
+        sa.Column("indexes", sa.Text(), nullable=True),
+        sa.Column("last_refreshed", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["schema_id"],
+            ["metadata_catalog_schemas.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "schema_id",
+            "name",
+            "type",
+            name="uq_metadata_catalog_tables_name",
+        ),
+    )
+
+    op.create_table(
+        "metadata_catalog_columns",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("table_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("type", sa.Text(), nullable=True),
+        sa.Column("nullable", sa.Boolean(), nullable=True),
+        sa.Column("comment", sa.Text(), nullable=True),
+        sa.Column("extra", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["table_id"],
+            ["metadata_catalog_tables.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_metadata_catalog_columns_table_id"),
+        "metadata_catalog_columns",
+        ["table_id"],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_metadata_catalog_columns_table_id"),
+        table_name="metadata_catalog_columns",
+    )
+    op.drop_table("metadata_catalog_columns")
+    op.drop_table("metadata_catalog_tables")
+    op.drop_table("metadata_catalog_schemas")
@@ -25,6 +25,7 @@ import builtins
 import logging
 import textwrap
 from ast import literal_eval
+from collections.abc import Iterator
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
 from datetime import datetime
@@ -54,7 +55,7 @@ from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapper, relationship
 from sqlalchemy.pool import NullPool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
@@ -67,6 +68,7 @@ from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
     cache_manager,
     encrypted_field_factory,
+    engine_manager,
     event_logger,
     security_manager,
     ssh_manager_factory,
@@ -238,6 +240,33 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     def allow_multi_catalog(self) -> bool:
         return self.get_extra().get("allow_multi_catalog", False)
 
+    @property
+    def cache_warmup_concurrency(self) -> int:
+        return int(
+            self.get_extra().get(
+                "cache_warmup_concurrency",
+                config["CACHE_WARMUP_DATABASE_CONCURRENCY"],
+            )
+        )
+
+    @property
+    def chart_data_query_concurrency(self) -> int:
+        return int(
+            self.get_extra().get(
+                "chart_data_query_concurrency",
+                config["CHART_DATA_QUERY_CONCURRENCY"],
+            )
+        )
+
+    @property
+    def time_offset_query_concurrency(self) -> int:
+        return int(
+            self.get_extra().get(
+                "time_offset_query_concurrency",
+                config["TIME_OFFSET_QUERY_CONCURRENCY"],
+            )
+        )
+
     @property
     def schema_options(self) -> dict[str, Any]:
         """Additional schema display config for engines with complex schemas"""
@@ -245,22 +274,29 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
     @property
     def data(self) -> dict[str, Any]:
+        return {
+            **self.short_data,
+            "configuration_method": self.configuration_method,
+            "schema_options": self.schema_options,
+            "parameters": self.parameters,
+            "parameters_schema": self.parameters_schema,
+            "engine_information": self.engine_information,
+        }
+
+    @property
+    def short_data(self) -> dict[str, Any]:
+        """The database fields needed to render charts, without its parameters"""
         return {
             "id": self.id,
             "name": self.database_name,
             "backend": self.backend,
-            "configuration_method": self.configuration_method,
             "allows_subquery": self.allows_subquery,
             "allows_cost_estimate": self.allows_cost_estimate,
             "allows_virtual_table_explore": self.allows_virtual_table_explore,
             "explore_database_id": self.explore_database_id,
-            "schema_options": self.schema_options,
-            "parameters": self.parameters,
             "disable_data_preview": self.disable_data_preview,
             "disable_drill_to_detail": self.disable_drill_to_detail,
             "allow_multi_catalog": self.allow_multi_catalog,
-            "parameters_schema": self.parameters_schema,
-            "engine_information": self.engine_information,
         }
 
     @property
@@ -422,6 +458,17 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             database_id=self.id
         )
 
+        if engine_manager.enabled and (
+            engine := self._get_pooled_sqla_engine(
+                catalog=catalog,
+                schema=schema,
+                source=source,
+                ssh_tunnel=ssh_tunnel,
+            )
+        ):
+            yield engine
+            return
+
         if ssh_tunnel:
             # if ssh_tunnel is available build engine with information
             engine_context = ssh_manager_factory.instance.create_tunnel(
@@ -450,7 +497,56 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 sqlalchemy_uri=sqlalchemy_uri,
             )
 
-    def _get_sqla_engine(  # pylint: disable=too-many-locals
+    def _get_pooled_sqla_engine(
+        self,
+        catalog: str | None = None,
+        schema: str | None = None,
+        source: utils.QuerySource | None = None,
+        ssh_tunnel: SSHTunnel | None = None,
+    ) -> Engine | None:
+        """
+        Return an engine from the process-wide registry, creating it if needed.
+
+        The registry owns the SSH tunnel of the engines it creates, keeping it open for
+        as long as the engine (and its pooled connections) are alive. Returns ``None``
+        when the engine parameters can't be used as a key of the registry.
+        """
+        sqlalchemy_url, params = self._get_sqla_engine_params(
+            catalog=catalog,
+            schema=schema,
+            nullpool=False,
+            source=source,
+        )
+        key = engine_manager.get_key(self.id, sqlalchemy_url, params, ssh_tunnel)
+        if key is None:
+            return None
+
+        def create() -> tuple[Engine, sshtunnel.SSHTunnelForwarder | None]:
+            url = sqlalchemy_url
+            tunnel = None
+            if ssh_tunnel:
+                tunnel = ssh_manager_factory.instance.create_tunnel(
+                    ssh_tunnel=ssh_tunnel,
+                    sqlalchemy_database_uri=self.sqlalchemy_uri_decrypted,
+                )
+                tunnel.start()
+                url = ssh_manager_factory.instance.build_sqla_url(url, tunnel)
+
+            try:
+                engine = create_engine(
+                    url,
+                    **{**engine_manager.get_pool_params(url), **params},
+                )
+            except Exception as ex:
+                if tunnel:
+                    tunnel.stop()
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+            return engine, tunnel
+
+        return engine_manager.get_engine(key, create)
+
+    def _get_sqla_engine(
         self,
         catalog: str | None = None,
         schema: str | None = None,
@@ -458,6 +554,30 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
     ) -> Engine:
+        sqlalchemy_url, params = self._get_sqla_engine_params(
+            catalog=catalog,
+            schema=schema,
+            nullpool=nullpool,
+            source=source,
+            sqlalchemy_uri=sqlalchemy_uri,
+        )
+        try:
+            return create_engine(sqlalchemy_url, **params)
+        except Exception as ex:
+            raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+    def _get_sqla_engine_params(  # pylint: disable=too-many-locals
+        self,
+        catalog: str | None = None,
+        schema: str | None = None,
+        nullpool: bool = True,
+        source: utils.QuerySource | None = None,
+        sqlalchemy_uri: str | None = None,
+    ) -> tuple[URL, dict[str, Any]]:
+        """
+        Resolve the URL and the ``create_engine`` arguments used to connect to the
+        database, including the effective user, OAuth2 token and connection mutator.
+        """
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
         )
@@ -535,10 +655,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 security_manager,
                 source,
             )
-        try:
-            return create_engine(sqlalchemy_url, **params)
-        except Exception as ex:
-            raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        return sqlalchemy_url, params
 
     @contextmanager
     def get_raw_connection(
@@ -554,23 +672,33 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             nullpool=nullpool,
             source=source,
         ) as engine:
-            try:
-                with closing(engine.raw_connection()) as conn:
-                    # pre-session queries are used to set the selected schema and, in the
-                    # future, the selected catalog
-                    for prequery in self.db_engine_spec.get_prequeries(
-                        catalog=catalog,
-                        schema=schema,
-                    ):
-                        cursor = conn.cursor()
-                        cursor.execute(prequery)
+            with self._get_raw_connection(engine, catalog, schema) as conn:
+                yield conn
 
-                    yield conn
+    @contextmanager
+    def _get_raw_connection(
+        self,
+        engine: Engine,
+        catalog: str | None = None,
+        schema: str | None = None,
+    ) -> Iterator[Connection]:
+        try:
+            with closing(engine.raw_connection()) as conn:
+                # pre-session queries are used to set the selected schema and, in the
+                # future, the selected catalog
+                for prequery in self.db_engine_spec.get_prequeries(
+                    catalog=catalog,
+                    schema=schema,
+                ):
+                    cursor = conn.cursor()
+                    cursor.execute(prequery)
 
-            except Exception as ex:
-                if self.is_oauth2_enabled() and self.db_engine_spec.needs_oauth2(ex):
-                    self.db_engine_spec.start_oauth2_dance(self)
-                raise
+                yield conn
+
+        except Exception as ex:
+            if self.is_oauth2_enabled() and self.db_engine_spec.needs_oauth2(ex):
+                self.db_engine_spec.start_oauth2_dance(self)
+            raise
 
     def get_default_catalog(self) -> str | None:
         """
@@ -650,10 +778,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         mutator: Callable[[pd.DataFrame], None] | None = None,
     ) -> pd.DataFrame:
         sqls = self.db_engine_spec.parse_sql(sql)
-        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
-            engine_url = engine.url
 
-        def _log_query(sql: str) -> None:
+        def _log_query(engine_url: URL, sql: str) -> None:
             if log_query:
                 log_query(
                     engine_url,
@@ -663,32 +789,40 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                     security_manager,
                 )
 
-        with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
-            cursor = conn.cursor()
-            df = None
-            for i, sql_ in enumerate(sqls):
-                sql_ = self.mutate_sql_based_on_config(sql_, is_split=True)
-                _log_query(sql_)
-                with event_logger.log_context(
-                    action="execute_sql",
-                    database=self,
-                    object_ref=__name__,
-                ):
-                    self.db_engine_spec.execute(cursor, sql_, self)
-                    if i < len(sqls) - 1:
-                        # If it's not the last, we don't keep the results
-                        cursor.fetchall()
-                    else:
-                        # Last query, fetch and process the results
-                        data = self.db_engine_spec.fetch_data(cursor)
-                        result_set = SupersetResultSet(
-                            data, cursor.description, self.db_engine_spec
-                        )
-                        df = result_set.to_pandas_df()
-            if mutator:
-                df = mutator(df)
-
-            return self.post_process_df(df)
+        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
+            with self._get_raw_connection(engine, catalog, schema) as conn:
+                cursor = conn.cursor()
+                df = None
+                for i, sql_ in enumerate(sqls):
+                    sql_ = self.mutate_sql_based_on_config(sql_, is_split=True)
+                    _log_query(engine.url, sql_)
+                    with event_logger.log_context(
+                        action="execute_sql",
+                        database=self,
+                        object_ref=__name__,
+                    ):
+                        self.db_engine_spec.execute(cursor, sql_, self)
+                        if i < len(sqls) - 1:
+                            # If it's not the last, we don't keep the results
+                            cursor.fetchall()
+                        else:
+                            # Last query, fetch and process the results
+                            data = self.db_engine_spec.fetch_arrow_data(cursor)
+                            if data is None:
+                                result_set = SupersetResultSet.from_batches(
+                                    self.db_engine_spec.fetch_data_in_batches(cursor),
+                                    cursor.description,
+                                    self.db_engine_spec,
+                                )
+                            else:
+                                result_set = SupersetResultSet(
+                                    data, cursor.description, self.db_engine_spec
+                                )
+                            df = result_set.to_pandas_df()
+                if mutator:
+                    df = mutator(df)
+
+                return self.post_process_df(df)
 
     def compile_sqla_query(
         self,
@@ -1101,6 +1235,18 @@ sqla.event.listen(Database, "after_update", security_manager.database_after_upda
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
 
 
+def invalidate_database_engines(
+    _mapper: Mapper,
+    _connection: Connection,
+    target: Database,
+) -> None:
+    engine_manager.invalidate(target.id)
+
+
+sqla.event.listen(Database, "after_update", invalidate_database_engines)
+sqla.event.listen(Database, "after_delete", invalidate_database_engines)
+
+
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
     """
     Store OAuth2 tokens, for authenticating to DBs using user personal tokens.
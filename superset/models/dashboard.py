@@ -271,14 +271,29 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
         for slc in self.slices:
             slices_by_datasource[(slc.cls_model, slc.datasource_id)].add(slc)
 
-        result: list[dict[str, Any]] = []
+        datasource_ids_by_cls_model: dict[type[BaseDatasource], set[int]] = defaultdict(
+            set
+        )
+        for cls_model, datasource_id in slices_by_datasource:
+            datasource_ids_by_cls_model[cls_model].add(datasource_id)
+
+        # load the datasources of each type at once, with the relationships needed to
+        # build their payload
+        datasources: dict[tuple[type[BaseDatasource], int], BaseDatasource] = {}
+        for cls_model, datasource_ids in datasource_ids_by_cls_model.items():
+            for datasource in (
+                cls_model.get_eager_sqlatable_datasources(datasource_ids)
+                if issubclass(cls_model, SqlaTable)
+                else db.session.query(cls_model)
+                .filter(cls_model.id.in_(datasource_ids))
+                .all()
+            ):
+                datasources[(cls_model, datasource.id)] = datasource
 
-        for (cls_model, datasource_id), slices in slices_by_datasource.items():
-            datasource = (
-                db.session.query(cls_model).filter_by(id=datasource_id).one_or_none()
-            )
+        result: list[dict[str, Any]] = []
 
-            if datasource:
+        for key, slices in slices_by_datasource.items():
+            if datasource := datasources.get(key):
                 # Filter out unneeded fields from the datasource payload
                 result.append(datasource.data_for_slices(slices))
 
@@ -0,0 +1,143 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Models of the metadata catalog, a copy of the schemas, tables and columns of the
+databases stored in the metadata database.
+
+Listing the tables of large warehouses, or inspecting their columns, can take a long
+time, so the catalog is crawled in the background and read instead of inspecting the
+databases, see `MetadataCatalogDAO`.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import sqlalchemy as sa
+from flask_appbuilder import Model
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import relationship
+
+from superset.utils import json
+
+
+class MetadataCatalogSchema(Model):  # pylint: disable=too-few-public-methods
+    """A schema of a database, with the time its tables were last refreshed"""
+
+    __tablename__ = "metadata_catalog_schemas"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "database_id",
+            "catalog",
+            "name",
+            name="uq_metadata_catalog_schemas_name",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    database_id = Column(
+        Integer,
+        ForeignKey("dbs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # empty for databases without catalogs, as NULLs are distinct in the constraint
+    catalog = Column(String(256), nullable=False, default="", server_default="")
+    name = Column(String(255), nullable=False)
+    # None until the tables of the schema are crawled
+    last_refreshed = Column(DateTime, nullable=True)
+
+    database = relationship("Database", foreign_keys=[database_id])
+    tables: list[MetadataCatalogTable] = relationship(
+        "MetadataCatalogTable",
+        back_populates="schema",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class MetadataCatalogTable(Model):  # pylint: disable=too-few-public-methods
+    """A table or view of a schema, with the time its details were last refreshed"""
+
+    __tablename__ = "metadata_catalog_tables"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "schema_id",
+            "name",
+            "type",
+            name="uq_metadata_catalog_tables_name",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    schema_id = Column(
+        Integer,
+        ForeignKey("metadata_catalog_schemas.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    name = Column(String(250), nullable=False)
+    type = Column(String(16), nullable=False)
+    comment = Column(Text, nullable=True)
+    # JSON encoded results of the inspector
+    pk_constraint = Column(Text, nullable=True)
+    foreign_keys = Column(Text, nullable=True)
+    indexes = Column(Text, nullable=True)
+    # None until the columns, keys and indexes of the table are inspected
+    last_refreshed = Column(DateTime, nullable=True)
+
+    schema = relationship("MetadataCatalogSchema", back_populates="tables")
+    columns: list[MetadataCatalogColumn] = relationship(
+        "MetadataCatalogColumn",
+        back_populates="table",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="MetadataCatalogColumn.position",
+    )
+
+    @property
+    def pk_constraint_dict(self) -> dict[str, Any]:
+        return json.loads(self.pk_constraint or "{}")
+
+    @property
+    def foreign_keys_list(self) -> list[dict[str, Any]]:
+        return json.loads(self.foreign_keys or "[]")
+
+    @property
+    def indexes_list(self) -> list[dict[str, Any]]:
+        return json.loads(self.indexes or "[]")
+
+
+class MetadataCatalogColumn(Model):  # pylint: disable=too-few-public-methods
+    """A column of a table, with its type as a string"""
+
+    __tablename__ = "metadata_catalog_columns"
+
+    id = Column(Integer, primary_key=True)
+    table_id = Column(
+        Integer,
+        ForeignKey("metadata_catalog_tables.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    position = Column(Integer, nullable=False)
+    name = Column(String(255), nullable=False)
+    type = Column(Text, nullable=True)
+    nullable = Column(Boolean, nullable=True)
+    comment = Column(Text, nullable=True)
+    # JSON encoded engine specific attributes, eg, `query_as` for Presto rows
+    extra = Column(Text, nullable=True)
+
+    table = relationship("MetadataCatalogTable", back_populates="columns")
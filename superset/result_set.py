@@ -18,7 +18,8 @@
 
 import datetime
 import logging
-from typing import Any, Optional
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -102,17 +103,14 @@ def convert_to_string(value: Any) -> str:
 class SupersetResultSet:
     def __init__(  # pylint: disable=too-many-locals
         self,
-        data: DbapiResult,
+        data: Union[DbapiResult, pa.Table],
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
         pa_data: list[pa.Array] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
 
         if cursor_description:
             # get deduped list of column names
@@ -126,55 +124,15 @@ class SupersetResultSet:
                 for column_name, description in zip(column_names, cursor_description)
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            # columnar data, fetched natively or built from batches of rows
+            if not column_names:
+                column_names = dedup(
+                    [convert_to_string(name) for name in data.column_names]
+                )
+            pa_data = self._arrays_from_table(data)
+        else:
+            pa_data = self._arrays_from_rows(data or [], len(column_names))
 
         if not pa_data:
             column_names = []
@@ -191,6 +149,149 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @classmethod
+    def from_batches(
+        cls,
+        batches: Iterable[DbapiResult],
+        cursor_description: DbapiDescription,
+        db_engine_spec: type[BaseEngineSpec],
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from batches of rows, eg, ``fetch_data_in_batches``.
+
+        Each batch is converted to Arrow as soon as it is received, so only one batch
+        of Python rows is held in memory at a time.
+        """
+        num_columns = len(cursor_description or [])
+        chunks: list[list[pa.Array]] = [[] for _ in range(num_columns)]
+        for batch in batches:
+            for idx, array in enumerate(cls._arrays_from_rows(batch, num_columns)):
+                chunks[idx].append(array)
+
+        pa_data = [cls._combine_chunks(column) for column in chunks if column]
+        table = pa.Table.from_arrays(
+            pa_data,
+            names=[str(idx) for idx in range(len(pa_data))],
+        )
+        return cls(table, cursor_description, db_engine_spec)
+
+    @classmethod
+    def _arrays_from_rows(
+        cls,
+        data: DbapiResult,
+        num_columns: int,
+    ) -> list[pa.Array]:
+        """
+        Pivot a row-oriented DB-API result into one Arrow array per column.
+
+        Each column is handed to Arrow as a plain list of Python objects, without
+        building an intermediate NumPy structured array of the whole result.
+        """
+        if not data or not num_columns:
+            return []
+
+        return [
+            cls._array_from_values([row[idx] for row in data])
+            for idx in range(num_columns)
+        ]
+
+    @classmethod
+    def _array_from_values(cls, values: Sequence[Any]) -> pa.Array:
+        try:
+            array = pa.array(values)
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # attempt serialization of values as strings
+            array = cls._stringify_array(values)
+
+        if pa.types.is_nested(array.type):
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Superset
+            #  (superset.utils.core.GenericDataType).
+            array = cls._stringify_array(values)
+        elif pa.types.is_temporal(array.type):
+            array = cls._localize_temporal_array(array, values)
+
+        return array
+
+    @classmethod
+    def _combine_chunks(cls, chunks: list[pa.Array]) -> pa.ChunkedArray:
+        """
+        Combine the arrays built for a column from each batch.
+
+        Batches that only contain nulls are cast to the type of the other batches. If
+        the batches disagree on the type, eg, integers followed by floats, the values
+        are converted again as a whole, as if they had been fetched at once.
+        """
+        dtypes = {chunk.type for chunk in chunks if not pa.types.is_null(chunk.type)}
+        if len(dtypes) > 1:
+            values = [value for chunk in chunks for value in chunk.to_pylist()]
+            return pa.chunked_array([cls._array_from_values(values)])
+
+        dtype = dtypes.pop() if dtypes else pa.null()
+        return pa.chunked_array(
+            [
+                chunk if chunk.type == dtype else pa.nulls(len(chunk), dtype)
+                for chunk in chunks
+            ],
+            type=dtype,
+        )
+
+    @classmethod
+    def _arrays_from_table(cls, table: pa.Table) -> list[pa.ChunkedArray]:
+        """
+        Extract the columns of an Arrow table returned natively by the driver.
+
+        Nested columns are stringified to match the row-based path.
+        """
+        if not table.num_columns or not table.num_rows:
+            return []
+
+        pa_data: list[pa.ChunkedArray] = []
+        for array in table.columns:
+            if pa.types.is_dictionary(array.type):
+                array = array.cast(array.type.value_type)
+            if pa.types.is_nested(array.type):
+                array = pa.chunked_array([cls._stringify_array(array.to_pylist())])
+            pa_data.append(array)
+
+        return pa_data
+
+    @staticmethod
+    def _stringify_array(values: Sequence[Any]) -> pa.Array:
+        array = np.fromiter(values, dtype=object, count=len(values))
+        return pa.array(stringify_values(array).tolist())
+
+    @classmethod
+    def _localize_temporal_array(
+        cls,
+        array: pa.Array,
+        values: Sequence[Any],
+    ) -> pa.Array:
+        # workaround for bug converting
+        # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+        # related: https://issues.apache.org/jira/browse/ARROW-5248
+        sample = cls.first_nonempty(values)
+        if sample and isinstance(sample, datetime.datetime):
+            try:
+                if sample.tzinfo:
+                    tz = sample.tzinfo
+                    series = pd.Series(values)
+                    series = pd.to_datetime(series)
+                    return pa.Array.from_pandas(
+                        series,
+                        type=pa.timestamp("ns", tz=tz),
+                    )
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.exception(ex)
+        return array
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -213,7 +314,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Sequence[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
@@ -21,14 +21,15 @@ import logging
 import re
 import time
 from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
+from uuid import uuid4
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
     assoc_permissionview_role,
-    assoc_user_role,
     Permission,
     PermissionView,
     Role,
@@ -50,7 +51,6 @@ from sqlalchemy import and_, inspect, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import eagerload
 from sqlalchemy.orm.mapper import Mapper
-from sqlalchemy.orm.query import Query as SqlaQuery
 
 from superset.constants import RouteMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -79,11 +79,7 @@ from superset.utils.urls import get_url_host
 
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
-    from superset.connectors.sqla.models import (
-        BaseDatasource,
-        RowLevelSecurityFilter,
-        SqlaTable,
-    )
+    from superset.connectors.sqla.models import BaseDatasource, SqlaTable
     from superset.models.core import Database
     from superset.models.dashboard import Dashboard
     from superset.models.slice import Slice
@@ -101,6 +97,16 @@ class DatabaseCatalogSchema(NamedTuple):
     schema: str
 
 
+class RLSFilter(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
+RLS_FILTERS_VERSION_CACHE_KEY = "rls_filters_version"
+PERMISSIONS_VERSION_CACHE_KEY = "permissions_version"
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -438,6 +444,29 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             return self.is_item_public(permission_name, view_name)
         return self._has_view_access(user, permission_name, view_name)
 
+    def _has_view_access(
+        self,
+        user: object,
+        permission_name: str,
+        view_name: str,
+    ) -> bool:
+        """
+        Return True if the user's roles grant the FAB permission/view, False otherwise.
+
+        Unlike the FAB implementation, which queries the metadata database on every
+        call, permissions of the database roles are checked against their cached
+        permission matrix.
+        """
+        db_role_ids = []
+        for role in user.roles:  # type: ignore
+            if role.name in self.builtin_roles:
+                if self._has_access_builtin_roles(role, permission_name, view_name):
+                    return True
+            else:
+                db_role_ids.append(role.id)
+
+        return (permission_name, view_name) in self.get_roles_permissions(db_role_ids)
+
     def can_access_all_queries(self) -> bool:
         """
         Return True if the user can access all SQL Lab queries, False otherwise.
@@ -722,34 +751,140 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
-        base_query = (
-            self.get_session.query(self.viewmenu_model.name)
-            .join(self.permissionview_model)
-            .join(self.permission_model)
-            .join(assoc_permissionview_role)
-            .join(self.role_model)
+        if not g.user.is_anonymous:
+            # only users stored in the database, eg, not guest users
+            if get_user_id() is None:
+                return set()
+            role_ids = [role.id for role in g.user.roles]
+        # Properly treat anonymous user
+        elif public_role := self.get_public_role():
+            role_ids = [public_role.id]
+        else:
+            return set()
+
+        return {
+            view_menu_name
+            for name, view_menu_name in self.get_roles_permissions(role_ids)
+            if name == permission_name
+        }
+
+    def get_roles_permissions(
+        self,
+        role_ids: Iterable[int],
+    ) -> frozenset[tuple[str, str]]:
+        """
+        Return the (permission, view menu) pairs granted by a set of roles.
+
+        The pairs are compiled per role and cached in the shared cache, and their union
+        is cached for the duration of the request, so that access checks are set
+        lookups. The shared cache is invalidated by bumping a version whenever roles,
+        permissions or view menus are modified.
+
+        :param role_ids: The IDs of the roles
+        :returns: The permission matrix of the roles
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        role_ids = sorted(set(role_ids))
+        key = ",".join(str(role_id) for role_id in role_ids)
+        request_cache: dict[str, frozenset[tuple[str, str]]] = g.setdefault(
+            "permission_matrices", {}
         )
+        if key in request_cache:
+            return request_cache[key]
 
-        if not g.user.is_anonymous:
-            # filter by user id
-            view_menu_names = (
-                base_query.join(assoc_user_role)
-                .join(self.user_model)
-                .filter(self.user_model.id == get_user_id())
-                .filter(self.permission_model.name == permission_name)
-            ).all()
-            return {s.name for s in view_menu_names}
+        version = self.get_permissions_version()
+        cache_keys = {
+            role_id: f"permissions:{version}:{role_id}" for role_id in role_ids
+        }
+        roles_permissions = {
+            role_id: permissions
+            for role_id, permissions in zip(
+                role_ids,
+                cache_manager.cache.get_many(*cache_keys.values()),
+            )
+            if permissions is not None
+        }
+        if missing := [
+            role_id for role_id in role_ids if role_id not in roles_permissions
+        ]:
+            compiled = self._query_roles_permissions(missing)
+            cache_manager.cache.set_many(
+                {cache_keys[role_id]: compiled[role_id] for role_id in missing},
+                timeout=current_app.config["PERMISSIONS_CACHE_TIMEOUT"],
+            )
+            roles_permissions.update(compiled)
 
-        # Properly treat anonymous user
-        if public_role := self.get_public_role():
-            # filter by public role
-            view_menu_names = (
-                base_query.filter(self.role_model.id == public_role.id).filter(
-                    self.permission_model.name == permission_name
-                )
-            ).all()
-            return {s.name for s in view_menu_names}
-        return set()
+        permissions = frozenset().union(*roles_permissions.values())
+        request_cache[key] = permissions
+        return permissions
+
+    def _query_roles_permissions(
+        self,
+        role_ids: list[int],
+    ) -> dict[int, frozenset[tuple[str, str]]]:
+        query = (
+            self.get_session.query(
+                assoc_permissionview_role.c.role_id,
+                self.permission_model.name,
+                self.viewmenu_model.name,
+            )
+            .select_from(assoc_permissionview_role)
+            .join(
+                self.permissionview_model,
+                self.permissionview_model.id
+                == assoc_permissionview_role.c.permission_view_id,
+            )
+            .join(
+                self.permission_model,
+                self.permission_model.id == self.permissionview_model.permission_id,
+            )
+            .join(
+                self.viewmenu_model,
+                self.viewmenu_model.id == self.permissionview_model.view_menu_id,
+            )
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+        )
+
+        permissions: dict[int, set[tuple[str, str]]] = {
+            role_id: set() for role_id in role_ids
+        }
+        for role_id, permission_name, view_menu_name in query.all():
+            permissions[role_id].add((permission_name, view_menu_name))
+
+        return {
+            role_id: frozenset(role_permissions)
+            for role_id, role_permissions in permissions.items()
+        }
+
+    @staticmethod
+    def get_permissions_version() -> str:
+        """
+        Return the current version of the permissions, used to namespace the cached
+        permission matrices.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        version = cache_manager.cache.get(PERMISSIONS_VERSION_CACHE_KEY)
+        if version is None:
+            version = uuid4().hex
+            cache_manager.cache.set(PERMISSIONS_VERSION_CACHE_KEY, version, timeout=0)
+        return version
+
+    @staticmethod
+    def bump_permissions_version() -> None:
+        """
+        Invalidate the cached permission matrices, in every process, after a change
+        to the roles, the permissions or the view menus.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache_manager.cache.set(PERMISSIONS_VERSION_CACHE_KEY, uuid4().hex, timeout=0)
+        if has_app_context():
+            g.pop("permission_matrices", None)
 
     def get_accessible_databases(self) -> list[int]:
         """
@@ -2442,11 +2577,15 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource") -> list[SqlaQuery]:
+    def get_rls_filters(self, table: "BaseDatasource") -> list[RLSFilter]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        The filters are resolved once per combination of roles and table, and cached
+        both for the duration of the request and in the shared cache. The shared cache
+        is invalidated by bumping a version whenever RLS filters are modified.
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -2454,6 +2593,35 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        role_ids = sorted({role.id for role in self.get_user_roles(g.user)})
+        key = f"{table.id}:{','.join(str(role_id) for role_id in role_ids)}"
+        request_cache: dict[str, list[RLSFilter]] = g.setdefault("rls_filters", {})
+        if key in request_cache:
+            return list(request_cache[key])
+
+        cache_key = f"rls_filters:{self.get_rls_filters_version()}:{key}"
+        filters = cache_manager.cache.get(cache_key)
+        if filters is None:
+            filters = [
+                RLSFilter(*row) for row in self._query_rls_filters(table, role_ids)
+            ]
+            cache_manager.cache.set(
+                cache_key,
+                filters,
+                timeout=current_app.config["RLS_FILTERS_CACHE_TIMEOUT"],
+            )
+
+        request_cache[key] = filters
+        return list(filters)
+
+    def _query_rls_filters(
+        self,
+        table: "BaseDatasource",
+        role_ids: list[int],
+    ) -> list[tuple[int, Optional[str], str]]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2461,14 +2629,13 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
             .filter(
                 RowLevelSecurityFilter.filter_type == RowLevelSecurityFilterType.REGULAR
             )
-            .filter(RLSFilterRoles.c.role_id.in_(user_roles))
+            .filter(RLSFilterRoles.c.role_id.in_(role_ids))
         )
         base_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
@@ -2476,7 +2643,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(
                 RowLevelSecurityFilter.filter_type == RowLevelSecurityFilterType.BASE
             )
-            .filter(RLSFilterRoles.c.role_id.in_(user_roles))
+            .filter(RLSFilterRoles.c.role_id.in_(role_ids))
         )
         filter_tables = self.get_session.query(RLSFilterTables.c.rls_filter_id).filter(
             RLSFilterTables.c.table_id == table.id
@@ -2505,7 +2672,35 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
         return query.all()
 
-    def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
+    @staticmethod
+    def get_rls_filters_version() -> str:
+        """
+        Return the current version of the RLS filters, used to namespace the cached
+        filters.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        version = cache_manager.cache.get(RLS_FILTERS_VERSION_CACHE_KEY)
+        if version is None:
+            version = uuid4().hex
+            cache_manager.cache.set(RLS_FILTERS_VERSION_CACHE_KEY, version, timeout=0)
+        return version
+
+    @staticmethod
+    def bump_rls_filters_version() -> None:
+        """
+        Invalidate the cached RLS filters, in every process, after a change to the
+        filters, their roles or their tables.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache_manager.cache.set(RLS_FILTERS_VERSION_CACHE_KEY, uuid4().hex, timeout=0)
+        if has_app_context():
+            g.pop("rls_filters", None)
+
+    def get_rls_sorted(self, table: "BaseDatasource") -> list[RLSFilter]:
         """
         Retrieves a list RLS filters sorted by ID for
         the current user and the passed table.
@@ -20,10 +20,12 @@ from __future__ import annotations
 import enum
 import logging
 import re
+import threading
 import urllib.parse
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 
 import sqlglot
 import sqlparse
@@ -33,10 +35,13 @@ from sqlglot.dialects.dialect import Dialect, Dialects
 from sqlglot.errors import ParseError
 from sqlglot.optimizer.scope import Scope, ScopeType, traverse_scope
 
+from superset.constants import LRU_CACHE_MAX_SIZE
 from superset.exceptions import SupersetParseError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # mapping between DB engine specs and sqlglot dialects
 SQLGLOT_DIALECTS = {
@@ -95,6 +100,80 @@ SQLGLOT_DIALECTS = {
 }
 
 
+class ParseCache:
+    """
+    A thread-safe LRU cache for the results of parsing SQL.
+
+    The same SQL is usually parsed multiple times while handling a single request (eg,
+    to check permissions, to apply a limit or RLS, and to check if it's read-only), so
+    the parsed statements and the facts derived from them are memoized per process.
+    Keys should include the SQL and the engine, and cached values are shared between
+    callers, so they MUST NOT be mutated.
+
+    Lookups are reported to the stats logger as `sql_parse_cache.hit` and
+    `sql_parse_cache.miss`.
+    """
+
+    def __init__(self, max_size: int = LRU_CACHE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._values: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Return the cached value for a key, computing it on a miss.
+
+        Exceptions raised by the function are not cached.
+
+        :param key: The cache key
+        :param func: Function computing the value
+        :return: The cached value
+        """
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                self._values.move_to_end(key)
+                value = self._values[key]
+                hit = True
+            else:
+                self.misses += 1
+                hit = False
+
+        self._incr("hit" if hit else "miss")
+        if hit:
+            return value
+
+        value = func()
+        with self._lock:
+            self._values[key] = value
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self.hits = self.misses = 0
+
+    @staticmethod
+    def _incr(event: str) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import stats_logger_manager
+
+        stats_logger_manager.instance.incr(f"sql_parse_cache.{event}")
+
+
+parse_cache = ParseCache()
+
+
 @dataclass(eq=True, frozen=True)
 class Table:
     """
@@ -245,6 +324,7 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         ast: exp.Expression | None = None,
     ):
         self._dialect = SQLGLOT_DIALECTS.get(engine)
+        self._is_mutating: bool | None = None
         super().__init__(statement, engine, ast)
 
     @classmethod
@@ -276,6 +356,19 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         cls,
         script: str,
         engine: str,
+    ) -> list[SQLStatement]:
+        return list(
+            parse_cache.get(
+                (cls, script.strip(), engine),
+                lambda: cls._split_script(script, engine),
+            )
+        )
+
+    @classmethod
+    def _split_script(
+        cls,
+        script: str,
+        engine: str,
     ) -> list[SQLStatement]:
         if dialect := SQLGLOT_DIALECTS.get(engine):
             try:
@@ -352,6 +445,12 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
 
         :return: True if the statement mutates data.
         """
+        # statements are shared through the parse cache, so this is computed once
+        if self._is_mutating is None:
+            self._is_mutating = self._check_is_mutating()
+        return self._is_mutating
+
+    def _check_is_mutating(self) -> bool:
         for node in self._parsed.walk():
             if isinstance(
                 node,
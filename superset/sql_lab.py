@@ -59,9 +59,10 @@ from superset.sql_parse import (
     insert_rls_in_predicate,
     ParsedQuery,
 )
+from superset.sqllab.chunked_results import CHUNKS_KEY, write_chunks
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
 from superset.utils import json
+from superset.utils.arrow import write_ipc_buffer
 from superset.utils.core import (
     override_user,
     QuerySource,
@@ -307,7 +308,9 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
                     query.id,
                     str(query.to_dict()),
                 )
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                data = db_engine_spec.fetch_arrow_data(cursor, increased_limit)
+                if data is None:
+                    data = db_engine_spec.fetch_data(cursor, increased_limit)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -568,9 +571,25 @@ def execute_sql_statements(
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
+    # Arrow data is stored in chunks, which are serialized when they are written
+    chunk_size = (
+        config["RESULTS_BACKEND_CHUNK_SIZE"]
+        if use_arrow_data and results_backend
+        else None
     )
+    if chunk_size:
+        data = None
+        selected_columns = all_columns = result_set.columns
+        expanded_columns = []
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            result_set, db_engine_spec, use_arrow_data, expand_data
+        )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
@@ -592,15 +611,29 @@ def execute_sql_statements(
             "Query %s: Storing results in results backend, key: %s", str(query_id), key
         )
         with stats_timing("sqllab.query.results_backend_write", stats_logger):
+            cache_timeout = database.cache_timeout
+            if cache_timeout is None:
+                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
+
+            if chunk_size:
+                # the chunks are written before the payload referencing them
+                with stats_timing(
+                    "sqllab.query.results_backend_write_chunks", stats_logger
+                ):
+                    payload[CHUNKS_KEY] = write_chunks(
+                        results_backend,
+                        key,
+                        result_set.pa_table,
+                        chunk_size,
+                        cache_timeout,
+                    )
+
             with stats_timing(
                 "sqllab.query.results_backend_write_serialization", stats_logger
             ):
                 serialized_payload = _serialize_payload(
                     payload, cast(bool, results_backend_use_msgpack)
                 )
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
 
             compressed = zlib_compress(serialized_payload)
             logger.debug(
@@ -613,6 +646,7 @@ def execute_sql_statements(
     query.status = QueryStatus.SUCCESS
     db.session.commit()
 
+    payload.pop(CHUNKS_KEY, None)
     if return_results:
         # since we're returning results we need to create non-arrow data
         if use_arrow_data:
@@ -61,7 +61,7 @@ from superset.exceptions import (
     SupersetSecurityException,
 )
 from superset.sql.parse import (
-    extract_tables_from_statement,
+    parse_cache,
     SQLGLOT_DIALECTS,
     SQLScript,
     SQLStatement,
@@ -216,12 +216,16 @@ class ParsedQuery:
         self._dialect = SQLGLOT_DIALECTS.get(engine) if engine else None
         self._tables: set[Table] = set()
         self._alias_names: set[str] = set()
-        self._limit: int | None = None
+        self._statements: list[TokenList] | None = None
 
-        logger.debug("Parsing with sqlparse statement: %s", self.sql)
-        self._parsed = sqlparse.parse(self.stripped())
-        for statement in self._parsed:
-            self._limit = _extract_limit_from_query(statement)
+    @property
+    def _parsed(self) -> list[TokenList]:
+        # the tokens are mutated when applying limits or RLS, so unlike the facts
+        # derived from them they are not shared through the parse cache
+        if self._statements is None:
+            logger.debug("Parsing with sqlparse statement: %s", self.sql)
+            self._statements = sqlparse.parse(self.stripped())
+        return self._statements
 
     @property
     def tables(self) -> set[Table]:
@@ -264,10 +268,7 @@ class ParsedQuery:
         Note: this uses sqlglot, since it's better at catching more edge cases.
         """
         try:
-            statements = [
-                statement._parsed  # pylint: disable=protected-access
-                for statement in SQLScript(self.stripped(), self._engine).statements
-            ]
+            statements = SQLScript(self.stripped(), self._engine).statements
         except SupersetParseError as ex:
             logger.warning("Unable to parse SQL (%s): %s", self._dialect, self.sql)
             raise SupersetSecurityException(
@@ -280,16 +281,20 @@ class ParsedQuery:
                 )
             ) from ex
 
-        return {
-            table
-            for statement in statements
-            for table in extract_tables_from_statement(statement, self._dialect)
-            if statement
-        }
+        return {table for statement in statements for table in statement.tables}
 
     @property
     def limit(self) -> int | None:
-        return self._limit
+        return parse_cache.get(
+            ("limit", self.stripped(), self._engine),
+            self._extract_limit,
+        )
+
+    def _extract_limit(self) -> int | None:
+        limit = None
+        for statement in self._parsed:
+            limit = _extract_limit_from_query(statement)
+        return limit
 
     def _get_cte_tables(self, parsed: dict[str, Any]) -> list[dict[str, Any]]:
         if "with" not in parsed:
@@ -319,6 +324,12 @@ class ParsedQuery:
         return True
 
     def is_select(self) -> bool:
+        return parse_cache.get(
+            ("is_select", self.stripped(), self._engine),
+            self._check_is_select,
+        )
+
+    def _check_is_select(self) -> bool:
         # make sure we strip comments; prevents a bug with comments in the CTE
         parsed = sqlparse.parse(self.strip_comments())
         seen_select = False
@@ -507,7 +518,7 @@ class ParsedQuery:
         :param new_limit: Limit to be incorporated into returned query
         :return: The original query with new limit
         """
-        if not self._limit:
+        if not self.limit:
             return f"{self.stripped()}\nLIMIT {new_limit}"
         limit_pos = None
         statement = self._parsed[0]
@@ -18,7 +18,7 @@ import logging
 from typing import Any, cast, Optional
 from urllib import parse
 
-from flask import request, Response
+from flask import request, Response, stream_with_context
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -29,6 +29,7 @@ from superset.commands.sql_lab.estimate import QueryEstimationCommand
 from superset.commands.sql_lab.execute import CommandResult, ExecuteSqlCommand
 from superset.commands.sql_lab.export import SqlResultExportCommand
 from superset.commands.sql_lab.results import SqlExecutionResultsCommand
+from superset.common.chart_data import ChartDataResultFormat
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP
 from superset.daos.database import DatabaseDAO
 from superset.daos.query import QueryDAO
@@ -62,7 +63,13 @@ from superset.sqllab.utils import bootstrap_sqllab_data
 from superset.sqllab.validators import CanAccessQueryValidatorImpl
 from superset.superset_typing import FlaskResponse
 from superset.utils import core as utils, json
-from superset.views.base import CsvResponse, generate_download_headers, json_success
+from superset.utils.arrow import write_ipc_buffer
+from superset.views.base import (
+    ArrowResponse,
+    CsvResponse,
+    generate_download_headers,
+    json_success,
+)
 from superset.views.base_api import BaseSupersetApi, requires_json, statsd_metrics
 
 config = app.config
@@ -271,13 +278,14 @@ class SqlLabRestApi(BaseSupersetApi):
             500:
               $ref: '#/components/responses/500'
         """
-        result = SqlResultExportCommand(client_id=client_id).run()
+        result = SqlResultExportCommand(client_id=client_id, stream=True).run()
 
         query, data, row_count = result["query"], result["data"], result["count"]
 
         quoted_csv_name = parse.quote(query.name)
         response = CsvResponse(
-            data, headers=generate_download_headers("csv", quoted_csv_name)
+            stream_with_context(data),
+            headers=generate_download_headers("csv", quoted_csv_name),
         )
         event_info = {
             "event_type": "data_export",
@@ -339,7 +347,21 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        as_arrow = params.get("result_format") == ChartDataResultFormat.ARROW
+        result = SqlExecutionResultsCommand(
+            key=key,
+            rows=rows,
+            as_table=as_arrow,
+            offset=params.get("offset", 0),
+            limit=params.get("limit"),
+        ).run()
+
+        if as_arrow:
+            table = result.pop("data")
+            buffer = write_ipc_buffer(
+                table, result, app.config["ARROW_IPC_COMPRESSION"]
+            )
+            return ArrowResponse(buffer.to_pybytes())
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
@@ -0,0 +1,143 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Chunked storage of SQL Lab results in the results backend.
+
+Instead of a single compressed blob, the rows of the results are stored as Arrow
+record batches of a fixed number of rows, each compressed on its own under a key
+derived from the results key. The payload stored under the results key acts as a
+manifest: it holds the query metadata and the number of rows of each chunk, so that
+a page of the results can be read by only fetching the chunks holding it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, Optional
+
+import pyarrow as pa
+from flask_caching.backends.base import BaseCache
+
+from superset.exceptions import SerializationError
+from superset.utils.arrow import write_ipc_buffer
+from superset.utils.core import zlib_compress, zlib_decompress
+
+# key of the payload entry describing the chunks of the results
+CHUNKS_KEY = "chunks"
+
+
+def get_chunk_key(key: str, index: int) -> str:
+    return f"{key}:chunk:{index}"
+
+
+def write_chunks(
+    backend: BaseCache,
+    key: str,
+    table: pa.Table,
+    chunk_size: int,
+    timeout: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Store a table in the results backend as compressed chunks of ``chunk_size`` rows.
+
+    Empty tables are stored as a single empty chunk, so that their schema is kept.
+
+    :param backend: The results backend
+    :param key: The results key
+    :param table: The results
+    :param chunk_size: The number of rows per chunk
+    :param timeout: The timeout of the chunks in the results backend
+    :returns: The manifest of the chunks, to store in the payload as ``CHUNKS_KEY``
+    """
+    rows = []
+    chunks = {}
+    for index, offset in enumerate(range(0, max(table.num_rows, 1), chunk_size)):
+        chunk = table.slice(offset, chunk_size)
+        buffer = write_ipc_buffer(chunk.combine_chunks())
+        chunks[get_chunk_key(key, index)] = zlib_compress(buffer.to_pybytes())
+        rows.append(chunk.num_rows)
+
+    backend.set_many(chunks, timeout)
+    return {"rows": rows}
+
+
+def _read_chunk(blob: bytes) -> pa.Table:
+    try:
+        reader = pa.BufferReader(zlib_decompress(blob, decode=False))
+        return pa.ipc.open_stream(reader).read_all()
+    except pa.ArrowException as ex:
+        raise SerializationError("Unable to deserialize results chunk") from ex
+
+
+def read_chunks(
+    backend: BaseCache,
+    key: str,
+    manifest: dict[str, Any],
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> pa.Table:
+    """
+    Read ``limit`` rows of chunked results, starting at row ``offset``.
+
+    Only the chunks holding the requested rows are fetched from the results backend.
+
+    :param backend: The results backend
+    :param key: The results key
+    :param manifest: The manifest of the chunks
+    :param offset: The index of the first row to read
+    :param limit: The maximum number of rows to read, all if None
+    :returns: The requested rows
+    :raises SerializationError: If a chunk expired or can't be deserialized
+    """
+    indexes: list[int] = []
+    first_row = start = 0
+    for index, count in enumerate(manifest["rows"]):
+        end = start + count
+        if end > offset and (limit is None or start < offset + limit):
+            if not indexes:
+                first_row = start
+            indexes.append(index)
+        start = end
+
+    if not indexes:
+        # the offset is past the last row, read the last chunk for the schema
+        indexes = [len(manifest["rows"]) - 1]
+        first_row = start - manifest["rows"][-1]
+
+    blobs = backend.get_many(*[get_chunk_key(key, index) for index in indexes])
+    if any(blob is None for blob in blobs):
+        raise SerializationError("Results chunk not found")
+
+    table = pa.concat_tables([_read_chunk(blob) for blob in blobs])
+    return table.slice(offset - first_row, limit)
+
+
+def iter_chunks(
+    backend: BaseCache,
+    key: str,
+    manifest: dict[str, Any],
+) -> Iterator[pa.Table]:
+    """
+    Read chunked results one chunk at a time.
+
+    :raises SerializationError: If a chunk expired or can't be deserialized
+    """
+    for index in range(len(manifest["rows"])):
+        blob = backend.get(get_chunk_key(key, index))
+        if blob is None:
+            raise SerializationError("Results chunk not found")
+        yield _read_chunk(blob)
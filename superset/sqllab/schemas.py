@@ -22,6 +22,10 @@ sql_lab_get_results_schema = {
     "type": "object",
     "properties": {
         "key": {"type": "string"},
+        "rows": {"type": "integer"},
+        "offset": {"type": "integer", "minimum": 0},
+        "limit": {"type": "integer", "minimum": 1},
+        "result_format": {"type": "string", "enum": ["json", "arrow"]},
     },
     "required": ["key"],
 }
@@ -18,8 +18,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import pyarrow as pa
-
 from superset import db, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
 from superset.daos.database import DatabaseDAO
@@ -71,15 +69,6 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
     return sql_results
 
 
-def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
-    sink = pa.BufferOutputStream()
-
-    with pa.ipc.new_stream(sink, table.schema) as writer:
-        writer.write_table(table)
-
-    return sink.getvalue()
-
-
 def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
     tabs_state: list[Any] = []
     active_tab: Any = None
@@ -15,22 +15,31 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 from urllib import request
 from urllib.error import URLError
 
+from celery import Task
 from celery.beat import SchedulingError
 from celery.utils.log import get_task_logger
-from sqlalchemy import and_, func
+from flask_caching.backends import NullCache
+from sqlalchemy import and_, extract, func
 
 from superset import app, db, security_manager
-from superset.extensions import celery_app
-from superset.models.core import Log
+from superset.extensions import cache_manager, celery_app
+from superset.models.core import Database, Log
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.tags.models import Tag, TaggedObject
 from superset.tasks.utils import fetch_csrf_token
 from superset.utils import json
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path, is_secure_url
@@ -39,6 +48,10 @@ logger = get_task_logger(__name__)
 logger.setLevel(logging.INFO)
 
 
+# key of the timestamp of the last in-process warm up of a chart, in the data cache
+LAST_WARM_UP_KEY = "cache_warmup_last_{chart_id}"
+
+
 def get_payload(chart: Slice, dashboard: Optional[Dashboard] = None) -> dict[str, int]:
     """Return payload for warming up a given chart/table cache."""
     payload = {"chart_id": chart.id}
@@ -52,7 +65,9 @@ class Strategy:  # pylint: disable=too-few-public-methods
     A cache warm up strategy.
 
     Each strategy defines a `get_payloads` method that returns a list of payloads to
-    send to the `/api/v1/chart/warm_up_cache` endpoint.
+    send to the `/api/v1/chart/warm_up_cache` endpoint, or to warm up in-process with
+    the `cache-warmup-chart` task when `in_process` is set. Payloads may have a
+    `countdown`, the number of seconds to wait before warming up the chart.
 
     Strategies can be configured in `superset/config.py`:
 
@@ -70,6 +85,8 @@ class Strategy:  # pylint: disable=too-few-public-methods
 
     """
 
+    in_process = False
+
     def __init__(self) -> None:
         pass
 
@@ -210,7 +227,235 @@ class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
         return payloads
 
 
-strategies = [DummyStrategy, TopNDashboardsStrategy, DashboardTagsStrategy]
+def get_chart_cache_timeout(chart: Slice) -> int:
+    """Return the cache timeout of a chart, like `QueryContextProcessor`."""
+    datasource = chart.datasource
+    for cache_timeout in (
+        chart.cache_timeout,
+        datasource.cache_timeout if datasource else None,
+        datasource.database.cache_timeout if datasource else None,
+        app.config["DATA_CACHE_CONFIG"].get("CACHE_DEFAULT_TIMEOUT"),
+    ):
+        if cache_timeout:
+            return cache_timeout
+    return app.config["CACHE_DEFAULT_TIMEOUT"]
+
+
+class PredictiveStrategy(Strategy):  # pylint: disable=too-few-public-methods
+    """
+    Warm up the most used charts before their cache expires and their access peaks.
+
+    Chart accesses are mined from the `Log` table: the `top_n` most accessed charts
+    since `since` are warmed up `lead_time` seconds before their cache expires, and
+    before the hours of the day (UTC) that received at least `peak_threshold` of
+    their accesses. The strategy should run every `interval` seconds, and schedules
+    the warm ups of the next interval. Charts are warmed up in-process, with at most
+    `CACHE_WARMUP_DATABASE_CONCURRENCY` concurrent warm ups per database.
+
+    The time of the last warm up of each chart is stored in the data cache
+    (`DATA_CACHE_CONFIG`) alongside the chart data, so the strategy requires a
+    persistent cache backend shared by the workers, eg, Redis; with the default
+    `NullCache` there's nothing to warm up, and no charts are scheduled.
+
+        beat_schedule = {
+            'cache-warmup-hourly': {
+                'task': 'cache-warmup',
+                'schedule': crontab(minute=0, hour='*'),  # @hourly
+                'kwargs': {
+                    'strategy_name': 'predictive',
+                    'top_n': 100,
+                    'since': '28 days ago',
+                    'interval': 3600,
+                    'lead_time': 300,
+                },
+            },
+        }
+
+    """
+
+    name = "predictive"
+    in_process = True
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        top_n: int = 100,
+        since: str = "28 days ago",
+        interval: int = 3600,
+        lead_time: int = 300,
+        peak_threshold: float = 0.1,
+    ) -> None:
+        super().__init__()
+        self.top_n = top_n
+        self.since = parse_human_datetime(since) if since else None
+        self.interval = timedelta(seconds=interval)
+        self.lead_time = timedelta(seconds=lead_time)
+        self.peak_threshold = peak_threshold
+
+    def get_access_patterns(self) -> dict[int, dict[int, int]]:
+        """
+        Return the number of accesses per hour of the day of the top-n charts.
+        """
+        hour = extract("hour", Log.dttm)
+        query = db.session.query(Log.slice_id, hour, func.count(Log.id)).filter(
+            Log.slice_id.isnot(None)
+        )
+        if self.since:
+            query = query.filter(Log.dttm >= self.since)
+
+        patterns: dict[int, dict[int, int]] = defaultdict(dict)
+        for chart_id, hour_of_day, count in query.group_by(Log.slice_id, hour):
+            patterns[chart_id][int(hour_of_day)] = count
+
+        top_n = sorted(patterns, key=lambda id_: -sum(patterns[id_].values()))
+        return {chart_id: patterns[chart_id] for chart_id in top_n[: self.top_n]}
+
+    def get_warm_up_times(
+        self,
+        chart: Slice,
+        accesses: dict[int, int],
+        now: datetime,
+    ) -> list[datetime]:
+        """
+        Return the times of the next interval at which a chart should be warmed up.
+        """
+        cache_timeout = get_chart_cache_timeout(chart)
+        if cache_timeout < 0:
+            # caching is disabled
+            return []
+
+        end = now + self.interval
+        times = []
+
+        # before the cache expires
+        last_warm_up = cache_manager.data_cache.get(
+            LAST_WARM_UP_KEY.format(chart_id=chart.id)
+        )
+        if last_warm_up is None:
+            times.append(now)
+        elif cache_timeout:
+            expiry = datetime.utcfromtimestamp(last_warm_up + cache_timeout)
+            if expiry - self.lead_time < end:
+                times.append(max(expiry - self.lead_time, now))
+
+        # before the access peaks
+        total = sum(accesses.values())
+        for hour, count in accesses.items():
+            if count < self.peak_threshold * total:
+                continue
+            peak = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+            for day in (0, 1):
+                warm_up = peak + timedelta(days=day) - self.lead_time
+                if now <= warm_up < end:
+                    times.append(warm_up)
+
+        # a warm up also covers the ones due shortly after it
+        deduplicated: list[datetime] = []
+        for warm_up in sorted(times):
+            if not deduplicated or warm_up - deduplicated[-1] >= self.lead_time:
+                deduplicated.append(warm_up)
+        return deduplicated
+
+    def get_payloads(self) -> list[dict[str, int]]:
+        if isinstance(cache_manager.data_cache.cache, NullCache):
+            logger.warning(
+                "The predictive cache warm up strategy requires a data cache backend"
+            )
+            return []
+
+        patterns = self.get_access_patterns()
+        charts = db.session.query(Slice).filter(Slice.id.in_(patterns)).all()
+
+        now = datetime.utcnow()
+        return [
+            {
+                **get_payload(chart),
+                "countdown": int((warm_up - now).total_seconds()),
+            }
+            for chart in charts
+            for warm_up in self.get_warm_up_times(chart, patterns[chart.id], now)
+        ]
+
+
+strategies = [
+    DummyStrategy,
+    TopNDashboardsStrategy,
+    DashboardTagsStrategy,
+    PredictiveStrategy,
+]
+
+
+@contextmanager
+def database_warm_up_slot(database: Optional[Database]) -> Iterator[bool]:
+    """
+    Try to take one of the warm up slots of a database, shared through the cache.
+
+    Yields whether a slot was taken, which is always the case when the cache does not
+    support atomic `add`s (eg, `NullCache`).
+    """
+    if database is None:
+        yield True
+        return
+
+    token = str(uuid.uuid4())
+    for slot in range(database.cache_warmup_concurrency):
+        key = f"cache_warmup_slot_{database.id}_{slot}"
+        if cache_manager.cache.add(
+            key,
+            token,
+            timeout=app.config["CACHE_WARMUP_SLOT_TIMEOUT"],
+        ):
+            try:
+                yield True
+            finally:
+                if cache_manager.cache.get(key) == token:
+                    cache_manager.cache.delete(key)
+            return
+
+    yield False
+
+
+@celery_app.task(name="cache-warmup-chart", bind=True, max_retries=10)
+def warm_up_chart(
+    self: Task,
+    chart_id: int,
+    dashboard_id: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Celery job to warm up the cache of a chart in-process
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+
+    chart = db.session.query(Slice).filter_by(id=chart_id).one_or_none()
+    if not chart:
+        logger.warning("Chart %s not found, skipping warm up", chart_id)
+        return {"chart_id": chart_id, "viz_error": "Chart not found"}
+
+    database = chart.datasource.database if chart.datasource else None
+    with database_warm_up_slot(database) as acquired:
+        if not acquired:
+            # leave the database to interactive traffic, and try again later
+            logger.info("No warm up slot available for chart %s", chart_id)
+            raise self.retry(countdown=app.config["CACHE_WARMUP_RETRY_DELAY"])
+
+        logger.info("Warming up chart %s", chart_id)
+        user = security_manager.get_user_by_username(
+            app.config["THUMBNAIL_SELENIUM_USER"]
+        )
+        with override_user(user):
+            result = ChartWarmUpCacheCommand(chart, dashboard_id, None).run()
+
+    # kept as long as the chart data, so the next warm up is scheduled before the
+    # data expires (a timeout of 0 never expires)
+    cache_timeout = get_chart_cache_timeout(chart)
+    if cache_timeout >= 0:
+        cache_manager.data_cache.set(
+            LAST_WARM_UP_KEY.format(chart_id=chart_id),
+            time.time(),
+            timeout=cache_timeout,
+        )
+    return result
 
 
 @celery_app.task(name="fetch_url")
@@ -284,6 +529,22 @@ def cache_warmup(
         logger.exception(message)
         return message
 
+    results: dict[str, list[str]] = {"scheduled": [], "errors": []}
+    if strategy.in_process:
+        for payload in strategy.get_payloads():
+            countdown = payload.pop("countdown", 0)
+            serialized = json.dumps(payload)
+            try:
+                logger.info("Scheduling %s in %s seconds", serialized, countdown)
+                warm_up_chart.apply_async(kwargs=payload, countdown=countdown)
+                results["scheduled"].append(serialized)
+            except SchedulingError:
+                logger.exception(
+                    "Error scheduling cache-warmup-chart for payload: %s", serialized
+                )
+                results["errors"].append(serialized)
+        return results
+
     user = security_manager.get_user_by_username(app.config["THUMBNAIL_SELENIUM_USER"])
     cookies = MachineAuthProvider.get_auth_cookies(user)
     headers = {
@@ -291,7 +552,6 @@ def cache_warmup(
         "Content-Type": "application/json",
     }
 
-    results: dict[str, list[str]] = {"scheduled": [], "errors": []}
     for payload in strategy.get_payloads():
         try:
             payload = json.dumps(payload)
@@ -21,13 +21,16 @@ from celery import Celery
 from celery.exceptions import SoftTimeLimitExceeded
 
 from superset import app, is_feature_enabled
+from superset.commands.database.metadata_catalog import RefreshMetadataCatalogCommand
 from superset.commands.exceptions import CommandException
+from superset.commands.key_value.prune import KeyValuePruneCommand
 from superset.commands.report.exceptions import ReportScheduleUnexpectedError
 from superset.commands.report.execute import AsyncExecuteReportScheduleCommand
 from superset.commands.report.log_prune import AsyncPruneReportScheduleLogCommand
 from superset.commands.sql_lab.query import QueryPruneCommand
 from superset.daos.report import ReportScheduleDAO
-from superset.extensions import celery_app
+from superset.extensions import celery_app, db
+from superset.models.core import Database
 from superset.stats_logger import BaseStatsLogger
 from superset.tasks.cron_util import cron_schedule_window
 from superset.utils.core import LoggerLevel
@@ -133,3 +136,40 @@ def prune_query() -> None:
         ).run()
     except CommandException as ex:
         logger.exception("An error occurred while pruning queries: %s", ex)
+
+
+@celery_app.task(name="prune_key_value")
+def prune_key_value() -> None:
+    stats_logger: BaseStatsLogger = app.config["STATS_LOGGER"]
+    stats_logger.incr("prune_key_value")
+
+    try:
+        KeyValuePruneCommand().run()
+    except CommandException as ex:
+        logger.exception("An error occurred while pruning key-value entries: %s", ex)
+
+
+@celery_app.task(name="metadata_catalog.refresh")
+def refresh_metadata_catalog() -> None:
+    """
+    Celery beat task scheduling the refresh of the metadata catalog of each database
+    """
+    stats_logger: BaseStatsLogger = app.config["STATS_LOGGER"]
+    stats_logger.incr("metadata_catalog.refresh")
+
+    if not is_feature_enabled("METADATA_CATALOG"):
+        return
+    # databases are listed without `DatabaseDAO`, whose filter requires a user
+    for (database_id,) in db.session.query(Database.id):
+        refresh_database_metadata_catalog.delay(database_id)
+
+
+@celery_app.task(name="metadata_catalog.refresh_database")
+def refresh_database_metadata_catalog(database_id: int) -> None:
+    stats_logger: BaseStatsLogger = app.config["STATS_LOGGER"]
+    stats_logger.incr("metadata_catalog.refresh_database")
+
+    try:
+        RefreshMetadataCatalogCommand(database_id).run()
+    except CommandException as ex:
+        logger.exception("An error occurred while refreshing the catalog: %s", ex)
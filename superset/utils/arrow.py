@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+from superset.utils import json
+
+logger = logging.getLogger(__name__)
+
+# key of the schema metadata entry holding the JSON encoded payload metadata
+METADATA_KEY = b"superset"
+
+
+def df_to_arrow(df: pd.DataFrame) -> pa.Table:
+    """
+    Convert a DataFrame to an Arrow table.
+
+    Columns that Arrow is unable to infer a type for, eg, because they hold values
+    of mixed types, are converted to strings.
+    """
+    arrays = []
+    for name, column in df.items():
+        try:
+            array = pa.array(column, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            logger.debug("Unable to infer the Arrow type of column %s", name)
+            array = pa.array(
+                column.astype(str).where(column.notna(), None),
+                type=pa.string(),
+                from_pandas=True,
+            )
+        arrays.append(array)
+
+    return pa.Table.from_arrays(arrays, names=[str(name) for name in df.columns])
+
+
+def write_ipc_buffer(
+    table: pa.Table,
+    metadata: dict[str, Any] | None = None,
+    compression: str | None = None,
+) -> pa.Buffer:
+    """
+    Serialize a table to the Arrow IPC streaming format.
+
+    :param table: The table to serialize
+    :param metadata: Payload metadata stored JSON encoded in the schema metadata
+    :param compression: The buffer compression, ``lz4`` or ``zstd``
+    :returns: The serialized table
+    """
+    if metadata is not None:
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                METADATA_KEY: json.dumps(
+                    metadata,
+                    default=json.pessimistic_json_iso_dttm_ser,
+                    ignore_nan=True,
+                ),
+            }
+        )
+
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue()
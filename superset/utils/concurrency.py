@@ -0,0 +1,120 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from flask import (
+    copy_current_request_context,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+)
+from sqlalchemy import inspect
+from sqlalchemy.orm.state import InstanceState
+
+from superset.extensions import db
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def merge_into_thread_session(value: T) -> T:
+    """
+    Return a copy of an ORM instance in the session of the current thread.
+
+    Sessions aren't thread-safe, and instances lazy load their relationships and
+    expired attributes through the session that loaded them, so instances shared
+    with worker threads are merged into the session of each worker, without
+    querying the database. Other values, and instances with changes that aren't
+    flushed, are returned as is.
+
+    :param value: The value to merge
+    :returns: The instance in the session of the current thread, or the value
+    """
+    state = inspect(value, raiseerr=False)
+    if not isinstance(state, InstanceState) or not state.has_identity:
+        return value
+    if state.modified:
+        return value
+    return db.session.merge(value, load=False)
+
+
+def with_flask_context(func: Callable[..., R]) -> Callable[..., R]:
+    """
+    Wrap a function so that it runs with a copy of the current Flask context.
+
+    Flask contexts are local to the thread that handles the request, so functions
+    submitted to a thread pool don't have access to the app, the request or the
+    ``g`` object (eg, the logged in user) unless they are copied. The containers in
+    ``g`` (eg, per request caches) are copied so that threads don't mutate them
+    concurrently, and its ORM instances are merged into the session of the thread.
+    Note that the returned function can only be called once when there's a request
+    context.
+    """
+    if not has_app_context():
+        return func
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    g_copy = {
+        key: copy.copy(value) if isinstance(value, (dict, list, set)) else value
+        for key, value in g.__dict__.items()
+    }
+
+    def wrapper(*args: Any, **kwargs: Any) -> R:
+        for key, value in g_copy.items():
+            setattr(g, key, merge_into_thread_session(value))
+        return func(*args, **kwargs)
+
+    if has_request_context():
+        return copy_current_request_context(wrapper)
+
+    def run_in_app_context(*args: Any, **kwargs: Any) -> R:
+        with app.app_context():
+            return wrapper(*args, **kwargs)
+
+    return run_in_app_context
+
+
+def map_with_flask_context(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> list[R]:
+    """
+    Apply a function to items concurrently, each in a copy of the Flask context.
+
+    Results are returned in the order of the items, and the first exception raised
+    by the function is re-raised. With a single worker, or a single item, the
+    function runs in the current thread.
+
+    :param func: The function to apply
+    :param items: The items to apply the function to
+    :param max_workers: The maximum number of threads
+    :returns: The results of the function
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(with_flask_context(func), item) for item in items]
+        return [future.result() for future in futures]
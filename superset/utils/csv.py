@@ -17,6 +17,7 @@
 import logging
 import re
 import urllib.request
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
@@ -64,7 +65,39 @@ def escape_value(value: str) -> str:
     return value
 
 
-def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+def escape_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorized version of ``escape_value`` for a column of values.
+
+    Only string values are escaped, other values are returned untouched.
+    """
+    values = series.to_numpy(dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=True) == "string":
+        is_str = pd.notna(values)
+    else:
+        is_str = np.fromiter(
+            (isinstance(value, str) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+    if not is_str.any():
+        return series
+
+    strings = pd.Series(values[is_str], dtype=object).astype(str)
+    needs_escaping = (
+        strings.str.match(problematic_chars_re) & ~strings.str.match(negative_number_re)
+    ).to_numpy()
+    if not needs_escaping.any():
+        return series
+
+    # Escape pipe and precede the value with a single quote, see ``escape_value``
+    escaped = "'" + strings[needs_escaping].str.replace("|", "\\|", regex=False)
+    values = values.copy()
+    values[np.flatnonzero(is_str)[needs_escaping]] = escaped.to_numpy()
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _escape_df(df: pd.DataFrame) -> pd.DataFrame:
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
 
@@ -72,13 +105,72 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     df = df.rename(columns=escape_values)
 
     # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+    escaped = {
+        idx: escape_series(column)
+        for idx, (_, column) in enumerate(df.items())
+        if column.dtype == np.dtype(object) or pd.api.types.is_string_dtype(column)
+    }
+    if escaped:
+        df = df.copy(deep=False)
+        for idx, column in escaped.items():
+            df.isetitem(idx, column)
+
+    return df
+
+
+def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    return _escape_df(df).to_csv(escapechar="\\", **kwargs)
+
+
+def df_to_escaped_csv_chunks(
+    df: pd.DataFrame,
+    chunk_size: int = 100_000,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Escape and serialize a dataframe to CSV in chunks of ``chunk_size`` rows.
 
-    return df.to_csv(escapechar="\\", **kwargs)
+    The concatenation of the chunks is the same as the output of
+    ``df_to_escaped_csv``, but only one chunk is held in memory at a time, so the
+    result can be streamed to the client.
+    """
+    kwargs.pop("path_or_buf", None)
+    header = kwargs.pop("header", True)
+    for start in range(0, max(len(df.index), 1), chunk_size):
+        chunk = _escape_df(df.iloc[start : start + chunk_size])
+        yield chunk.to_csv(
+            escapechar="\\",
+            header=header if start == 0 else False,
+            **kwargs,
+        )
+
+
+TEXT_FORMAT_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def _to_text_format(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, (bool, np.bool_)):
+        return str(int(value))
+    return str(value).translate(TEXT_FORMAT_ESCAPES)
+
+
+def rows_to_text_format(rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """
+    Serialize rows to the tab separated text format of bulk loaders.
+
+    This is the default format of Postgres ``COPY`` and MySQL ``LOAD DATA``, where
+    nulls are written as ``\\N`` and backslashes, tabs and line breaks are escaped.
+    Booleans are written as ``1`` and ``0``, which both databases accept.
+
+    :param rows: The rows to serialize
+    :returns: The lines of the rows
+    """
+    for row in rows:
+        yield "\t".join(_to_text_format(value) for value in row) + "\n"
 
 
 def get_chart_csv_data(
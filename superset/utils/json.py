@@ -26,7 +26,7 @@ import pandas as pd
 import simplejson
 from flask_babel.speaklater import LazyString
 from jsonpath_ng import parse
-from simplejson import JSONDecodeError
+from simplejson import JSONDecodeError, RawJSON  # noqa: F401
 
 from superset.constants import PASSWORD_MASK
 from superset.utils.dates import datetime_to_epoch, EPOCH
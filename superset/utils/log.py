@@ -16,23 +16,29 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
-from flask import g, request
+from flask import current_app, Flask, g, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
 from superset.extensions import stats_logger_manager
 from superset.utils import json
 from superset.utils.core import get_user_id, LoggerLevel, to_int
+from superset.utils.decorators import stats_timing
 
 if TYPE_CHECKING:
     pass
@@ -368,6 +374,37 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
+    @staticmethod
+    def get_log_rows(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[Any],
+    ) -> list[dict[str, Any]]:
+        """Build the column values of the `Log` rows of an event, one per record"""
+        rows = []
+        for record in records:
+            json_string: str | None
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            rows.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id,
+                    "slice_id": slice_id,
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                }
+            )
+        return rows
+
     def log(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         user_id: int | None,
@@ -383,24 +420,16 @@ class DBEventLogger(AbstractEventLogger):
         from superset import db
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
-        logs = []
-        for record in records:
-            json_string: str | None
-            try:
-                json_string = json.dumps(record)
-            except Exception:  # pylint: disable=broad-except
-                json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id,
-                slice_id=slice_id,
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
-            )
-            logs.append(log)
+        rows = self.get_log_rows(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        logs = [Log(**row) for row in rows]
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -409,6 +438,180 @@ class DBEventLogger(AbstractEventLogger):
             logging.exception(ex)
 
 
+class BufferedDBEventLogger(DBEventLogger):
+    """
+    Event logger that writes logs to Superset DB from a background thread.
+
+    Rows are put in a bounded in-memory queue, and a flusher thread inserts them in
+    batches of up to `batch_size` rows, waiting at most `flush_interval` seconds
+    after the first row of a batch was queued. Requests therefore don't wait on the
+    metadata database, at the cost of losing the queued rows if the process is
+    killed. Rows still queued are flushed when the process exits gracefully.
+
+    When the queue is full, new rows are dropped if `overflow` is "drop", while with
+    "block" the caller waits up to `block_timeout` seconds for the flusher to make
+    room before dropping them.
+
+    The queue depth, the flush latency and the number of dropped rows are reported
+    to the stats logger as `event_logger.queue_size`, `event_logger.flush` and
+    `event_logger.dropped` respectively.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        overflow: Literal["drop", "block"] = "drop",
+        block_timeout: float = 1.0,
+    ) -> None:
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"Invalid overflow policy: {overflow}")
+
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._app: Flask | None = None
+        self._atexit_registered = False
+        self._reset()
+        # a forked worker doesn't inherit the flusher thread, only its queue
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(
+            maxsize=self.max_queue_size
+        )
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        rows = self.get_log_rows(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        self._start_flusher()
+
+        # the time of the event, not the time of the insert
+        dttm = datetime.utcnow()
+        for row in rows:
+            self._put({**row, "dttm": dttm})
+
+        stats_logger_manager.instance.gauge(
+            "event_logger.queue_size", self._queue.qsize()
+        )
+
+    def shutdown(self, timeout: float | None = 5.0) -> None:
+        """
+        Flush the queued rows and stop the flusher thread.
+
+        The flusher is started again when a new event is logged.
+
+        :param timeout: The maximum number of seconds to wait for the flush
+        """
+        with self._lock:
+            thread = self._thread
+            if not thread or not thread.is_alive():
+                return
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                logger.warning("Unable to stop the event logger, its queue is full")
+                return
+
+        thread.join(timeout)
+
+    def _put(self, row: dict[str, Any]) -> None:
+        try:
+            if self.overflow == "block":
+                self._queue.put(row, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning("The event logger queue is full, dropping an event")
+            stats_logger_manager.instance.incr("event_logger.dropped")
+
+    def _start_flusher(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+
+            self._app = current_app._get_current_object()  # pylint: disable=protected-access
+            self._thread = threading.Thread(
+                target=self._run,
+                name="event-logger-flusher",
+                daemon=True,
+            )
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            # wait for the first row of a batch, then for up to `flush_interval`
+            # seconds for more rows
+            row = self._queue.get()
+            if row is None:
+                return
+
+            batch = [row]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    row = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stopped = True
+                    break
+                batch.append(row)
+
+            try:
+                self._flush(batch)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("BufferedDBEventLogger failed to log event(s)")
+
+    def _flush(self, rows: list[dict[str, Any]]) -> None:
+        stats_logger = stats_logger_manager.instance
+        with stats_timing("event_logger.flush", stats_logger):
+            self._insert(rows)
+        stats_logger.gauge("event_logger.queue_size", self._queue.qsize())
+
+    def _insert(self, rows: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
+        with cast(Flask, self._app).app_context():
+            try:
+                db.session.bulk_insert_mappings(Log, rows)
+                db.session.commit()  # pylint: disable=consider-using-transaction
+            except SQLAlchemyError:
+                db.session.rollback()
+                raise
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
@@ -567,6 +567,14 @@ class CsvResponse(Response):
     default_mimetype = "text/csv"
 
 
+class ArrowResponse(Response):
+    """
+    Override Response to use the Arrow IPC stream mimetype
+    """
+
+    default_mimetype = "application/vnd.apache.arrow.stream"
+
+
 class XlsxResponse(Response):
     """
     Override Response to use xlsx mimetype
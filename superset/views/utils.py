@@ -21,6 +21,7 @@ from functools import wraps
 from typing import Any, Callable, DefaultDict, Optional, Union
 
 import msgpack
+import pandas as pd
 import pyarrow as pa
 from flask import flash, g, has_request_context, redirect, request
 from flask_appbuilder.security.sqla import models as ab_models
@@ -29,7 +30,7 @@ from flask_babel import _
 from sqlalchemy.exc import NoResultFound
 from werkzeug.wrappers.response import Response
 
-from superset import app, dataframe, db, result_set, viz
+from superset import app, dataframe, db, result_set, results_backend, viz
 from superset.common.db_query_status import QueryStatus
 from superset.daos.datasource import DatasourceDAO
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -45,8 +46,10 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.chunked_results import CHUNKS_KEY, read_chunks
 from superset.superset_typing import FormData
 from superset.utils import json
+from superset.utils.arrow import df_to_arrow
 from superset.utils.core import DatasourceType
 from superset.utils.decorators import stats_timing
 from superset.viz import BaseViz
@@ -499,8 +502,27 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    as_table: bool = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> dict[str, Any]:
+    """
+    Deserialize a SQL Lab results payload read from the results backend.
+
+    When the results are stored in chunks, only the chunks holding the requested rows
+    are read from the results backend.
+
+    :param payload: The serialized payload
+    :param query: The query the results belong to
+    :param use_msgpack: Whether the payload was serialized with msgpack and Arrow
+    :param as_table: Whether to return the data as an Arrow table instead of records
+    :param offset: The index of the first row to return
+    :param limit: The maximum number of rows to return, all if None
+    :returns: The deserialized payload
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
@@ -509,19 +531,32 @@ def _deserialize_results_payload(
             ds_payload = msgpack.loads(payload, raw=False)
 
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
-            try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
-            except pa.ArrowSerializationError as ex:
-                raise SerializationError("Unable to deserialize table") from ex
+            if manifest := ds_payload.pop(CHUNKS_KEY, None):
+                pa_table = read_chunks(
+                    results_backend, query.results_key, manifest, offset, limit
+                )
+            else:
+                try:
+                    reader = pa.BufferReader(ds_payload["data"])
+                    pa_table = pa.ipc.open_stream(reader).read_all()
+                except pa.ArrowSerializationError as ex:
+                    raise SerializationError("Unable to deserialize table") from ex
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
+                if offset or limit is not None:
+                    pa_table = pa_table.slice(offset, limit)
 
         for column in ds_payload["selected_columns"]:
             if "name" in column:
                 column["column_name"] = column.get("name")
 
+        if as_table:
+            # nested columns are not expanded, since Arrow supports nested types
+            ds_payload.update({"data": pa_table, "expanded_columns": []})
+            return ds_payload
+
+        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
+        ds_payload["data"] = dataframe.df_to_records(df) or []
+
         db_engine_spec = query.database.db_engine_spec
         all_columns, data, expanded_columns = db_engine_spec.expand_data(
             ds_payload["selected_columns"], ds_payload["data"]
@@ -533,7 +568,20 @@ def _deserialize_results_payload(
         return ds_payload
 
     with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+        ds_payload = json.loads(payload)
+
+    if offset or limit is not None:
+        end = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:end]
+
+    if as_table:
+        df = pd.DataFrame.from_records(
+            ds_payload["data"],
+            columns=[column["name"] for column in ds_payload["columns"]],
+        )
+        ds_payload["data"] = df_to_arrow(df)
+
+    return ds_payload
 
 
 def get_cta_schema_name(
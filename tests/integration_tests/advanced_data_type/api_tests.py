@@ -134,3 +134,78 @@ def test_types_convert_request(test_client, login_as_admin):
     assert response_value.status_code == 200
     data = json.loads(response_value.data.decode("utf-8"))
     assert data == {"result": target_resp}
+
+
+@mock.patch(
+    "superset.advanced_data_type.api.ADVANCED_DATA_TYPES",
+    {"type": test_type},
+)
+def test_types_convert_batch_request(test_client, login_as_admin):
+    """
+    Advanced Data Type API: Test batch request to see if it behaves as expected when
+    valid and invalid types are passed in
+    """
+    arguments = {
+        "requests": [
+            {"type": "type", "values": [1]},
+            {"type": "not_found", "values": [1]},
+            {"type": "type", "values": [1]},
+        ]
+    }
+    uri = "api/v1/advanced_data_type/convert/batch"
+    response_value = test_client.post(uri, json=arguments)
+    assert response_value.status_code == 200
+    data = json.loads(response_value.data.decode("utf-8"))
+    assert data == {
+        "result": [
+            target_resp,
+            {"error_message": "Invalid advanced data type: not_found"},
+            target_resp,
+        ]
+    }
+
+
+def test_types_convert_batch_request_operators(test_client, login_as_admin):
+    """
+    Advanced Data Type API: Test batch request to see if requests that only differ by
+    their operator are translated separately
+    """
+
+    def translate_with_operator(
+        req: AdvancedDataTypeRequest,
+    ) -> AdvancedDataTypeResponse:
+        return {**target_resp, "display_value": req["operator"]}
+
+    operator_type = AdvancedDataType(
+        verbose_name="type",
+        valid_data_types=["int"],
+        translate_type=translate_with_operator,
+        description="",
+        translate_filter=translate_filter_func,
+    )
+    arguments = {
+        "requests": [
+            {"type": "type", "values": [1], "operator": "=="},
+            {"type": "type", "values": [1], "operator": "IN"},
+            {"type": "type", "values": [1], "operator": "=="},
+        ]
+    }
+    uri = "api/v1/advanced_data_type/convert/batch"
+    with mock.patch(
+        "superset.advanced_data_type.api.ADVANCED_DATA_TYPES",
+        {"type": operator_type},
+    ):
+        response_value = test_client.post(uri, json=arguments)
+    assert response_value.status_code == 200
+    data = json.loads(response_value.data.decode("utf-8"))
+    assert [resp["display_value"] for resp in data["result"]] == ["==", "IN", "=="]
+
+
+def test_types_convert_batch_bad_request(test_client, login_as_admin):
+    """
+    Advanced Data Type API: Test batch request to see if it behaves as expected when
+    no requests are passed in
+    """
+    uri = "api/v1/advanced_data_type/convert/batch"
+    response_value = test_client.post(uri, json={"requests": []})
+    assert response_value.status_code == 400
@@ -130,3 +130,79 @@ def test_codec(
     with cm:
         cache.set(FIRST_KEY, input_)
         assert cache.get(FIRST_KEY) == expected_result
+
+
+def test_many(app_context: AppContext, cache: SupersetMetastoreCache) -> None:
+    assert cache.set_many({FIRST_KEY: FIRST_KEY_INITIAL_VALUE, SECOND_KEY: 1}) == [
+        FIRST_KEY,
+        SECOND_KEY,
+    ]
+    assert cache.get_many(SECOND_KEY, "missing", FIRST_KEY) == [
+        1,
+        None,
+        FIRST_KEY_INITIAL_VALUE,
+    ]
+    assert cache.set_many({FIRST_KEY: FIRST_KEY_UPDATED_VALUE}) == [FIRST_KEY]
+    assert cache.get_dict(FIRST_KEY, SECOND_KEY) == {
+        FIRST_KEY: FIRST_KEY_UPDATED_VALUE,
+        SECOND_KEY: 1,
+    }
+    assert cache.delete_many(FIRST_KEY, "missing", SECOND_KEY) == [
+        FIRST_KEY,
+        SECOND_KEY,
+    ]
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, None]
+
+
+def test_local_cache(app_context: AppContext) -> None:
+    cache = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        default_timeout=600,
+        codec=PickleKeyValueCodec(),
+        local_timeout=10,
+    )
+    other_process = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        default_timeout=600,
+        codec=PickleKeyValueCodec(),
+    )
+    dttm = datetime(2022, 3, 18, 0, 0, 0)
+
+    with freeze_time(dttm):
+        cache.set(FIRST_KEY, FIRST_KEY_INITIAL_VALUE)
+        assert cache.get(FIRST_KEY) == FIRST_KEY_INITIAL_VALUE
+
+        # values read are kept in-process, and are copies
+        other_process.set(FIRST_KEY, FIRST_KEY_UPDATED_VALUE)
+        value = cache.get(FIRST_KEY)
+        assert value == FIRST_KEY_INITIAL_VALUE
+        value["foo"] = "baz"
+        assert cache.get(FIRST_KEY) == FIRST_KEY_INITIAL_VALUE
+
+    # until they time out
+    with freeze_time(dttm + timedelta(seconds=11)):
+        assert cache.get(FIRST_KEY) == FIRST_KEY_UPDATED_VALUE
+
+        # changes from the same process are visible right away
+        cache.delete(FIRST_KEY)
+        assert cache.get(FIRST_KEY) is None
+
+
+def test_prune(app_context: AppContext, cache: SupersetMetastoreCache) -> None:
+    from superset import db
+    from superset.commands.key_value.prune import KeyValuePruneCommand
+    from superset.daos.key_value import KeyValueDAO
+    from superset.extensions.metastore_cache import RESOURCE
+
+    dttm = datetime(2022, 3, 18, 0, 0, 0)
+    with freeze_time(dttm):
+        cache.set(FIRST_KEY, FIRST_KEY_INITIAL_VALUE, 60)
+        cache.set(SECOND_KEY, SECOND_VALUE, 600)
+
+    with freeze_time(dttm + timedelta(seconds=61)):
+        KeyValuePruneCommand().run()
+        assert KeyValueDAO.get_entry(RESOURCE, cache.get_key(FIRST_KEY)) is None
+        assert cache.get(SECOND_KEY) == SECOND_VALUE
+
+    cache.delete(SECOND_KEY)
+    db.session.commit()
@@ -17,6 +17,8 @@
 # isort:skip_file
 """Unit tests for Superset cache warmup"""
 
+from datetime import datetime
+from unittest import mock
 from unittest.mock import MagicMock  # noqa: F401
 from tests.integration_tests.fixtures.birth_names_dashboard import (
     load_birth_names_dashboard_with_slices,  # noqa: F401
@@ -37,6 +39,7 @@ from superset.models.core import Log
 from superset.tags.models import get_tag, ObjectType, TaggedObject, TagType
 from superset.tasks.cache import (
     DashboardTagsStrategy,
+    PredictiveStrategy,
     TopNDashboardsStrategy,
 )
 from superset.utils.urls import get_url_host  # noqa: F401
@@ -88,6 +91,23 @@ class TestCacheWarmUp(SupersetTestCase):
         ]
         self.assertCountEqual(result, expected)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_predictive_strategy(self):
+        # create a frequently accessed chart
+        db.session.query(Log).delete()
+        chart = self.get_dash_by_slug("births").slices[0]
+        for _ in range(10):
+            db.session.add(Log(action="log", slice_id=chart.id, dttm=datetime.utcnow()))
+        db.session.commit()
+
+        strategy = PredictiveStrategy(top_n=1)
+        with mock.patch("superset.tasks.cache.cache_manager") as cache_manager:
+            # never warmed up, so it's warmed up right away
+            cache_manager.cache.get.return_value = None
+            result = strategy.get_payloads()
+
+        assert result == [{"chart_id": chart.id, "countdown": 0}]
+
     def reset_tag(self, tag):
         """Remove associated object from tag, used to reset tests"""
         if tag.objects:
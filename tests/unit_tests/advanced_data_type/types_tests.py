@@ -17,6 +17,7 @@
 # isort:skip_file
 """Unit tests for Superset"""
 
+import pytest
 import sqlalchemy
 from sqlalchemy import Column, Integer
 from superset.advanced_data_type.types import (
@@ -25,7 +26,11 @@ from superset.advanced_data_type.types import (
 )
 from superset.utils.core import FilterOperator, FilterStringOperators
 
-from superset.advanced_data_type.plugins.internet_address import internet_address
+from superset.advanced_data_type.plugins.internet_address import (
+    internet_address,
+    parse_ip_range,
+    VECTORIZED_PARSING_MIN_VALUES,
+)
 from superset.advanced_data_type.plugins.internet_port import internet_port as port
 
 
@@ -345,11 +350,9 @@ def test_cidr_translate_filter_func_in_double():
     input_operation = FilterOperator.IN
     input_values = [{"start": 16843009, "end": 33686018}]
 
-    input_condition = input_column.in_([])
-
     cidr_translate_filter_response: sqlalchemy.sql.expression.BinaryExpression = (
-        input_condition | ((input_column <= 33686018) & (input_column >= 16843009))
-    )
+        input_column <= 33686018
+    ) & (input_column >= 16843009)
 
     assert internet_address.translate_filter(
         input_column, input_operation, input_values
@@ -381,10 +384,33 @@ def test_cidr_translate_filter_func_not_in_double():
     input_operation = FilterOperator.NOT_IN
     input_values = [{"start": 16843009, "end": 33686018}]
 
-    input_condition = ~(input_column.in_([]))
+    cidr_translate_filter_response: sqlalchemy.sql.expression.BinaryExpression = ~(
+        (input_column <= 33686018) & (input_column >= 16843009)
+    )
+
+    assert internet_address.translate_filter(
+        input_column, input_operation, input_values
+    ).compare(cidr_translate_filter_response)
+
+
+def test_cidr_translate_filter_func_in_merged():
+    """Test to see if the cidr_translate_filter_func merges overlapping and adjacent
+    ranges, and folds in the IP's that fall inside them"""
+
+    input_column = Column("user_ip", Integer)
+    input_operation = FilterOperator.IN
+    input_values = [
+        {"start": 16843008, "end": 16843263},
+        16843100,
+        {"start": 16843200, "end": 16843519},
+        16843520,
+        33686018,
+        {"start": 16843264, "end": 16843300},
+    ]
 
     cidr_translate_filter_response: sqlalchemy.sql.expression.BinaryExpression = (
-        input_condition & (input_column > 33686018) & (input_column < 16843009)
+        input_column.in_([33686018])
+        | ((input_column <= 16843520) & (input_column >= 16843008))
     )
 
     assert internet_address.translate_filter(
@@ -392,6 +418,86 @@ def test_cidr_translate_filter_func_not_in_double():
     ).compare(cidr_translate_filter_response)
 
 
+def test_cidr_translate_filter_func_in_ipv6():
+    """Test to see if the cidr_translate_filter_func merges IPv6 ranges"""
+
+    cidr_request: AdvancedDataTypeRequest = {
+        "advanced_data_type": "cidr",
+        "values": ["2001:db8::/33", "2001:db8:8000::/33", "2001:db8::1"],
+    }
+    values = internet_address.translate_type(cidr_request)["values"]
+
+    input_column = Column("user_ip", Integer)
+    cidr_translate_filter_response: sqlalchemy.sql.expression.BinaryExpression = (
+        input_column <= 42540766490510755371168322545197776895
+    ) & (input_column >= 42540766411282592856903984951653826560)
+
+    assert internet_address.translate_filter(
+        input_column, FilterOperator.IN, values
+    ).compare(cidr_translate_filter_response)
+
+
+def test_cidr_translate_filter_func_values_threshold(app):
+    """Test to see if the cidr_translate_filter_func uses a VALUES list above the
+    configured threshold"""
+
+    input_column = Column("user_ip", Integer)
+    input_values = [1, 3, {"start": 10, "end": 20}, {"start": 15, "end": 25}]
+
+    app.config["INTERNET_ADDRESS_VALUES_THRESHOLD"] = 2
+    try:
+        in_clause = internet_address.translate_filter(
+            input_column, FilterOperator.IN, input_values
+        )
+        not_in_clause = internet_address.translate_filter(
+            input_column, FilterOperator.NOT_IN, input_values
+        )
+    finally:
+        app.config["INTERNET_ADDRESS_VALUES_THRESHOLD"] = None
+
+    sql = str(in_clause.compile(compile_kwargs={"literal_binds": True}))
+    assert sql == (
+        "EXISTS (SELECT 1 \n"
+        "FROM (VALUES (1, 1), (3, 3), (10, 25)) AS ip_ranges (range_start, range_end) \n"
+        "WHERE user_ip BETWEEN ip_ranges.range_start AND ip_ranges.range_end)"
+    )
+    sql = str(not_in_clause.compile(compile_kwargs={"literal_binds": True}))
+    assert sql.startswith("NOT (EXISTS (SELECT 1")
+
+
+def test_parse_ip_range():
+    """Test to see if parse_ip_range matches the ipaddress module"""
+
+    assert parse_ip_range("1.1.1.1") == (16843009, 16843009)
+    assert parse_ip_range("1.1.0.0/16") == (16842752, 16908287)
+    assert parse_ip_range("0.0.0.0/0") == (0, 4294967295)
+    assert parse_ip_range("::1") == (1, 1)
+    with pytest.raises(ValueError):
+        parse_ip_range("1.1.1.256")
+    assert parse_ip_range("1.1.1.1/16") == (16842752, 16908287)
+
+
+def test_cidr_func_vectorized():
+    """Test to see if converting many values matches converting them one by one"""
+
+    values = [
+        f"10.0.{i // 256}.{i % 256}" for i in range(VECTORIZED_PARSING_MIN_VALUES)
+    ]
+    values += ["10.1.0.0/16", "::1", "2001:db8::/32"]
+
+    response = internet_address.translate_type({"values": values})
+    assert response["error_message"] == ""
+    assert response["values"] == [
+        internet_address.translate_type({"values": [value]})["values"][0]
+        for value in values
+    ]
+
+    response = internet_address.translate_type({"values": values + ["foo"]})
+    assert response["error_message"] == (
+        "'foo' does not appear to be an IPv4 or IPv6 network"
+    )
+
+
 def test_port_translate_filter_func_equals():
     """Test to see if the port_translate_filter_func behaves as expected when the EQUALS
     operator is used"""
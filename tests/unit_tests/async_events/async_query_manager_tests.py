@@ -14,9 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import time
+from threading import Timer
 from unittest import mock
 from unittest.mock import ANY, Mock
 
+from fakeredis import FakeRedis
 from flask import g
 from jwt import encode
 from pytest import fixture, raises
@@ -140,3 +143,58 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+@fixture
+def redis_async_query_manager(async_query_manager):
+    async_query_manager._redis = FakeRedis(decode_responses=True)
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._stream_limit = 1000
+    async_query_manager._stream_limit_firehose = 1000000
+
+    return async_query_manager
+
+
+def test_update_job_read_events(redis_async_query_manager):
+    job_metadata = redis_async_query_manager.init_job("test_channel_id", 1)
+    redis_async_query_manager.update_job(job_metadata, "running")
+    redis_async_query_manager.update_job(job_metadata, "done", result_url="/url")
+
+    events = redis_async_query_manager.read_events("test_channel_id", None)
+    assert [event["status"] for event in events] == ["running", "done"]
+    assert events[1]["result_url"] == "/url"
+    assert redis_async_query_manager._redis.xlen("async-events-full") == 2
+
+    events = redis_async_query_manager.read_events("test_channel_id", events[0]["id"])
+    assert [event["status"] for event in events] == ["done"]
+
+    assert redis_async_query_manager.read_events("other_channel_id", None) == []
+
+
+def test_read_events_long_polling(redis_async_query_manager):
+    redis_async_query_manager._long_polling_timeout = 5000
+    job_metadata = redis_async_query_manager.init_job("test_channel_id", 1)
+    redis_async_query_manager.update_job(job_metadata, "running")
+
+    # existing events are returned immediately
+    events = redis_async_query_manager.read_events("test_channel_id", None)
+    assert [event["status"] for event in events] == ["running"]
+
+    # new events are returned as soon as they are published
+    timer = Timer(
+        0.1,
+        redis_async_query_manager.update_job,
+        (job_metadata, "done"),
+    )
+    timer.start()
+    start = time.monotonic()
+    events = redis_async_query_manager.read_events("test_channel_id", events[0]["id"])
+    timer.join()
+    assert [event["status"] for event in events] == ["done"]
+    assert time.monotonic() - start < 5
+
+    # no events are returned after the timeout
+    redis_async_query_manager._long_polling_timeout = 10
+    assert (
+        redis_async_query_manager.read_events("test_channel_id", events[0]["id"]) == []
+    )
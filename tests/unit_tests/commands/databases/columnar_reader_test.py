@@ -17,6 +17,7 @@
 import io
 import tempfile
 from typing import Any
+from unittest.mock import patch
 from zipfile import ZipFile
 
 import numpy as np
@@ -230,6 +231,19 @@ def test_columnar_reader_bad_zip():
     assert str(ex.value) == "Not a valid ZIP file"
 
 
+def test_columnar_reader_file_to_dataframes(app):
+    reader = ColumnarReader(
+        options=ColumnarReaderOptions(columns_read=["Name", "Age"]),
+    )
+    with patch.dict(app.config, {"UPLOAD_CHUNK_SIZE": 2}):
+        dfs = list(reader.file_to_dataframes(create_columnar_file(COLUMNAR_DATA)))
+
+    assert [df.values.tolist() for df in dfs] == [
+        [["name1", 30], ["name2", 25]],
+        [["name3", 20]],
+    ]
+
+
 def test_columnar_reader_metadata():
     reader = ColumnarReader(
         options=ColumnarReaderOptions(),
@@ -16,8 +16,10 @@
 # under the License.
 import io
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pandas as pd
 import pytest
 from werkzeug.datastructures import FileStorage
 
@@ -274,6 +276,84 @@ def test_csv_reader_index_column():
     assert df.index.name == "Name"
 
 
+def test_csv_reader_file_to_dataframes(app):
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    with patch.dict(app.config, {"UPLOAD_CHUNK_SIZE": 2}):
+        dfs = list(csv_reader.file_to_dataframes(create_csv_file(CSV_DATA)))
+
+    assert [len(df.index) for df in dfs] == [2, 1]
+    assert dfs[1].values.tolist() == [["name3", 20, "city3", "2000-02-01"]]
+
+
+def test_csv_reader_read_chunks_with_nulls(app):
+    """
+    Test that chunks are cast to the dtypes of the first one, when a later chunk has
+    nulls in an integer column.
+    """
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    database = MagicMock()
+    dfs = []
+    database.db_engine_spec.df_chunks_to_sql.side_effect = (
+        lambda database, table, chunks, to_sql_kwargs: dfs.extend(chunks)
+    )
+    with patch.dict(app.config, {"UPLOAD_CHUNK_SIZE": 2}):
+        csv_reader.read(
+            create_csv_file(
+                [
+                    ["Name", "Age"],
+                    ["name1", "30"],
+                    ["name2", "25"],
+                    ["name3", ""],
+                    ["name4", "20"],
+                ]
+            ),
+            database,
+            "table",
+            None,
+        )
+
+    assert [str(df["Age"].dtype) for df in dfs] == ["int64", "Int64"]
+    assert dfs[1]["Age"].tolist() == [pd.NA, 20]
+
+
+def test_csv_reader_read_chunks_invalid_type(app):
+    """
+    Test that the upload fails when a later chunk can't be cast to the first dtypes.
+    """
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    database = MagicMock()
+    database.db_engine_spec.df_chunks_to_sql.side_effect = (
+        lambda database, table, chunks, to_sql_kwargs: list(chunks)
+    )
+    with patch.dict(app.config, {"UPLOAD_CHUNK_SIZE": 2}):
+        with pytest.raises(DatabaseUploadFailed) as ex:
+            csv_reader.read(
+                create_csv_file([["Age"], ["30"], ["25"], ["20.5"]]),
+                database,
+                "table",
+                None,
+            )
+    assert str(ex.value) == (
+        "The values of column Age don't match its type int64, inferred from the "
+        "first rows of the file. Please set the type of the column."
+    )
+
+
+def test_csv_reader_file_to_dataframes_invalid_file(app):
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        list(csv_reader.file_to_dataframes(create_csv_file([""])))
+    assert str(ex.value) == "Parsing error: No columns to parse from file"
+
+
 def test_csv_reader_wrong_index_column():
     csv_reader = CSVReader(
         options=CSVReaderOptions(index_column="wrong"),
@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import timedelta
+
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.commands.database.metadata_catalog import RefreshMetadataCatalogCommand
+from superset.sql_parse import Table
+
+
+def test_refresh_metadata_catalog(mocker: MockerFixture) -> None:
+    """
+    Test that the stale schemas and tables of a database are refreshed, and that
+    errors don't stop the refresh.
+    """
+    mocker.patch("superset.commands.database.metadata_catalog.db")
+    mocker.patch.dict(
+        "superset.commands.database.metadata_catalog.current_app.config",
+        {"METADATA_CATALOG_REFRESH_INTERVAL": timedelta(hours=6)},
+    )
+    database = mocker.MagicMock()
+    database.db_engine_spec.supports_catalog = True
+    database.get_all_catalog_names.return_value = {"catalog1"}
+    DatabaseDAO = mocker.patch(
+        "superset.commands.database.metadata_catalog.DatabaseDAO"
+    )
+    DatabaseDAO.find_by_id.return_value = database
+
+    MetadataCatalogDAO = mocker.patch(
+        "superset.commands.database.metadata_catalog.MetadataCatalogDAO"
+    )
+    MetadataCatalogDAO.get_stale_schemas.return_value = [
+        ("catalog1", "schema1"),
+        ("catalog1", "schema2"),
+    ]
+    MetadataCatalogDAO.refresh_tables.side_effect = [Exception("boom"), None]
+    MetadataCatalogDAO.get_stale_tables.return_value = [
+        ("catalog1", "schema2", "table1"),
+    ]
+
+    RefreshMetadataCatalogCommand(1).run()
+
+    database.get_all_catalog_names.assert_called_with(cache=False)
+    MetadataCatalogDAO.refresh_schemas.assert_called_once_with(database, "catalog1")
+    MetadataCatalogDAO.refresh_tables.assert_has_calls(
+        [
+            mocker.call(database, "catalog1", "schema1"),
+            mocker.call(database, "catalog1", "schema2"),
+        ]
+    )
+    MetadataCatalogDAO.refresh_table.assert_called_once_with(
+        database,
+        Table("table1", "schema2", "catalog1"),
+    )
+
+
+def test_refresh_metadata_catalog_without_user(
+    mocker: MockerFixture,
+    session: Session,
+) -> None:
+    """
+    Test that the database is found without a logged in user, as in Celery.
+    """
+    from superset import db
+    from superset.models.core import Database
+
+    Database.metadata.create_all(session.get_bind())
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    db.session.add(database)
+    db.session.flush()
+
+    MetadataCatalogDAO = mocker.patch(
+        "superset.commands.database.metadata_catalog.MetadataCatalogDAO"
+    )
+    MetadataCatalogDAO.get_catalog_name.return_value = None
+    MetadataCatalogDAO.get_stale_schemas.return_value = []
+    MetadataCatalogDAO.get_stale_tables.return_value = []
+
+    RefreshMetadataCatalogCommand(database.id).run()
+
+    MetadataCatalogDAO.refresh_schemas.assert_called_once_with(database, None)
@@ -201,3 +201,53 @@ def test_tables_without_catalog(
         cache=database_without_catalog.table_cache_enabled,
         cache_timeout=database_without_catalog.table_cache_timeout,
     )
+
+
+def test_tables_metadata_catalog_search(
+    mocker: MockerFixture,
+    database_without_catalog: MockerFixture,
+) -> None:
+    """
+    Test that tables are read from the metadata catalog when it's enabled, and that
+    the ones starting with the search come first.
+    """
+    MetadataCatalogDAO = mocker.patch(
+        "superset.commands.database.tables.MetadataCatalogDAO"
+    )
+    MetadataCatalogDAO.is_enabled.return_value = True
+    catalog_tables = []
+    for name, type_ in [
+        ("all_orders", "table"),
+        ("orders", "table"),
+        ("orders_view", "view"),
+    ]:
+        catalog_table = mocker.MagicMock(type=type_)
+        catalog_table.name = name
+        catalog_tables.append(catalog_table)
+    MetadataCatalogDAO.get_tables.return_value = catalog_tables
+    mocker.patch.object(
+        security_manager,
+        "get_datasources_accessible_by_user",
+        side_effect=lambda datasource_names, **kwargs: set(datasource_names),
+    )
+    db = mocker.patch("superset.commands.database.tables.db")
+    db.session.query().filter().options().all.return_value = []
+
+    payload = TablesDatabaseCommand(1, None, "schema1", False, "orders").run()
+    assert payload == {
+        "count": 3,
+        "result": [
+            {"value": "orders", "type": "table", "extra": None},
+            {"value": "orders_view", "type": "view"},
+            {"value": "all_orders", "type": "table", "extra": None},
+        ],
+    }
+
+    MetadataCatalogDAO.get_tables.assert_called_with(
+        database_without_catalog,
+        None,
+        "schema1",
+        force=False,
+        search="orders",
+    )
+    database_without_catalog.get_all_table_names_in_schema.assert_not_called()
@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.utils.cache_codec import (
+    ArrowDataFrameCodec,
+    decode_cache_value,
+    encode_cache_value,
+    ENCODED_DF_KEY,
+)
+
+CODEC_CONFIG = {
+    "CODEC": "arrow",
+    "COMPRESSION": "zstd",
+    "MIN_SIZE": 1024,
+    "MAX_SIZE": None,
+}
+
+DF = pd.DataFrame(
+    {
+        "ds": pd.date_range("2020-01-01", periods=1000, freq="h"),
+        "name": [f"name_{i % 10}" for i in range(1000)],
+        "value": np.arange(1000, dtype="float64"),
+    }
+)
+
+
+@pytest.mark.parametrize("compression", ["zstd", "lz4", None])
+def test_arrow_codec(compression: str | None) -> None:
+    codec = ArrowDataFrameCodec(compression)
+    pd.testing.assert_frame_equal(codec.decode(codec.encode(DF)), DF)
+
+
+def test_arrow_codec_lossy() -> None:
+    codec = ArrowDataFrameCodec()
+    with pytest.raises(ValueError):
+        codec.encode(pd.DataFrame({"a": [1, "a"]}))
+    with pytest.raises(ValueError):
+        codec.encode(pd.DataFrame({"a": [1, None]}, dtype=object))
+    with pytest.raises(ValueError):
+        codec.encode(pd.DataFrame({"a": [[1], [2]]}))
+
+
+def test_encode_cache_value(mocker: MockerFixture) -> None:
+    stats_logger = mocker.MagicMock()
+    value = {"df": DF, "query": "SELECT 1"}
+
+    encoded = encode_cache_value(value, CODEC_CONFIG, stats_logger, "data")
+    assert encoded is not None
+    assert encoded["df"] is None
+    assert encoded["query"] == "SELECT 1"
+    assert encoded[ENCODED_DF_KEY]["codec"] == "arrow"
+    stats_logger.incr.assert_called_once_with("cache_codec.data.arrow")
+    raw_size, encoded_size = (call.args for call in stats_logger.gauge.call_args_list)
+    assert raw_size[0] == "cache_codec.data.raw_bytes"
+    assert encoded_size[0] == "cache_codec.data.encoded_bytes"
+    assert encoded_size[1] < raw_size[1]
+
+    decoded = decode_cache_value(encoded)
+    assert ENCODED_DF_KEY not in decoded
+    assert decoded["query"] == "SELECT 1"
+    pd.testing.assert_frame_equal(decoded["df"], DF)
+
+    # values cached without encoding are read as is
+    assert decode_cache_value(value) is value
+
+
+def test_encode_cache_value_raw(mocker: MockerFixture) -> None:
+    stats_logger = mocker.MagicMock()
+
+    small: dict[str, Any] = {"df": DF.head(2)}
+    assert encode_cache_value(small, CODEC_CONFIG, stats_logger, "data") is small
+    stats_logger.incr.assert_called_once_with("cache_codec.data.raw")
+
+    value = {"df": DF}
+    config = {**CODEC_CONFIG, "CODEC": None}
+    assert encode_cache_value(value, config, stats_logger, "data") is value
+
+    no_df = {"foo": "bar"}
+    assert encode_cache_value(no_df, CODEC_CONFIG, stats_logger, "data") is no_df
+
+
+def test_encode_cache_value_fallback(mocker: MockerFixture) -> None:
+    stats_logger = mocker.MagicMock()
+    df = pd.DataFrame({"a": [1, None] * 1000}, dtype=object)
+
+    encoded = encode_cache_value({"df": df}, CODEC_CONFIG, stats_logger, "data")
+    assert encoded is not None
+    assert encoded[ENCODED_DF_KEY]["codec"] == "pickle"
+    stats_logger.incr.assert_called_once_with("cache_codec.data.pickle")
+    pd.testing.assert_frame_equal(decode_cache_value(encoded)["df"], df)
+
+
+def test_encode_cache_value_too_large(mocker: MockerFixture) -> None:
+    stats_logger = mocker.MagicMock()
+    config = {**CODEC_CONFIG, "MAX_SIZE": 100}
+
+    assert encode_cache_value({"df": DF}, config, stats_logger, "data") is None
+    stats_logger.incr.assert_called_with("cache_codec.data.too_large")
@@ -0,0 +1,173 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+
+import pytest
+from flask import Flask
+from flask_caching import Cache
+from pandas import DataFrame
+from pytest_mock import MockerFixture
+
+from superset.constants import CacheRegion
+
+VALUE = {"df": DataFrame({"a": [1]}), "query": "SELECT 1"}
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture, app: Flask) -> Iterator[Cache]:
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {
+            "CACHE_SINGLE_FLIGHT_CONFIG": {
+                "data": {"POLL_INTERVAL": 0, "WAIT_TIMEOUT": 1, "STALE_TIMEOUT": 60}
+            },
+        },
+    )
+    yield cache
+
+
+def test_single_flight_disabled(mocker: MockerFixture, cache: Cache) -> None:
+    """
+    Test that every caller computes the value when single-flight is disabled.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {"CACHE_SINGLE_FLIGHT_CONFIG": {}},
+    )
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as leader:
+        assert leader is None
+        with QueryCacheManager.single_flight("key", CacheRegion.DATA) as follower:
+            assert follower is None
+
+
+def test_single_flight_wait(cache: Cache) -> None:
+    """
+    Test that a follower is served the value cached by the leader.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as leader:
+        assert leader is None
+        QueryCacheManager.set("key", VALUE, timeout=60, region=CacheRegion.DATA)
+
+        with QueryCacheManager.single_flight("key", CacheRegion.DATA) as follower:
+            assert follower is not None
+            assert follower.is_loaded
+            assert follower.query == "SELECT 1"
+
+    # the lock is released
+    assert cache.get("key__lock") is None
+
+
+def test_single_flight_leader_failed(cache: Cache) -> None:
+    """
+    Test that a follower computes the value if the leader released the lock without
+    caching it.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as leader:
+        assert leader is None
+        lock = cache.get("key__lock")
+
+    cache.set("key__lock", lock)
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as follower:
+        cache.delete("key__lock")
+        assert follower is None
+
+
+def test_single_flight_timeout(mocker: MockerFixture, cache: Cache) -> None:
+    """
+    Test that a follower computes the value after waiting for too long.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {"CACHE_SINGLE_FLIGHT_CONFIG": {"data": {"WAIT_TIMEOUT": 0}}},
+    )
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as leader:
+        assert leader is None
+        with QueryCacheManager.single_flight("key", CacheRegion.DATA) as follower:
+            assert follower is None
+
+
+def test_single_flight_stale(mocker: MockerFixture, cache: Cache) -> None:
+    """
+    Test that a follower is served the stale value while the leader refreshes it.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    QueryCacheManager.set("key", VALUE, timeout=60, region=CacheRegion.DATA)
+    assert QueryCacheManager.get("key", CacheRegion.DATA).is_loaded
+
+    time = mocker.patch("superset.common.utils.query_cache_manager.time")
+    time.time.return_value = cache.get("key")["stale_after"] + 1
+    time.monotonic.return_value = 0
+
+    stale = QueryCacheManager.get("key", CacheRegion.DATA)
+    assert not stale.is_loaded
+    assert stale.stale_value is not None
+
+    with QueryCacheManager.single_flight(
+        "key", CacheRegion.DATA, stale=stale
+    ) as leader:
+        assert leader is None
+
+        stale = QueryCacheManager.get("key", CacheRegion.DATA)
+        with QueryCacheManager.single_flight(
+            "key", CacheRegion.DATA, stale=stale
+        ) as follower:
+            assert follower is stale
+            assert follower.is_loaded
+            assert follower.query == "SELECT 1"
+
+
+def test_single_flight_cached_before_lock(cache: Cache) -> None:
+    """
+    Test that the value cached by a worker before the lock was acquired is reused.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    # the leader cached the value and released the lock after the caller's cache miss
+    QueryCacheManager.set("key", VALUE, timeout=60, region=CacheRegion.DATA)
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as cached:
+        assert cached is not None
+        assert cached.query == "SELECT 1"
+
+    assert cache.get("key__lock") is None
+
+
+def test_single_flight_leader_raises(cache: Cache) -> None:
+    """
+    Test that the lock is released when the computation of the value fails.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    with pytest.raises(ValueError):
+        with QueryCacheManager.single_flight("key", CacheRegion.DATA) as leader:
+            assert leader is None
+            raise ValueError("query failed")
+
+    assert cache.get("key__lock") is None
@@ -0,0 +1,166 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import object_session, scoped_session, sessionmaker
+
+
+def test_get_payload_concurrent(mocker: MockerFixture) -> None:
+    """
+    Test that the queries of a query context run concurrently, in order.
+    """
+    from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+    from superset.common.query_context import QueryContext
+    from superset.common.query_context_processor import QueryContextProcessor
+
+    threads: set[int] = set()
+    time_offset_concurrency: set[int] = set()
+
+    def get_query_results(
+        result_type: ChartDataResultType,
+        query_context: QueryContext,
+        query_obj: Any,
+        force_cached: bool,
+    ) -> dict[str, Any]:
+        threads.add(threading.get_ident())
+        time_offset_concurrency.add(
+            query_context._processor.get_time_offset_query_concurrency()
+        )
+        time.sleep(0.1)
+        return {"query": query_obj.name}
+
+    mocker.patch(
+        "superset.common.query_context_processor.get_query_results",
+        side_effect=get_query_results,
+    )
+    datasource = mocker.MagicMock()
+    datasource.database.chart_data_query_concurrency = 4
+    datasource.database.time_offset_query_concurrency = 4
+    queries = [mocker.MagicMock(result_type=None) for _ in range(3)]
+    for i, query in enumerate(queries):
+        query.name = f"query_{i}"
+
+    processor = QueryContextProcessor(
+        QueryContext(
+            datasource=datasource,
+            queries=queries,
+            result_type=ChartDataResultType.FULL,
+            form_data={},
+            slice_=None,
+            result_format=ChartDataResultFormat.JSON,
+            cache_values={},
+        )
+    )
+    start = time.monotonic()
+    assert processor.get_payload() == {
+        "queries": [{"query": "query_0"}, {"query": "query_1"}, {"query": "query_2"}]
+    }
+    assert time.monotonic() - start < 0.3
+    assert len(threads) == 3
+    # the pools don't nest, so the time offsets of the queries run sequentially
+    assert time_offset_concurrency == {1}
+
+    # run sequentially when the database caps the concurrency to 1
+    threads.clear()
+    time_offset_concurrency.clear()
+    datasource.database.chart_data_query_concurrency = 1
+    assert len(processor.get_payload()["queries"]) == 3
+    assert threads == {threading.get_ident()}
+    assert time_offset_concurrency == {4}
+
+
+def test_get_payload_concurrent_session(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test that queries running concurrently don't share the session of the request.
+    """
+    from superset import db
+    from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+    from superset.common.query_actions import _get_datasource
+    from superset.common.query_context import QueryContext
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+
+    # a file, so that the connections of the threads share the tables
+    engine = create_engine(f"sqlite:///{tmp_path / 'superset.db'}")
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+    session = scoped_session(sessionmaker(bind=engine))
+    mocker.patch.object(db, "session", session)
+
+    session.add(
+        SqlaTable(
+            table_name="my_table",
+            database=Database(
+                database_name="my_database",
+                sqlalchemy_uri="sqlite://",
+                extra='{"chart_data_query_concurrency": 4}',
+            ),
+            columns=[
+                TableColumn(column_name="ds", type="TIMESTAMP", is_dttm=True),
+                TableColumn(column_name="value", type="INTEGER"),
+            ],
+            metrics=[SqlMetric(metric_name="count", expression="COUNT(*)")],
+        )
+    )
+    session.commit()
+    datasource = session.query(SqlaTable).one()
+    assert datasource.database.chart_data_query_concurrency == 4
+
+    sessions: dict[int, Any] = {}
+
+    def get_datasource(query_context: QueryContext, query_obj: QueryObject) -> Any:
+        datasource = _get_datasource(query_context, query_obj)
+        sessions[threading.get_ident()] = object_session(datasource)
+        return datasource
+
+    mocker.patch(
+        "superset.common.query_actions._get_datasource",
+        side_effect=get_datasource,
+    )
+    result_types = [
+        ChartDataResultType.COLUMNS,
+        ChartDataResultType.TIMEGRAINS,
+        ChartDataResultType.COLUMNS,
+    ]
+    query_context = QueryContext(
+        datasource=datasource,
+        queries=[
+            QueryObject(datasource=datasource, result_type=result_type)
+            for result_type in result_types
+        ],
+        result_type=ChartDataResultType.FULL,
+        form_data={},
+        slice_=None,
+        result_format=ChartDataResultFormat.JSON,
+        cache_values={},
+    )
+
+    queries = query_context.get_payload()["queries"]
+    assert [column["column_name"] for column in queries[0]["data"]] == ["ds", "value"]
+    assert queries[1]["data"]
+    assert queries[2] == queries[0]
+
+    # each thread lazy loads the relationships through a session of its own
+    assert threading.get_ident() not in sessions
+    assert len(set(sessions.values())) == len(sessions) > 1
+    assert session() not in sessions.values()
+    assert "columns" in inspect(datasource).unloaded
@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from pandas import DataFrame, Series, Timestamp
+from pandas import DataFrame, date_range, Series, Timestamp
 from pandas.testing import assert_frame_equal
 from pytest import fixture, mark
 
@@ -48,18 +48,47 @@ def make_join_column_producer():
 @mark.parametrize(
     ("time_grain", "expected"),
     [
-        (TimeGrain.WEEK, "2020-W01"),
-        (TimeGrain.MONTH, "2020-01"),
-        (TimeGrain.QUARTER, "2020-Q1"),
-        (TimeGrain.YEAR, "2020"),
+        (TimeGrain.WEEK, 202001),
+        (TimeGrain.WEEK_STARTING_SUNDAY, 202001),
+        (TimeGrain.MONTH, 202001),
+        (TimeGrain.QUARTER, 20201),
+        (TimeGrain.YEAR, 2020),
     ],
 )
-def test_join_column(time_grain: str, expected: str):
+def test_join_column(time_grain: str, expected: int):
     df = DataFrame({"ds": [Timestamp("2020-01-07")]})
     column_name = "join_column"
     query_context_processor.add_offset_join_column(df, column_name, time_grain)
     result = DataFrame({"ds": [Timestamp("2020-01-07")], column_name: [expected]})
-    assert_frame_equal(df, result)
+    assert_frame_equal(df, result, check_dtype=False)
+
+
+@mark.parametrize(
+    "time_grain",
+    [
+        TimeGrain.WEEK,
+        TimeGrain.WEEK_STARTING_SUNDAY,
+        TimeGrain.MONTH,
+        TimeGrain.QUARTER,
+        TimeGrain.YEAR,
+        TimeGrain.DAY,
+    ],
+)
+def test_generate_join_keys(time_grain: str):
+    """
+    Test that the vectorized join keys group the values like the formatted ones.
+    """
+    df = DataFrame({"ds": date_range("2019-12-01", "2021-01-31", freq="D")})
+    keys = query_context_processor.generate_join_keys(
+        df["ds"], time_grain, "1 year ago"
+    )
+    expected = df.apply(
+        lambda row: query_context_processor.generate_join_column(
+            row, 0, time_grain, "1 year ago"
+        ),
+        axis=1,
+    )
+    assert (keys.factorize()[0] == expected.factorize()[0]).all()
 
 
 def test_join_column_producer(make_join_column_producer):
@@ -74,6 +103,31 @@ def test_join_column_producer(make_join_column_producer):
     assert_frame_equal(df, result)
 
 
+def test_join_offset_dfs_empty_offset():
+    """
+    Test that an offset without rows is joined on keys of the same type.
+    """
+    df = DataFrame(
+        {"ds": [Timestamp("2021-01-01"), Timestamp("2021-02-01")], "m": [1, 2]}
+    )
+    offset_df = query_context_processor.get_empty_offset_df(
+        df, ["ds"], ["m__1 year ago"]
+    )
+
+    result = query_context_processor.join_offset_dfs(
+        df, {"1 year ago": offset_df}, TimeGrain.MONTH, ["ds"]
+    )
+
+    expected = DataFrame(
+        {
+            "ds": [Timestamp("2021-01-01"), Timestamp("2021-02-01")],
+            "m": [1, 2],
+            "m__1 year ago": [None, None],
+        }
+    )
+    assert_frame_equal(expected, result, check_dtype=False)
+
+
 def test_join_offset_dfs_no_offsets():
     df = DataFrame({"A": ["2021-01-01", "2021-02-01", "2021-03-01"]})
     offset_dfs = {}
@@ -28,6 +28,7 @@ from superset.exceptions import OAuth2RedirectError
 from superset.models.core import Database
 from superset.sql_parse import Table
 from superset.superset_typing import QueryObjectDict
+from superset.utils import json
 
 
 def test_query_bubbles_errors(mocker: MockerFixture) -> None:
@@ -287,3 +288,53 @@ def test_normalize_prequery_result_type_custom_sql() -> None:
         sqla_table._normalize_prequery_result_type(row, dimension, columns_by_name)
         == "Car"
     )
+
+
+def test_data_for_slices(mocker: MockerFixture) -> None:
+    """
+    Test that the payload for a dashboard only includes the columns and metrics used
+    by its charts, and a short representation of the database.
+    """
+    from superset.connectors.sqla.models import SqlMetric
+    from superset.models.slice import Slice
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    sqla_table = SqlaTable(
+        table_name="my_sqla_table",
+        columns=[
+            TableColumn(column_name="ds", is_dttm=True),
+            TableColumn(column_name="gender", type="VARCHAR(16)"),
+            TableColumn(column_name="name", type="VARCHAR(255)", verbose_name="Name"),
+            TableColumn(column_name="num", type="INTEGER"),
+        ],
+        metrics=[
+            SqlMetric(metric_name="count", expression="COUNT(*)"),
+            SqlMetric(metric_name="sum__num", expression="SUM(num)"),
+        ],
+        database=database,
+    )
+    slc = Slice(
+        datasource_type="table",
+        params='{"metrics": ["sum__num"], "groupby": ["name"]}',
+    )
+    mocker.patch.object(slc, "get_query_context", return_value=None)
+    mocker.patch.object(SqlaTable, "select_star", "SELECT * FROM my_sqla_table")
+
+    data = sqla_table.data_for_slices([slc])
+
+    assert [metric["metric_name"] for metric in data["metrics"]] == ["sum__num"]
+    assert [column["column_name"] for column in data["columns"]] == ["name"]
+    assert data["verbose_map"] == {
+        "__timestamp": "Time",
+        "sum__num": "sum__num",
+        "name": "Name",
+    }
+    assert data["column_names"] == {"Name", "ds", "gender", "name", "num"}
+    assert sorted(data["column_types"]) == [0, 1, 2]
+    assert data["database"] == database.short_data
+    assert "description" not in data
+    assert data["order_by_choices"] == [
+        (json.dumps([column_name, ascending]), f"{column_name} [{direction}]")
+        for column_name in ["ds", "gender", "name", "num"]
+        for ascending, direction in [(True, "asc"), (False, "desc")]
+    ]
@@ -0,0 +1,172 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import types
+from sqlalchemy.orm.session import Session
+
+from superset.daos.metadata_catalog import MetadataCatalogDAO
+from superset.sql_parse import Table
+from superset.utils.core import DatasourceName
+
+
+@pytest.fixture
+def database(mocker: MockerFixture, session: Session) -> Any:
+    """
+    A database whose inspector methods are mocked.
+    """
+    from superset import db
+    from superset.models.core import Database
+    from superset.models.metadata_catalog import MetadataCatalogSchema
+
+    MetadataCatalogSchema.metadata.create_all(session.get_bind())
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    db.session.add(database)
+    db.session.flush()
+
+    mocker.patch.object(database, "get_all_schema_names", return_value={"main"})
+    mocker.patch.object(
+        database,
+        "get_all_table_names_in_schema",
+        return_value={
+            DatasourceName("orders", "main"),
+            DatasourceName("customers", "main"),
+            DatasourceName("all_orders", "main"),
+        },
+    )
+    mocker.patch.object(
+        database,
+        "get_all_view_names_in_schema",
+        return_value={DatasourceName("orders_view", "main")},
+    )
+    mocker.patch.object(
+        database,
+        "get_columns",
+        return_value=[
+            {"column_name": "id", "name": "id", "type": types.INTEGER()},
+            {
+                "column_name": "ts",
+                "name": "ts",
+                "type": types.TIMESTAMP(),
+                "nullable": True,
+                "comment": "creation time",
+            },
+        ],
+    )
+    mocker.patch.object(
+        database,
+        "get_pk_constraint",
+        return_value={"constrained_columns": ["id"], "name": "pk"},
+    )
+    mocker.patch.object(database, "get_foreign_keys", return_value=[])
+    mocker.patch.object(database, "get_indexes", return_value=[])
+    mocker.patch.object(database, "get_table_comment", return_value="All orders")
+
+    return database
+
+
+def test_get_schema_names(database: Any) -> None:
+    """
+    Test that schemas are listed once, unless forced.
+    """
+    assert MetadataCatalogDAO.get_schema_names(database, None) == {"main"}
+    assert MetadataCatalogDAO.get_schema_names(database, None) == {"main"}
+    assert database.get_all_schema_names.call_count == 1
+
+    database.get_all_schema_names.return_value = {"dev"}
+    assert MetadataCatalogDAO.get_schema_names(database, None, force=True) == {"dev"}
+    assert MetadataCatalogDAO.get_schema_names(database, None) == {"dev"}
+
+
+def test_get_tables(database: Any) -> None:
+    """
+    Test that tables are listed once, unless forced, and searched in the catalog.
+    """
+    tables = MetadataCatalogDAO.get_tables(database, None, "main")
+    assert [(table.name, table.type) for table in tables] == [
+        ("all_orders", "table"),
+        ("customers", "table"),
+        ("orders", "table"),
+        ("orders_view", "view"),
+    ]
+
+    tables = MetadataCatalogDAO.get_tables(database, None, "main", search="ORDERS")
+    assert [table.name for table in tables] == ["orders", "orders_view", "all_orders"]
+    assert database.get_all_table_names_in_schema.call_count == 1
+
+    database.get_all_table_names_in_schema.return_value = {
+        DatasourceName("customers", "main"),
+    }
+    tables = MetadataCatalogDAO.get_tables(database, None, "main", force=True)
+    assert [table.name for table in tables] == ["customers", "orders_view"]
+
+
+def test_get_table(database: Any) -> None:
+    """
+    Test that table details are inspected once, unless forced.
+    """
+    table = MetadataCatalogDAO.get_table(database, Table("orders", "main"))
+    assert table.comment == "All orders"
+    assert table.pk_constraint_dict == {"constrained_columns": ["id"], "name": "pk"}
+    assert MetadataCatalogDAO.get_columns(table) == [
+        {
+            "name": "id",
+            "column_name": "id",
+            "type": "INTEGER",
+            "nullable": None,
+            "comment": None,
+        },
+        {
+            "name": "ts",
+            "column_name": "ts",
+            "type": "TIMESTAMP",
+            "nullable": True,
+            "comment": "creation time",
+        },
+    ]
+
+    MetadataCatalogDAO.get_table(database, Table("orders", "main"))
+    assert database.get_columns.call_count == 1
+
+    MetadataCatalogDAO.get_table(database, Table("orders", "main"), force=True)
+    assert database.get_columns.call_count == 2
+
+
+def test_refresh_table_concurrent_insert(mocker: MockerFixture, database: Any) -> None:
+    """
+    Test that a refresh runs again when a concurrent one inserted the same schema.
+    """
+    from superset import db
+    from superset.models.metadata_catalog import MetadataCatalogSchema
+
+    MetadataCatalogDAO.get_schema_names(database, None)
+    schema = MetadataCatalogDAO.find_schema(database, None, "main")
+
+    # the schema is missing when first looked up, as if inserted by another refresh
+    mocker.patch.object(
+        MetadataCatalogDAO,
+        "find_schema",
+        side_effect=[None, schema],
+    )
+    table = MetadataCatalogDAO.refresh_table(database, Table("orders", "main"))
+
+    assert table.schema_id == schema.id
+    assert db.session.query(MetadataCatalogSchema).count() == 1
@@ -16,8 +16,11 @@
 # under the License.
 
 from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
 
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy.orm.session import Session
 
 
@@ -73,3 +76,40 @@ def test_remove_favorite(session: Session) -> None:
 
     DashboardDAO.remove_favorite(dashboard)
     assert len(DashboardDAO.favorited_ids([dashboard])) == 0
+
+
+def test_get_datasets_for_dashboard_cached(mocker: MockerFixture) -> None:
+    from superset.daos.dashboard import DashboardDAO
+
+    database = mocker.MagicMock(changed_on=datetime(2024, 1, 1))
+    dataset = mocker.MagicMock(changed_on=datetime(2024, 1, 2), database=database)
+    dashboard = mocker.MagicMock(
+        id=100,
+        changed_on=datetime(2024, 1, 1),
+        slices=[mocker.MagicMock(changed_on=datetime(2024, 1, 1))],
+        datasources={dataset},
+    )
+    dashboard.datasets_trimmed_for_slices.return_value = [{"id": 1}]
+    mocker.patch.object(DashboardDAO, "get_by_id_or_slug", return_value=dashboard)
+    cache: dict[str, Any] = {}
+    cache_manager = mocker.patch("superset.daos.dashboard.cache_manager")
+    cache_manager.cache.get.side_effect = cache.get
+    cache_manager.cache.set.side_effect = lambda key, value, timeout: cache.__setitem__(
+        key, value
+    )
+
+    assert DashboardDAO.get_datasets_for_dashboard("100") == [{"id": 1}]
+    assert DashboardDAO.get_datasets_for_dashboard("100") == [{"id": 1}]
+    dashboard.datasets_trimmed_for_slices.assert_called_once()
+    assert list(cache) == ["dashboard:100:datasets:2024-01-02T00:00:00"]
+
+    # a change to one of the datasets results in a new payload
+    dataset.changed_on = datetime(2024, 1, 3)
+    dashboard.datasets_trimmed_for_slices.return_value = [{"id": 2}]
+    assert DashboardDAO.get_datasets_for_dashboard("100") == [{"id": 2}]
+
+    # as does a change to a database, within the same second
+    database.changed_on = datetime(2024, 1, 3, 0, 0, 0, 500)
+    dashboard.datasets_trimmed_for_slices.return_value = [{"id": 3}]
+    assert DashboardDAO.get_datasets_for_dashboard("100") == [{"id": 3}]
+    assert list(cache)[-1] == "dashboard:100:datasets:2024-01-03T00:00:00.000500"
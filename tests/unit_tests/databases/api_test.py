@@ -1762,18 +1762,21 @@ def test_table_metadata_happy_path(
     database.db_engine_spec.get_table_metadata.assert_called_with(
         database,
         Table("t"),
+        force=False,
     )
 
     response = client.get("/api/v1/database/1/table_metadata/?name=t&schema=s")
     database.db_engine_spec.get_table_metadata.assert_called_with(
         database,
         Table("t", "s"),
+        force=False,
     )
 
     response = client.get("/api/v1/database/1/table_metadata/?name=t&catalog=c")
     database.db_engine_spec.get_table_metadata.assert_called_with(
         database,
         Table("t", None, "c"),
+        force=False,
     )
 
     response = client.get(
@@ -1782,6 +1785,14 @@ def test_table_metadata_happy_path(
     database.db_engine_spec.get_table_metadata.assert_called_with(
         database,
         Table("t", "s", "c"),
+        force=False,
+    )
+
+    response = client.get("/api/v1/database/1/table_metadata/?name=t&force=true")
+    database.db_engine_spec.get_table_metadata.assert_called_with(
+        database,
+        Table("t"),
+        force=True,
     )
 
 
@@ -1835,6 +1846,7 @@ def test_table_metadata_slashes(
     database.db_engine_spec.get_table_metadata.assert_called_with(
         database,
         Table("foo/bar"),
+        force=False,
     )
 
 
@@ -16,12 +16,15 @@
 # under the License.
 # pylint: disable=unused-argument, import-outside-toplevel
 from datetime import datetime
+from decimal import Decimal
+from typing import Optional
 
 import pytest
 from pandas import Timestamp
 from pandas._libs.tslibs import NaT
+from pytest_mock import MockerFixture
 
-from superset.dataframe import df_to_records
+from superset.dataframe import df_to_json, df_to_records
 from superset.superset_typing import DbapiDescription
 
 
@@ -203,3 +206,89 @@ def test_max_pandas_timestamp(input_, expected) -> None:
     df = results.to_pandas_df()
 
     assert df_to_records(df) == expected
+
+
+def test_js_max_int_nullable() -> None:
+    from superset.db_engine_specs import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = [(1239162456494753670,), (None,), (-1239162456494753670,), (100,)]
+    cursor_descr: DbapiDescription = [("a", "int", None, None, None, None, False)]
+    results = SupersetResultSet(data, cursor_descr, BaseEngineSpec)
+    df = results.to_pandas_df()
+
+    assert df_to_records(df) == [
+        {"a": "1239162456494753670"},
+        {"a": None},
+        {"a": "-1239162456494753670"},
+        {"a": 100},
+    ]
+
+
+def test_js_max_int_nullable_extension_type() -> None:
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "a": pd.Series([pd.NA, 2**53 + 1, 100], dtype="Int64"),
+            "b": pd.Series([pd.NA, pd.NA, pd.NA], dtype="Int64"),
+        }
+    )
+
+    assert df_to_records(df) == [
+        {"a": None, "b": None},
+        {"a": "9007199254740993", "b": None},
+        {"a": 100, "b": None},
+    ]
+
+
+@pytest.mark.parametrize("inferred_type", [None, "mixed"])
+def test_js_max_int_mixed(
+    mocker: MockerFixture,
+    inferred_type: Optional[str],
+) -> None:
+    import pandas as pd
+
+    if inferred_type:
+        mocker.patch("pandas.api.types.infer_dtype", return_value=inferred_type)
+
+    df = pd.DataFrame(
+        {"a": pd.Series([Decimal("1.5"), 1239162456494753670, "a"], dtype=object)}
+    )
+
+    assert df_to_records(df) == [
+        {"a": Decimal("1.5")},
+        {"a": "1239162456494753670"},
+        {"a": "a"},
+    ]
+
+
+def test_df_to_json() -> None:
+    import pandas as pd
+
+    from superset.utils import json
+
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [1.5, float("nan"), None],
+            "c": ["x", None, "z"],
+            "d": [Timestamp("2023-01-06 20:50:31.749123"), NaT, Timestamp(0)],
+            "e": pd.to_datetime(
+                ["2023-01-06 00:00:00.000", None, "1969-12-31 23:59:59.999"]
+            ).tz_localize("US/Eastern"),
+        }
+    )
+
+    assert json.dumps({"data": df_to_json(df)}) == json.dumps(
+        {"data": df.to_dict(orient="records")},
+        default=json.json_int_dttm_ser,
+        ignore_nan=True,
+    )
+    assert json.loads(json.dumps(df_to_json(df)))[0] == {
+        "a": 1,
+        "b": 1.5,
+        "c": "x",
+        "d": 1673038231749.123,
+        "e": 1672963200000.0,
+    }
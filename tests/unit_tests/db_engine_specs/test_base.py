@@ -380,3 +380,29 @@ def test_unmask_encrypted_extra() -> None:
             },
         }
     )
+
+
+def test_collect_arrow_batches() -> None:
+    """
+    Test that Arrow batches are collected up to the limit, promoting their types.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    batches = iter(
+        [
+            pa.table({"a": pa.array([1, 2], pa.int8())}),
+            pa.RecordBatch.from_pydict({"a": pa.array([1000], pa.int16())}),
+            pa.RecordBatch.from_pydict({"a": pa.array([3], pa.int16())}),
+        ]
+    )
+    table = BaseEngineSpec.collect_arrow_batches(batches, limit=3)
+    assert table.column("a").to_pylist() == [1, 2, 1000]
+    assert table.schema.field("a").type == pa.int16()
+    # the last batch was not read
+    assert next(batches).num_rows == 1
+
+    schema = pa.schema([("a", pa.int64())])
+    assert BaseEngineSpec.collect_arrow_batches([], schema=schema).schema == schema
+    assert BaseEngineSpec.collect_arrow_batches([]) is None
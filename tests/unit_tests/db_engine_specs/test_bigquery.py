@@ -489,3 +489,25 @@ def test_adjust_engine_params_no_catalog() -> None:
         catalog="other-project",
     )[0]
     assert str(uri) == "bigquery://other-project/"
+
+
+def test_fetch_data_in_batches(mocker: MockerFixture) -> None:
+    """
+    Test that each batch of BigQuery `Row` is converted to values.
+    """
+    from superset.db_engine_specs.bigquery import BigQueryEngineSpec
+
+    class Row:
+        def __init__(self, *values: object) -> None:
+            self._values = values
+
+        def values(self) -> tuple[object, ...]:
+            return self._values
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER"), ("b", "STRING")]
+    cursor.fetchmany.side_effect = [[Row(1, "foo")], [Row(2, "bar")], []]
+    assert list(BigQueryEngineSpec.fetch_data_in_batches(cursor)) == [
+        [(1, "foo")],
+        [(2, "bar")],
+    ]
@@ -127,3 +127,34 @@ def test_get_parameters_from_uri() -> None:
 
     assert parameters["database"] == "md:my_db"
     assert parameters["access_token"] == "token"
+
+
+def test_fetch_arrow_data(mocker: MockerFixture) -> None:
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    batches = [
+        pa.RecordBatch.from_pydict({"a": [1, 2]}),
+        pa.RecordBatch.from_pydict({"a": [3]}),
+    ]
+    reader = mocker.MagicMock(schema=batches[0].schema)
+    reader.__iter__.side_effect = lambda: iter(batches)
+    cursor = mocker.MagicMock()
+    cursor.fetch_record_batch.return_value = reader
+
+    assert DuckDBEngineSpec.fetch_arrow_data(cursor).num_rows == 3
+    assert DuckDBEngineSpec.fetch_arrow_data(cursor, limit=2).num_rows == 2
+
+    # no more batches than needed are read
+    next_batch = iter(batches)
+    reader.__iter__.side_effect = lambda: next_batch
+    assert DuckDBEngineSpec.fetch_arrow_data(cursor, limit=1).num_rows == 1
+    assert next(next_batch) is batches[1]
+
+    # an empty result keeps its schema
+    reader.__iter__.side_effect = lambda: iter([])
+    assert DuckDBEngineSpec.fetch_arrow_data(cursor).schema == batches[0].schema
+
+    cursor.description = None
+    assert DuckDBEngineSpec.fetch_arrow_data(cursor) is None
@@ -163,6 +163,7 @@ def test_fetch_data_no_description() -> None:
     cursor = mock.MagicMock()
     cursor.description = []
     assert MssqlEngineSpec.fetch_data(cursor) == []
+    assert list(MssqlEngineSpec.fetch_data_in_batches(cursor)) == []
 
 
 def test_fetch_data() -> None:
@@ -182,6 +183,23 @@ def test_fetch_data() -> None:
             assert result == "converted"
 
 
+def test_fetch_data_in_batches() -> None:
+    """
+    Test that each batch of `pyodbc.Row` is converted to tuples.
+    """
+    from superset.db_engine_specs.mssql import MssqlEngineSpec
+
+    class Row(tuple):  # noqa: SLOT001
+        pass
+
+    cursor = mock.MagicMock()
+    cursor.description = [("a", "int"), ("b", "varchar")]
+    cursor.fetchmany.side_effect = [[Row((1, "foo"))], [Row((2, "bar"))], []]
+    batches = list(MssqlEngineSpec.fetch_data_in_batches(cursor))
+    assert batches == [[(1, "foo")], [(2, "bar")]]
+    assert all(type(row) is tuple for batch in batches for row in batch)
+
+
 @pytest.mark.parametrize(
     "original,expected",
     [
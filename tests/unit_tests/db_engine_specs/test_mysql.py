@@ -262,3 +262,31 @@ def test_column_type_mutator(
     mock_cursor.description = description
 
     assert spec.fetch_data(mock_cursor) == expected_result
+
+
+def test_fetch_data_in_batches() -> None:
+    """
+    Test that batches are fetched with ``fetchmany`` and mutated column by column.
+    """
+    from superset.db_engine_specs.mysql import MySQLEngineSpec as spec
+
+    mock_cursor = Mock()
+    mock_cursor.description = [("dec", "decimal(12,6)"), ("str", "varchar(3)")]
+    mock_cursor.fetchmany.side_effect = [
+        [("1.23456", "abc"), (None, "def")],
+        [("2.5", "ghi")],
+        [],
+    ]
+
+    assert list(spec.fetch_data_in_batches(mock_cursor)) == [
+        [(Decimal("1.23456"), "abc"), (None, "def")],
+        [(Decimal("2.5"), "ghi")],
+    ]
+    mock_cursor.fetchmany.assert_called_with(spec.fetch_batch_size)
+
+    mock_cursor.fetchmany.reset_mock(side_effect=True)
+    mock_cursor.fetchmany.return_value = [("1", "abc")]
+    assert list(spec.fetch_data_in_batches(mock_cursor, limit=1)) == [
+        [(Decimal("1"), "abc")],
+    ]
+    mock_cursor.fetchmany.assert_called_once_with(1)
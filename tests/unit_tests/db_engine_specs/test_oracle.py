@@ -82,6 +82,8 @@ def test_fetch_data_no_description() -> None:
     cursor = mock.MagicMock()
     cursor.description = []
     assert OracleEngineSpec.fetch_data(cursor) == []
+    assert list(OracleEngineSpec.fetch_data_in_batches(cursor)) == []
+    cursor.fetchmany.assert_not_called()
 
 
 def test_fetch_data() -> None:
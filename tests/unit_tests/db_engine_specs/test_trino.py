@@ -465,6 +465,97 @@ def test_execute_with_cursor_app_context(app, mocker: MockerFixture):
             )
 
 
+def test_execute_with_cursor_progress(app, mocker: MockerFixture):
+    """Test that `execute_with_cursor` tracks the progress until the query completes"""
+    import time
+
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+
+    mocker.patch("superset.db_engine_specs.presto.db")
+    mock_cursor = mocker.MagicMock()
+    mock_cursor.query_id = "myQueryId"
+    mock_cursor.stats = {
+        "completedSplits": 1,
+        "totalSplits": 4,
+        "processedRows": 100,
+        "processedBytes": 1000,
+    }
+    mock_query = mocker.MagicMock(progress=0)
+
+    def _mock_execute(*args, **kwargs):
+        time.sleep(0.3)
+
+    with patch.object(TrinoEngineSpec, "execute", side_effect=_mock_execute):
+        with patch.dict(app.config, {"PRESTO_PROGRESS_UPDATE_INTERVAL": 0.1}):
+            TrinoEngineSpec.execute_with_cursor(
+                cursor=mock_cursor,
+                sql="SELECT 1 FROM foo",
+                query=mock_query,
+            )
+
+    assert mock_query.progress == 25
+    mock_query.set_extra_json_key.assert_any_call(
+        "progress_stats",
+        {
+            "completed_splits": 1,
+            "total_splits": 4,
+            "processed_rows": 100,
+            "processed_bytes": 1000,
+        },
+    )
+
+
+def test_execute_with_cursor_error(app, mocker: MockerFixture):
+    """Test that `execute_with_cursor` raises the error of the execution"""
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+
+    mock_cursor = mocker.MagicMock()
+    mock_cursor.query_id = None
+
+    with patch.object(
+        TrinoEngineSpec, "execute", side_effect=TrinoUserError({"message": "error"})
+    ):
+        with pytest.raises(TrinoUserError):
+            TrinoEngineSpec.execute_with_cursor(
+                cursor=mock_cursor,
+                sql="SELECT 1 FROM foo",
+                query=mocker.MagicMock(),
+            )
+
+
+def test_execute_with_cursor_cancel_queued(app, mocker: MockerFixture):
+    """Test that `execute_with_cursor` cancels a query stopped before it runs"""
+    import threading
+    from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    mocker.patch("superset.db_engine_specs.trino.get_executor", return_value=executor)
+    is_stopped = mocker.patch.object(TrinoEngineSpec, "_is_stopped", return_value=True)
+    mock_cursor = mocker.MagicMock()
+    mock_cursor.query_id = None
+
+    # the only thread of the pool is busy with another query
+    release = threading.Event()
+    executor.submit(release.wait)
+    try:
+        with patch.object(TrinoEngineSpec, "execute") as execute:
+            with patch.dict(app.config, {"PRESTO_POLL_INTERVAL": 0.01}):
+                with pytest.raises(CancelledError):
+                    TrinoEngineSpec.execute_with_cursor(
+                        cursor=mock_cursor,
+                        sql="SELECT 1 FROM foo",
+                        query=mocker.MagicMock(),
+                    )
+    finally:
+        release.set()
+        executor.shutdown()
+
+    is_stopped.assert_called()
+    execute.assert_not_called()
+
+
 def test_get_columns(mocker: MockerFixture):
     """Test that ROW columns are not expanded without expand_rows"""
     from superset.db_engine_specs.trino import TrinoEngineSpec
@@ -17,6 +17,7 @@
 
 # pylint: disable=invalid-name
 
+from datetime import timedelta
 from typing import Any
 from uuid import UUID
 
@@ -99,3 +100,37 @@ def test_key_value_distributed_lock_expired() -> None:
                 assert _get_lock(MAIN_KEY, session) is None
 
         assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_key_value_distributed_lock_released_on_error() -> None:
+    """
+    Test that the distributed lock is released when the body raises.
+    """
+    session = _get_other_session()
+
+    with freeze_time("2021-01-01"):
+        with pytest.raises(ValueError):
+            with KeyValueDistributedLock("ns", a=1, b=2):
+                assert _get_lock(MAIN_KEY, session) == LOCK_VALUE
+                raise ValueError("failed")
+
+        assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_key_value_distributed_lock_expiration() -> None:
+    """
+    Test that the expiration of the distributed lock can be configured.
+    """
+    session = _get_other_session()
+
+    with freeze_time("2021-01-01 00:00:00"):
+        with KeyValueDistributedLock(
+            "ns",
+            lock_expiration=timedelta(minutes=5),
+            a=1,
+            b=2,
+        ):
+            with freeze_time("2021-01-01 00:04:00"):
+                assert _get_lock(MAIN_KEY, session) == LOCK_VALUE
+            with freeze_time("2021-01-01 00:06:00"):
+                assert _get_lock(MAIN_KEY, session) is None
@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name
+import threading
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.engine import create_engine
+from sqlalchemy.engine.url import make_url
+
+from superset.extensions.engine_manager import EngineManager
+
+
+@pytest.fixture
+def engine_manager() -> EngineManager:
+    app = Mock()
+    app.config = {
+        "DB_ENGINE_POOL_ENABLED": True,
+        "DB_ENGINE_POOL_MAX_ENGINES": 2,
+        "DB_ENGINE_POOL_TTL": 60,
+        "DB_ENGINE_POOL_PARAMS": {"pool_size": 3, "pool_pre_ping": True},
+    }
+    manager = EngineManager(Mock())
+    manager.init_app(app)
+    return manager
+
+
+def test_get_key() -> None:
+    """
+    Test that the key depends on the resolved connection parameters.
+    """
+    url = make_url("trino://alice@host:8080/hive")
+    key = EngineManager.get_key(1, url, {"connect_args": {"user": "alice"}})
+
+    assert key == EngineManager.get_key(1, url, {"connect_args": {"user": "alice"}})
+    assert key.database_id == 1
+    assert "alice" not in key.fingerprint
+    assert key != EngineManager.get_key(1, url, {"connect_args": {"user": "bob"}})
+    assert key != EngineManager.get_key(
+        1,
+        url.set(password="token"),
+        {"connect_args": {"user": "alice"}},
+    )
+
+
+def test_get_key_stable() -> None:
+    """
+    Test that the key is stable for non-JSON parameters, and None if it can't be.
+    """
+    url = make_url("snowflake://alice@account/db")
+    params: dict[str, Any] = {"connect_args": {"private_key": b"\x00key", "x": {2, 1}}}
+
+    key = EngineManager.get_key(1, url, params)
+    assert key is not None
+    assert key == EngineManager.get_key(1, url, dict(params))
+    assert key != EngineManager.get_key(
+        1,
+        url,
+        {"connect_args": {"private_key": b"\x01key", "x": {1, 2}}},
+    )
+
+    # the representation of an arbitrary object changes with each instance
+    assert EngineManager.get_key(1, url, {"connect_args": {"x": object()}}) is None
+
+
+def test_get_pool_params(engine_manager: EngineManager) -> None:
+    """
+    Test that queue pool arguments are only used for dialects that support them.
+    """
+    assert engine_manager.get_pool_params(make_url("postgresql://host/db")) == {
+        "pool_size": 3,
+        "pool_pre_ping": True,
+    }
+    assert engine_manager.get_pool_params(make_url("sqlite:///test.db")) == {
+        "pool_pre_ping": True,
+    }
+
+
+def test_get_engine(engine_manager: EngineManager) -> None:
+    """
+    Test that engines are reused, evicted in LRU order and invalidated.
+    """
+    creator = Mock(side_effect=lambda: (create_engine("sqlite://"), None))
+    key1 = EngineManager.get_key(1, make_url("sqlite://"), {"a": 1})
+    key2 = EngineManager.get_key(1, make_url("sqlite://"), {"a": 2})
+    key3 = EngineManager.get_key(2, make_url("sqlite://"), {"a": 3})
+
+    engine1 = engine_manager.get_engine(key1, creator)
+    assert engine_manager.get_engine(key1, creator) is engine1
+    assert creator.call_count == 1
+
+    engine_manager.get_engine(key2, creator)
+    engine_manager.get_engine(key1, creator)
+    engine_manager.get_engine(key3, creator)
+    assert creator.call_count == 3
+
+    # key2 was the least recently used engine
+    engine_manager.get_engine(key2, creator)
+    assert creator.call_count == 4
+
+    engine_manager.invalidate(2)
+    engine_manager.get_engine(key3, creator)
+    assert creator.call_count == 5
+
+
+def test_get_engine_expired(
+    mocker: MockerFixture,
+    engine_manager: EngineManager,
+) -> None:
+    """
+    Test that engines are recreated after the TTL, stopping their SSH tunnel.
+    """
+    monotonic = mocker.patch("superset.extensions.engine_manager.time.monotonic")
+    monotonic.return_value = 0
+    tunnel = Mock()
+    creator = Mock(side_effect=lambda: (create_engine("sqlite://"), tunnel))
+    key = EngineManager.get_key(1, make_url("sqlite://"), {})
+
+    engine = engine_manager.get_engine(key, creator)
+    monotonic.return_value = 61
+    assert engine_manager.get_engine(key, creator) is not engine
+    tunnel.stop.assert_called_once()
+
+
+def test_get_engine_created_outside_lock(engine_manager: EngineManager) -> None:
+    """
+    Test that engines are created without holding the lock, keeping the first one.
+    """
+    key = EngineManager.get_key(1, make_url("sqlite://"), {})
+    engine = create_engine("sqlite://")
+    tunnel = Mock()
+
+    def slow_creator() -> Any:
+        # a concurrent request creates the same engine in the meantime, which would
+        # block if the lock was held while creating the engine
+        thread = threading.Thread(
+            target=engine_manager.get_engine,
+            args=(key, lambda: (engine, None)),
+        )
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        return create_engine("sqlite://"), tunnel
+
+    assert engine_manager.get_engine(key, slow_creator) is engine
+    tunnel.stop.assert_called_once()
@@ -164,3 +164,87 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_arrow_table() -> None:
+    """
+    Test that a result fetched natively as Arrow is used without a row pivot.
+    """
+    import pyarrow as pa
+
+    data = pa.table(
+        {
+            "id": [1, 2],
+            "tags": [["a"], ["b", "c"]],
+            "name": pa.array(["foo", "bar"]).dictionary_encode(),
+        }
+    )
+    description = [
+        ("id", "int", None, None, None, None, False),
+        ("tags", "array", None, None, None, None, False),
+        ("id", "string", None, None, None, None, False),
+    ]
+    result_set = SupersetResultSet(
+        data,
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert result_set.table.column_names == ["id", "tags", "id__1"]
+    assert result_set.to_pandas_df().values.tolist() == [
+        [1, '["a"]', "foo"],
+        [2, '["b", "c"]', "bar"],
+    ]
+
+
+def test_rows_with_mixed_types() -> None:
+    """
+    Test that columns which can't be converted to Arrow are stringified.
+    """
+    data = [(1, "foo"), (2, 3)]
+    description = [
+        ("id", "int", None, None, None, None, False),
+        ("value", "string", None, None, None, None, False),
+    ]
+    result_set = SupersetResultSet(
+        data,
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert result_set.to_pandas_df().values.tolist() == [[1, "foo"], [2, "3"]]
+
+
+def test_from_batches() -> None:
+    """
+    Test building a result set from batches of rows.
+    """
+    batches = [
+        [(1, None), (2, None)],
+        [(3.5, "foo")],
+    ]
+    description = [
+        ("num", "float", None, None, None, None, False),
+        ("value", "string", None, None, None, None, False),
+    ]
+    result_set = SupersetResultSet.from_batches(
+        batches,
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert result_set.table.column_names == ["num", "value"]
+    assert result_set.size == 3
+    assert result_set.to_pandas_df().values.tolist() == [
+        [1.0, None],
+        [2.0, None],
+        [3.5, "foo"],
+    ]
+
+    empty = SupersetResultSet.from_batches(
+        [],
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+    assert empty.size == 0
+    assert empty.columns == []
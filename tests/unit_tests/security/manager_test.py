@@ -1169,3 +1169,87 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_cached(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that RLS filters are resolved once per request for a set of roles and table.
+    """
+    from flask import g
+
+    from superset.security.manager import RLSFilter
+
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(
+        sm,
+        "get_user_roles",
+        return_value=[mocker.MagicMock(id=2), mocker.MagicMock(id=1)],
+    )
+    query_rls_filters = mocker.patch.object(
+        sm,
+        "_query_rls_filters",
+        return_value=[(2, "gender", "gender = 'boy'"), (1, None, "value > 1")],
+    )
+    table = mocker.MagicMock(id=42)
+
+    with override_user(mocker.MagicMock()):
+        g.pop("rls_filters", None)
+        assert sm.get_rls_sorted(table) == [
+            RLSFilter(1, None, "value > 1"),
+            RLSFilter(2, "gender", "gender = 'boy'"),
+        ]
+        assert sm.get_rls_filters(table) == [
+            RLSFilter(2, "gender", "gender = 'boy'"),
+            RLSFilter(1, None, "value > 1"),
+        ]
+        query_rls_filters.assert_called_once_with(table, [1, 2])
+
+        sm.bump_rls_filters_version()
+        sm.get_rls_filters(table)
+        assert query_rls_filters.call_count == 2
+
+
+def test_get_roles_permissions_cached(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that access checks use the cached permission matrix of the user's roles.
+    """
+    from flask import g
+
+    sm = SupersetSecurityManager(appbuilder)
+    permissions = {
+        1: frozenset({("can_read", "Chart"), ("datasource_access", "[db].[a]")}),
+        2: frozenset({("datasource_access", "[db].[b]")}),
+    }
+    query_roles_permissions = mocker.patch.object(
+        sm,
+        "_query_roles_permissions",
+        side_effect=lambda role_ids: {
+            role_id: permissions.get(role_id, frozenset()) for role_id in role_ids
+        },
+    )
+    user = mocker.MagicMock(
+        id=1,
+        is_anonymous=False,
+        roles=[mocker.MagicMock(id=2), mocker.MagicMock(id=1)],
+    )
+    for role in user.roles:
+        role.name = f"role_{role.id}"
+
+    with override_user(user):
+        g.pop("permission_matrices", None)
+        assert sm.can_access("can_read", "Chart")
+        assert not sm.can_access("can_write", "Chart")
+        assert sm.user_view_menu_names("datasource_access") == {
+            "[db].[a]",
+            "[db].[b]",
+        }
+        query_roles_permissions.assert_called_once_with([1, 2])
+
+        sm.bump_permissions_version()
+        assert sm.can_access("datasource_access", "[db].[b]")
+        assert query_roles_permissions.call_count == 2
+
+        assert sm.get_roles_permissions([3]) == frozenset()
@@ -18,12 +18,15 @@
 
 
 import pytest
+from pytest_mock import MockerFixture
 from sqlglot import Dialects
 
 from superset.exceptions import SupersetParseError
 from superset.sql.parse import (
     extract_tables_from_statement,
     KustoKQLStatement,
+    parse_cache,
+    ParseCache,
     split_kql,
     SQLGLOT_DIALECTS,
     SQLScript,
@@ -979,3 +982,58 @@ def test_custom_dialect(app: None) -> None:
     Test that custom dialects are loaded correctly.
     """
     assert SQLGLOT_DIALECTS.get("custom") == Dialects.MYSQL
+
+
+def test_parse_cache(mocker: MockerFixture) -> None:
+    """
+    Test the `ParseCache` LRU cache.
+    """
+    stats_logger = mocker.patch("superset.extensions.stats_logger_manager").instance
+    cache = ParseCache(max_size=2)
+    func = mocker.MagicMock(side_effect=lambda: object())
+
+    first = cache.get("a", func)
+    assert cache.get("a", func) is first
+    cache.get("b", func)
+    cache.get("c", func)
+    assert func.call_count == 3
+    assert cache.hits == 1
+    assert cache.misses == 3
+    assert cache.hit_rate == 0.25
+    stats_logger.incr.assert_any_call("sql_parse_cache.hit")
+    stats_logger.incr.assert_any_call("sql_parse_cache.miss")
+
+    # "a" was evicted
+    assert cache.get("a", func) is not first
+    assert func.call_count == 4
+
+    # exceptions are not cached
+    with pytest.raises(ValueError):
+        cache.get("d", mocker.MagicMock(side_effect=ValueError()))
+    assert cache.get("d", func)
+
+    cache.clear()
+    assert cache.hits == cache.misses == 0
+
+
+def test_split_script_is_cached(mocker: MockerFixture) -> None:
+    """
+    Test that the same script is only parsed once per engine.
+    """
+    parse_cache.clear()
+    parse = mocker.spy(SQLStatement, "_parse")
+
+    sql = "SELECT * FROM some_table; DELETE FROM other_table"
+    script = SQLScript(sql, "postgresql")
+    assert SQLScript(f" {sql}\n", "postgresql").statements == script.statements
+    assert parse.call_count == 1
+    assert SQLStatement("SELECT * FROM some_table", "postgresql").tables == {
+        Table("some_table")
+    }
+    assert parse.call_count == 2
+
+    SQLScript(sql, "mysql")
+    assert parse.call_count == 3
+
+    assert script.has_mutation()
+    assert SQLScript(sql, "postgresql").has_mutation()
@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, invalid-name, unused-argument, too-many-locals
+
+import pyarrow as pa
+import pytest
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.exceptions import SerializationError
+from superset.sqllab.chunked_results import (
+    get_chunk_key,
+    iter_chunks,
+    read_chunks,
+    write_chunks,
+)
+
+
+def test_write_read_chunks(mocker: MockerFixture) -> None:
+    """
+    Test that only the chunks holding the requested rows are read.
+    """
+    backend = SimpleCache()
+    table = pa.table({"a": list(range(25)), "b": [str(i) for i in range(25)]})
+
+    manifest = write_chunks(backend, "key", table, 10)
+    assert manifest == {"rows": [10, 10, 5]}
+
+    get_many = mocker.spy(backend, "get_many")
+    result = read_chunks(backend, "key", manifest, offset=8, limit=5)
+    assert result.column("a").to_pylist() == [8, 9, 10, 11, 12]
+    get_many.assert_called_once_with(get_chunk_key("key", 0), get_chunk_key("key", 1))
+
+    assert read_chunks(backend, "key", manifest).equals(table)
+    assert read_chunks(backend, "key", manifest, offset=20).num_rows == 5
+
+    result = read_chunks(backend, "key", manifest, offset=30, limit=10)
+    assert result.num_rows == 0
+    assert result.schema.equals(table.schema)
+
+    assert [chunk.num_rows for chunk in iter_chunks(backend, "key", manifest)] == [
+        10,
+        10,
+        5,
+    ]
+
+
+def test_write_chunks_empty() -> None:
+    """
+    Test that empty results are stored as a single empty chunk.
+    """
+    backend = SimpleCache()
+    table = pa.table({"a": pa.array([], type=pa.int64())})
+
+    manifest = write_chunks(backend, "key", table, 10)
+    assert manifest == {"rows": [0]}
+    assert read_chunks(backend, "key", manifest).equals(table)
+
+
+def test_read_chunks_expired() -> None:
+    """
+    Test that an error is raised when a chunk expired.
+    """
+    backend = SimpleCache()
+    manifest = write_chunks(backend, "key", pa.table({"a": list(range(25))}), 10)
+    backend.delete(get_chunk_key("key", 2))
+
+    assert read_chunks(backend, "key", manifest, limit=10).num_rows == 10
+    with pytest.raises(SerializationError):
+        read_chunks(backend, "key", manifest, offset=15)
+    with pytest.raises(SerializationError):
+        list(iter_chunks(backend, "key", manifest))
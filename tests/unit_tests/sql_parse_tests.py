@@ -1830,6 +1830,29 @@ def test_extract_table_references(mocker: MockerFixture) -> None:
     logger.warning.assert_not_called()
 
 
+def test_parsed_query_is_lazy(mocker: MockerFixture) -> None:
+    """
+    Test that `ParsedQuery` only parses the SQL when needed, and shares the facts.
+    """
+    parse = mocker.spy(sqlparse, "parse")
+    sql = "SELECT * FROM some_table LIMIT 10 -- 14cf16a7"
+
+    parsed = ParsedQuery(sql)
+    assert parse.call_count == 0
+    assert parsed.limit == 10
+    assert parse.call_count == 1
+
+    assert ParsedQuery(sql).limit == 10
+    assert parse.call_count == 1
+
+    # the tokens are not shared, since they are mutated when changing the limit
+    assert parsed.set_or_update_query_limit(5) == (
+        "SELECT * FROM some_table LIMIT 5 -- 14cf16a7"
+    )
+    assert ParsedQuery(sql).set_or_update_query_limit(100) == sql
+    assert ParsedQuery(sql).limit == 10
+
+
 def test_is_select() -> None:
     """
     Test `is_select`.
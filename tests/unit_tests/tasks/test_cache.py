@@ -0,0 +1,148 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from cachelib import SimpleCache
+from flask import Flask
+from pytest_mock import MockerFixture
+
+NOW = datetime(2024, 1, 1, 8, 30)
+
+
+def to_timestamp(dttm: datetime) -> float:
+    return dttm.replace(tzinfo=timezone.utc).timestamp()
+
+
+def test_predictive_strategy_warm_up_times(mocker: MockerFixture) -> None:
+    """
+    Test that charts are warmed up before their cache expires and their peaks.
+    """
+    from superset.tasks.cache import PredictiveStrategy
+
+    mocker.patch("superset.tasks.cache.get_chart_cache_timeout", return_value=3600)
+    cache = mocker.patch("superset.tasks.cache.cache_manager").data_cache
+    strategy = PredictiveStrategy(interval=3600, lead_time=300, peak_threshold=0.2)
+    chart = MagicMock(id=1)
+    # peak at 9:00, the rest is spread over the day
+    accesses = {9: 50, **{hour: 5 for hour in range(10, 20)}}
+
+    # never warmed up
+    cache.get.return_value = None
+    assert strategy.get_warm_up_times(chart, accesses, NOW) == [
+        NOW,
+        datetime(2024, 1, 1, 8, 55),
+    ]
+
+    # expired at 8:10
+    cache.get.return_value = to_timestamp(NOW - timedelta(minutes=80))
+    assert strategy.get_warm_up_times(chart, accesses, NOW) == [
+        NOW,
+        datetime(2024, 1, 1, 8, 55),
+    ]
+
+    # expires at 9:03, which is covered by the warm up before the peak
+    cache.get.return_value = to_timestamp(NOW - timedelta(minutes=27))
+    assert strategy.get_warm_up_times(chart, accesses, NOW) == [
+        datetime(2024, 1, 1, 8, 55),
+    ]
+
+    # expires at 9:20, after the peak
+    cache.get.return_value = to_timestamp(NOW - timedelta(minutes=10))
+    assert strategy.get_warm_up_times(chart, accesses, NOW) == [
+        datetime(2024, 1, 1, 8, 55),
+        datetime(2024, 1, 1, 9, 15),
+    ]
+
+
+def test_predictive_strategy_recent_warm_up(mocker: MockerFixture) -> None:
+    """
+    Test that a chart warmed up recently is not warmed up again right away.
+    """
+    from superset.tasks.cache import PredictiveStrategy, warm_up_chart
+
+    chart = MagicMock(id=1)
+    db = mocker.patch("superset.tasks.cache.db")
+    db.session.query.return_value.filter_by.return_value.one_or_none.return_value = (
+        chart
+    )
+    mocker.patch("superset.tasks.cache.app")
+    mocker.patch("superset.tasks.cache.security_manager")
+    mocker.patch("superset.tasks.cache.override_user")
+    mocker.patch("superset.tasks.cache.database_warm_up_slot")
+    mocker.patch("superset.commands.chart.warm_up_cache.ChartWarmUpCacheCommand")
+    mocker.patch("superset.tasks.cache.get_chart_cache_timeout", return_value=3600)
+    mocker.patch("superset.tasks.cache.cache_manager").data_cache = SimpleCache()
+    mocker.patch("superset.tasks.cache.time").time.return_value = to_timestamp(
+        NOW - timedelta(minutes=10)
+    )
+
+    warm_up_chart(1)
+
+    # the data expires at 9:20
+    strategy = PredictiveStrategy(interval=3600, lead_time=300, peak_threshold=0.2)
+    assert strategy.get_warm_up_times(chart, {}, NOW) == [datetime(2024, 1, 1, 9, 15)]
+
+
+def test_predictive_strategy_null_cache(mocker: MockerFixture) -> None:
+    """
+    Test that no charts are scheduled when the data cache is a `NullCache`.
+    """
+    from flask_caching.backends import NullCache
+
+    from superset.tasks.cache import PredictiveStrategy
+
+    cache_manager = mocker.patch("superset.tasks.cache.cache_manager")
+    cache_manager.data_cache.cache = NullCache()
+    get_access_patterns = mocker.patch.object(PredictiveStrategy, "get_access_patterns")
+
+    assert PredictiveStrategy().get_payloads() == []
+    get_access_patterns.assert_not_called()
+
+
+def test_predictive_strategy_caching_disabled(mocker: MockerFixture) -> None:
+    """
+    Test that charts are not warmed up when caching is disabled.
+    """
+    from superset.tasks.cache import PredictiveStrategy
+
+    mocker.patch("superset.tasks.cache.get_chart_cache_timeout", return_value=-1)
+    strategy = PredictiveStrategy()
+    assert strategy.get_warm_up_times(MagicMock(id=1), {9: 1}, NOW) == []
+
+
+def test_database_warm_up_slot(mocker: MockerFixture, app: Flask) -> None:
+    """
+    Test that the number of concurrent warm ups per database is limited.
+    """
+    from superset.tasks.cache import database_warm_up_slot
+
+    cache_manager = mocker.patch("superset.tasks.cache.cache_manager")
+    cache_manager.cache = SimpleCache()
+    database = MagicMock(id=1, cache_warmup_concurrency=2)
+
+    with database_warm_up_slot(database) as first:
+        with database_warm_up_slot(database) as second:
+            with database_warm_up_slot(database) as third:
+                assert (first, second, third) == (True, True, False)
+
+    # slots are released
+    with database_warm_up_slot(database) as acquired:
+        assert acquired
+
+    with database_warm_up_slot(None) as acquired:
+        assert acquired
@@ -0,0 +1,60 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+
+from superset.utils import json
+from superset.utils.arrow import df_to_arrow, METADATA_KEY, write_ipc_buffer
+
+
+def test_df_to_arrow():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, None],
+            "str": ["a", None, "c"],
+            "dttm": [datetime(2024, 1, 1), None, datetime(2024, 1, 3)],
+            "mixed": [1, "a", None],
+        }
+    )
+    df.columns = ["int", "str", "dttm", 1]
+
+    table = df_to_arrow(df)
+
+    assert table.column_names == ["int", "str", "dttm", "1"]
+    assert table.schema.types == [
+        pa.float64(),
+        pa.string(),
+        pa.timestamp("ns"),
+        pa.string(),
+    ]
+    assert table.column("1").to_pylist() == ["1", "a", None]
+
+
+def test_write_ipc_buffer():
+    table = pa.table({"a": [1, 2, 3]})
+
+    for compression in (None, "lz4", "zstd"):
+        buffer = write_ipc_buffer(table, {"rowcount": 3}, compression)
+        result = pa.ipc.open_stream(buffer).read_all()
+
+        assert result.equals(table)
+        assert json.loads(result.schema.metadata[METADATA_KEY]) == {"rowcount": 3}
+
+    result = pa.ipc.open_stream(write_ipc_buffer(table)).read_all()
+    assert result.schema.metadata is None
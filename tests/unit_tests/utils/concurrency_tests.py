@@ -0,0 +1,99 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+
+import pytest
+from flask import current_app, Flask, g, request
+
+from superset.utils.concurrency import map_with_flask_context
+
+
+def test_map_with_flask_context() -> None:
+    """
+    Test that functions run in worker threads with a copy of the app context.
+    """
+    g.user = "admin"
+    main_thread = threading.get_ident()
+
+    def func(value: int) -> tuple[int, str, bool]:
+        return (
+            value * 2,
+            g.user,
+            threading.get_ident() != main_thread and current_app.name == "superset",
+        )
+
+    assert map_with_flask_context(func, range(4), max_workers=2) == [
+        (0, "admin", True),
+        (2, "admin", True),
+        (4, "admin", True),
+        (6, "admin", True),
+    ]
+
+
+def test_map_with_flask_context_g_containers() -> None:
+    """
+    Test that threads get their own copy of the containers in `g`.
+    """
+    g.cache = {"key": "value"}
+
+    def func(value: int) -> list[str]:
+        g.cache[str(value)] = "value"
+        return sorted(g.cache)
+
+    assert map_with_flask_context(func, range(2), max_workers=2) == [
+        ["0", "key"],
+        ["1", "key"],
+    ]
+    assert g.cache == {"key": "value"}
+
+
+def test_map_with_flask_context_request(app: Flask) -> None:
+    """
+    Test that functions have access to the request.
+    """
+    with app.test_request_context("/?foo=bar"):
+        assert map_with_flask_context(
+            lambda _: request.args["foo"],
+            range(2),
+            max_workers=2,
+        ) == ["bar", "bar"]
+
+
+def test_map_with_flask_context_single_worker() -> None:
+    """
+    Test that functions run in the current thread with a single worker.
+    """
+    main_thread = threading.get_ident()
+    assert map_with_flask_context(
+        lambda _: threading.get_ident() == main_thread,
+        range(2),
+        max_workers=1,
+    ) == [True, True]
+
+
+def test_map_with_flask_context_error() -> None:
+    """
+    Test that exceptions are re-raised.
+    """
+
+    def func(value: int) -> int:
+        if value == 1:
+            raise ValueError("Invalid value")
+        return value
+
+    with pytest.raises(ValueError, match="Invalid value"):
+        map_with_flask_context(func, range(2), max_workers=2)
@@ -95,3 +95,53 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_escape_series():
+    series = pd.Series(
+        ["a", "=func()", "-10", "|value", None, 1, '""=b', " =a"],
+        index=[3, 3, 1, 0, 2, 5, 7, 6],
+        name="value",
+    )
+    result = csv.escape_series(series)
+    assert result.tolist() == [
+        "a",
+        "'=func()",
+        "-10",
+        r"'\|value",
+        None,
+        1,
+        '\'""=b',
+        "' =a",
+    ]
+    assert result.index.tolist() == series.index.tolist()
+    assert series.tolist()[1] == "=func()"
+
+
+def test_df_to_escaped_csv_chunks():
+    df = pd.DataFrame(
+        data={
+            "=col": ["a", "=b", "-1", "@c", "d"],
+            "num": [1, 2, 3, 4, 5],
+        },
+        index=[4, 2, 0, 1, 3],
+    )
+    expected = csv.df_to_escaped_csv(df, index=False)
+    assert expected == "'=col,num\na,1\n'=b,2\n-1,3\n'@c,4\nd,5\n"
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, chunk_size=2, index=False))
+    assert len(chunks) == 3
+    assert "".join(chunks) == expected
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df.iloc[:0], index=False))
+    assert "".join(chunks) == "'=col,num\n"
+
+
+def test_rows_to_text_format():
+    rows = [
+        (1, "a\tb", None),
+        (True, "back\\slash", "line\nbreak\r"),
+    ]
+    assert "".join(csv.rows_to_text_format(rows)) == (
+        "1\ta\\tb\t\\N\n1\tback\\\\slash\tline\\nbreak\\r\n"
+    )
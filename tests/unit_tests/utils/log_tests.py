@@ -14,9 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from typing import Any
 
+import pytest
+from pytest_mock import MockerFixture
 
-from superset.utils.log import get_logger_from_status
+from superset.utils.log import BufferedDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +38,73 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_buffered_db_event_logger(mocker: MockerFixture) -> None:
+    """
+    Test that the buffered logger inserts rows in batches from a background thread.
+    """
+    inserted: list[list[dict[str, Any]]] = []
+    mocker.patch.object(
+        BufferedDBEventLogger,
+        "_insert",
+        side_effect=lambda rows: inserted.append(rows),
+    )
+    stats_logger = mocker.patch("superset.utils.log.stats_logger_manager").instance
+
+    event_logger = BufferedDBEventLogger(batch_size=2, flush_interval=60)
+    event_logger.log(
+        1,
+        "action",
+        dashboard_id=2,
+        duration_ms=3,
+        slice_id=4,
+        referrer=None,
+        records=[{"a": 1}, {"b": 2}, {"c": 3}],
+    )
+    event_logger.shutdown()
+
+    assert [len(batch) for batch in inserted] == [2, 1]
+    assert [row["json"] for batch in inserted for row in batch] == [
+        '{"a": 1}',
+        '{"b": 2}',
+        '{"c": 3}',
+    ]
+    assert inserted[0][0]["action"] == "action"
+    assert inserted[0][0]["user_id"] == 1
+    assert inserted[0][0]["dttm"] == inserted[1][0]["dttm"]
+    stats_logger.gauge.assert_any_call("event_logger.queue_size", 0)
+    assert any(
+        call.args[0] == "event_logger.flush"
+        for call in stats_logger.timing.call_args_list
+    )
+
+    # the flusher is restarted once stopped
+    event_logger.log(1, "action", None, None, None, None, records=[{}])
+    event_logger.shutdown()
+    assert len(inserted) == 3
+
+
+def test_buffered_db_event_logger_overflow(mocker: MockerFixture) -> None:
+    """
+    Test that rows are dropped when the queue of the buffered logger is full.
+    """
+    mocker.patch.object(BufferedDBEventLogger, "_start_flusher")
+    stats_logger = mocker.patch("superset.utils.log.stats_logger_manager").instance
+
+    event_logger = BufferedDBEventLogger(max_queue_size=2)
+    event_logger.log(1, "action", None, None, None, None, records=[{}, {}, {}])
+    assert event_logger._queue.qsize() == 2
+    stats_logger.incr.assert_called_once_with("event_logger.dropped")
+
+    event_logger = BufferedDBEventLogger(
+        max_queue_size=1,
+        overflow="block",
+        block_timeout=0.01,
+    )
+    event_logger.log(1, "action", None, None, None, None, records=[{}, {}])
+    assert event_logger._queue.qsize() == 1
+    assert stats_logger.incr.call_count == 2
+
+    with pytest.raises(ValueError):
+        BufferedDBEventLogger(overflow="invalid")  # type: ignore